@@ -1,16 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import List, Type
+from typing import List, Optional, Type
+
+import numpy as np
 
 from game_parent import Game
 from team import Team
 
 
 class Competition(ABC):
-    def __init__(self, teams: List[Team], name: str, game: Type[Game]):
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[Game],
+        rng: Optional[np.random.Generator] = None,
+    ):
         assert len(teams) > 0, "Must be some teams!"
         self.teams = teams
         self.game = game
         self.name = name
+        # Draws the matchups and seeds each game's own generator
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     @property
     @abstractmethod
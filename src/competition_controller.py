@@ -1,18 +1,26 @@
 import json
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from time import sleep
-from typing import Dict, List, Optional, Type
+from typing import Dict, Iterator, List, Optional, Tuple, Type
 
+import numpy as np
 import pygame
 
+from competition import Competition
 from events import Event
 from game_parent import Game, HeadToHeadGame, MultiPlayerGame, PointsGame
 from knockout_competition import KnockoutCompetition, remove_robots
+from match_log import MatchLogWriter, match_log_path
 from multiplayer_competition import MultiplayerCompetition
 from observation import Observable
 from points_competition import PointsCompetition
-from team import Team
+from ratings import Ratings
+from team import Result, Team
+from timings import Timings, summarise, write_timing_report
 
 
 class CompetitionController(Observable):
@@ -27,6 +35,11 @@ class CompetitionController(Observable):
         run_in_series: bool = True,
         speed_increase_factor: float = 1,
         wait_for_click_end_of_round: bool = True,
+        n_processes: int = 1,
+        seed: Optional[int] = None,
+        match_log_dir: Optional[Path] = None,
+        competition_type: Optional[Type[Competition]] = None,
+        ratings: Optional[Ratings] = None,
     ):
         """Drives the competition. Sets up new rounds and runs each game by calling game.step().
 
@@ -44,6 +57,19 @@ class CompetitionController(Observable):
                            (rather than simultaneously)?
             speed_increase_factor: Speed of the game will increase by this factor
                                    after each step
+            n_processes: If > 1, each round's games are played to completion in a pool
+                         of this many worker processes. Games are only redrawn once
+                         they've finished, so this is for big events rather than
+                         the live show.
+            seed: Seeds the draw and every game so a tournament can be replayed exactly
+                  (as long as the teams' code is deterministic). Random if None.
+            match_log_dir: If given, every move of every head-to-head match is logged
+                           to a file in here (see match_log.py)
+            competition_type: Format of the competition, e.g. RoundRobinCompetition or
+                              SwissCompetition for head-to-head games. Defaults to
+                              knockout, points or multiplayer depending on the game.
+            ratings: Updated after every head-to-head match and used to seed knockout
+                     draws. Saved alongside the rankings if ratings.path is set.
         """
 
         # remove when other game types are added
@@ -55,6 +81,15 @@ class CompetitionController(Observable):
         self.game = game
         self.plate_enabled = plate_enabled
         self.run_in_series = run_in_series
+        self.n_processes = n_processes
+        self.seed = seed
+        self.match_log_dir = match_log_dir
+        self.ratings = ratings
+        self.rng = np.random.default_rng(seed)
+        if seed is not None:
+            # Robots and game mechanics from outside this repo use the global random state
+            random.seed(seed)
+            np.random.seed(seed)
 
         # This is for the live competition - if all the moves happen instantaneously, then it's no fun!
         self.min_time_per_step = self.original_time_per_step = min_time_per_step
@@ -75,22 +110,60 @@ class CompetitionController(Observable):
                 )
             )
         )
+        if competition_type is not None:
+            comp_type = competition_type
         assert comp_type is not None
-        self.competitions = [comp_type(teams, f"Overall {game.NAME} Cup", game)]
+        seeding = {"ratings": ratings} if comp_type is KnockoutCompetition else {}
+        self.competitions = [
+            comp_type(teams, f"Overall {game.NAME} Cup", game, rng=self.rng, **seeding)
+        ]
         self.rounds_of_games = [self.get_new_round_of_games()]
+        self.attach_match_logs()
 
         self.plate_created = False
         self.wait_for_click_end_of_round = wait_for_click_end_of_round
 
+        # Wall time of every game step, redraw and round
+        self.timings = Timings()
+
     @property
     def round_num(self) -> int:
         return len(self.rounds_of_games)
 
     def run_round_of_games(self) -> None:
-        if self.run_in_series:
-            self.run_round_of_games_series()
-        else:
-            self.run_round_of_games_parallel()
+        with self.timings.time("round"):
+            if self.n_processes > 1:
+                self.run_round_of_games_in_processes()
+            elif self.run_in_series:
+                self.run_round_of_games_series()
+            else:
+                self.run_round_of_games_parallel()
+
+    def step_game(self, game: Game) -> None:
+        was_completed = game.completed
+        # Names can change when a game completes (e.g. "Team A & Team B" after a draw)
+        team_names = [team.name for team in game.teams]
+        with self.timings.time("step"):
+            game.step()
+        if game.completed and not was_completed:
+            self.update_ratings(game, team_names)
+
+    def update_ratings(self, game: Game, team_names: List[str]) -> None:
+        if self.ratings is None or not isinstance(game, HeadToHeadGame):
+            return
+        # Robots are only there to fill the draw
+        if game.ROBOT_PLAYER.name in team_names:
+            return
+        team_a_result = (
+            1
+            if game.team_a_score > game.team_b_score
+            else 0 if game.team_a_score < game.team_b_score else 0.5
+        )
+        self.ratings.update(team_names[0], team_names[1], team_a_result)
+
+    def redraw(self) -> None:
+        with self.timings.time("redraw"):
+            super().redraw()
 
     def run_round_of_games_parallel(self) -> None:
         move_num = 0
@@ -98,7 +171,7 @@ class CompetitionController(Observable):
             move_num += 1
             time_start = datetime.now()
             # .step() steps the game forward in time
-            [game.step() for game in self.current_round_of_games()]
+            [self.step_game(game) for game in self.current_round_of_games()]
 
             # Redraw the matches in progress
             if (
@@ -118,7 +191,7 @@ class CompetitionController(Observable):
                 move_num += 1
                 time_start = datetime.now()
                 # .step() steps the game forward in time
-                game.step()
+                self.step_game(game)
 
                 # Redraw the matches in progress
                 if (
@@ -136,6 +209,56 @@ class CompetitionController(Observable):
 
         self.redraw()
 
+    def run_round_of_games_in_processes(self) -> None:
+        """Fans the games in the current round out to a process pool.
+
+        Each worker gets its own copy of a game, plays it to completion and sends it back.
+        The finished state is then copied onto the game objects held by the competitions.
+        """
+        games = [game for game in self.current_round_of_games() if not game.completed]
+        if not games:
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.n_processes, len(games)), initializer=self.game.init_worker_process
+        ) as executor:
+            futures = {executor.submit(play_game_to_completion, game): game for game in games}
+            team_names = {game: [team.name for team in game.teams] for game in games}
+            for future in as_completed(futures):
+                game = futures[future]
+                played, step_times, team_updates = future.result()
+                merge_played_game(game, played, team_updates)
+                self.timings.add("step", step_times)
+                self.update_ratings(game, team_names[game])
+                self.redraw()
+
+    def run_headless(self) -> Dict[int, List[Team]]:
+        """Plays every competition (main cup, plate and 3rd/4th play-off) to completion.
+
+        Nothing is drawn, the controller never sleeps between steps and any click gates inside
+        the games are skipped, so this can be run on a server with no display.
+
+        Returns:
+            The final ranking of the teams (same as self.ranking)
+        """
+        self.min_time_per_step = self.original_time_per_step = 0
+        self.wait_for_click_end_of_round = False
+
+        with click_gates_disabled():
+            while not self.competitions_over:
+                with self.timings.time("round"):
+                    if self.n_processes > 1:
+                        self.run_round_of_games_in_processes()
+                    else:
+                        for game in self.current_round_of_games():
+                            while not game.completed:
+                                self.step_game(game)
+
+                if not self.competitions_over:
+                    self.new_round()
+
+        return self.ranking
+
     def wait_until_next_move(self, time_start: datetime) -> None:
         """Wait in case it doesn't take long enough."""
 
@@ -173,6 +296,23 @@ class CompetitionController(Observable):
         else:
             raise NotImplementedError("Unknown game type")
 
+    def attach_match_logs(self) -> None:
+        """Gives each new head-to-head match in the current round a match log."""
+        if self.match_log_dir is None:
+            return
+        for match_num, game in enumerate(self.current_round_of_games()):
+            if (
+                isinstance(game, HeadToHeadGame)
+                and game.match_log is None
+                and not game.completed
+            ):
+                game.match_log = MatchLogWriter(
+                    match_log_path(self.match_log_dir, game.name, self.round_num, match_num),
+                    game.name,
+                    game.team_a.name,
+                    game.team_b.name,
+                )
+
     def teams_not_in_competition(self, competition_games: List[Game]) -> List[Team]:
         return [
             team
@@ -190,6 +330,7 @@ class CompetitionController(Observable):
                 len(main_comp_losing_teams) >= 4
                 and self.plate_enabled
                 and not self.plate_created
+                and isinstance(self.competitions[0], KnockoutCompetition)
             ):
                 self.competitions += [
                     KnockoutCompetition(
@@ -197,11 +338,14 @@ class CompetitionController(Observable):
                         f"{self.game.NAME} Plate",
                         self.game,
                         is_third_playoff=False,
+                        rng=self.rng,
+                        ratings=self.ratings,
                     )
                 ]
                 self.plate_created = True
 
             self.rounds_of_games.append(self.get_new_round_of_games())
+            self.attach_match_logs()
             self.notify(Event.GAME_RESET)
 
     @property
@@ -252,9 +396,36 @@ class CompetitionController(Observable):
             json.dump(
                 {key: [team.name for team in val] for key, val in ranking.items()}, file
             )
+        self.write_timing_report(ranking_dir)
+        if self.ratings is not None and self.ratings.path is not None:
+            self.ratings.save()
 
         return ranking
 
+    def timing_report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Summary (count, total, mean, p50, p95, max in seconds) of how long things took.
+
+        'team' has each team's choose_move times, 'game' has all choose_move calls and steps
+        for this game type and 'controller' has steps, redraws and rounds.
+        """
+        return {
+            "team": {team.name: summarise(team.move_times) for team in self.teams},
+            "game": {
+                f"{self.game.NAME} choose_move": summarise(
+                    [move_time for team in self.teams for move_time in team.move_times]
+                ),
+                f"{self.game.NAME} step": summarise(self.timings.durations["step"]),
+            },
+            "controller": self.timings.summary(),
+        }
+
+    def write_timing_report(self, directory: Path = Path("./rankings")) -> None:
+        """Saves the timing report as json and csv, next to the rankings by default."""
+        write_timing_report(
+            self.timing_report(),
+            directory / f"{self.game.NAME}_timings".replace(" ", "_"),
+        )
+
     def get_competition_to_draw(self) -> Optional[KnockoutCompetition]:
         """Get the competition to draw the tournament tree of."""
         if not issubclass(self.game, HeadToHeadGame):
@@ -265,9 +436,78 @@ class CompetitionController(Observable):
         return None
 
 
+def play_game_to_completion(
+    game: Game,
+) -> Tuple[Game, List[float], List[Tuple[List[Result], List[float]]]]:
+    """Runs in a worker process. Forked workers may have pygame initialised, so never wait.
+
+    Returns the finished game, the wall time of each of its steps and, for each of
+    game.teams, the results and move times from this game only.
+    """
+    before = [(len(team.results), len(team.move_times)) for team in game.teams]
+    timings = Timings()
+    with click_gates_disabled():
+        while not game.completed:
+            with timings.time("step"):
+                game.step()
+    team_updates = [
+        (team.results[n_results:], team.move_times[n_move_times:])
+        for team, (n_results, n_move_times) in zip(game.teams, before)
+    ]
+    return game, timings.durations["step"], team_updates
+
+
+def merge_played_game(
+    game: Game, played: Game, team_updates: List[Tuple[List[Result], List[float]]]
+) -> None:
+    """Copies the state of a game played in another process onto the original game.
+
+    The teams are kept as the original objects (the competitions compare and rank them), but
+    pick up the game's results and move times (team_updates, from play_game_to_completion) and
+    any name changes (e.g. "Team A & Team B" after a draw). Teams are matched up by position,
+    as robots filling the draw are copies with the same team_id.
+    """
+    originals = {id(played_team): team for played_team, team in zip(played.teams, game.teams)}
+    # Both teams can share their lists (a robot playing a copy of itself), so each list only
+    # gets the game's additions once
+    merged = set()
+    for team, played_team, (results, move_times) in zip(game.teams, played.teams, team_updates):
+        if id(team.results) not in merged:
+            merged.add(id(team.results))
+            for result in results:
+                result.opponent = originals.get(id(result.opponent), result.opponent)
+            team.results += results
+        if id(team.move_times) not in merged:
+            merged.add(id(team.move_times))
+            team.move_times += move_times
+        team.name = played_team.name
+
+    team_attributes = {
+        key for key, value in vars(game).items() if isinstance(value, Team) or key == "_teams"
+    }
+    for key, value in vars(played).items():
+        if key not in team_attributes:
+            setattr(game, key, value)
+
+
+# Set to False while running headless so games never block on a click
+_CLICK_GATES_ENABLED = True
+
+
+@contextmanager
+def click_gates_disabled() -> Iterator[None]:
+    global _CLICK_GATES_ENABLED
+    previous = _CLICK_GATES_ENABLED
+    _CLICK_GATES_ENABLED = False
+    try:
+        yield
+    finally:
+        _CLICK_GATES_ENABLED = previous
+
+
 def wait_for_click() -> None:
-    # If pygame is not initialised, dont wait
-    if not pygame.get_init():
+    # If pygame is not initialised or we're running headless, dont wait
+    if not _CLICK_GATES_ENABLED or not pygame.get_init():
         return
     while True:
         for event in pygame.event.get():
@@ -0,0 +1,149 @@
+"""Many Connect 4 games played at once, for self-play and for evaluating bots.
+
+All the boards live in one (n_boards, rows, cols) array and every call to step() makes one
+move on every board. Boards use the same layout as Connect4Game (row 0 at the top, 1's are
+player 1's pieces) and restart as soon as their game finishes.
+
+Policies take a batch of boards from the mover's point of view (their pieces are 1's) and
+return a column for each. vectorise() turns a normal choose_move(board) function, like
+Connect4Game.ROBOT_PLAYER's, into a policy.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+Policy = Callable[[np.ndarray], np.ndarray]
+
+
+def four_in_a_row(mine: np.ndarray) -> np.ndarray:
+    """Whether each board in a (n, rows, cols) bool array has 4 True's in a row."""
+    lines = [
+        mine[:, :, :-3] & mine[:, :, 1:-2] & mine[:, :, 2:-1] & mine[:, :, 3:],
+        mine[:, :-3] & mine[:, 1:-2] & mine[:, 2:-1] & mine[:, 3:],
+        mine[:, :-3, :-3] & mine[:, 1:-2, 1:-2] & mine[:, 2:-1, 2:-1] & mine[:, 3:, 3:],
+        mine[:, 3:, :-3] & mine[:, 2:-1, 1:-2] & mine[:, 1:-2, 2:-1] & mine[:, :-3, 3:],
+    ]
+    return np.any([line.any(axis=(1, 2)) for line in lines], axis=0)
+
+
+class BatchConnect4:
+    def __init__(
+        self,
+        n_boards: int,
+        rows: int = 6,
+        cols: int = 8,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        """n_boards games of Connect 4, all stepped together.
+
+        Args:
+            rng: Picks who goes first in each game
+        """
+        self.n_boards = n_boards
+        self.rows = rows
+        self.cols = cols
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.boards = np.zeros((n_boards, rows, cols), dtype=np.int8)
+        # Number of pieces in each column of each board
+        self.heights = np.zeros((n_boards, cols), dtype=np.int8)
+        self.player_turn = np.ones(n_boards, dtype=np.int8)
+        self.reset(np.ones(n_boards, dtype=bool))
+
+    def reset(self, mask: np.ndarray) -> None:
+        """Empties the boards where mask is True and randomly picks who goes first."""
+        self.boards[mask] = 0
+        self.heights[mask] = 0
+        self.player_turn[mask] = self.rng.choice(np.array([-1, 1], dtype=np.int8), mask.sum())
+
+    @property
+    def views(self) -> np.ndarray:
+        """Every board from the point of view of the player to move (their pieces are 1's)."""
+        return self.boards * self.player_turn[:, None, None]
+
+    @property
+    def legal_moves(self) -> np.ndarray:
+        """(n_boards, cols) bool array, True where the column has space."""
+        return self.heights < self.rows
+
+    def step(self, moves: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Plays one move on every board, then restarts any that finished.
+
+        Args:
+            moves: Column to play on each board, for the player whose turn it is
+
+        Returns:
+            winners: 1 or -1 for a board that was just won, 0 otherwise
+            done: True for each board that was just won or drawn
+        """
+        moves = np.asarray(moves)
+        boards = np.arange(self.n_boards)
+        assert np.all(self.legal_moves[boards, moves]), "Illegal move"
+
+        rows = self.rows - 1 - self.heights[boards, moves]
+        self.boards[boards, rows, moves] = self.player_turn
+        self.heights[boards, moves] += 1
+
+        won = four_in_a_row(self.boards == self.player_turn[:, None, None])
+        done = won | np.all(self.heights == self.rows, axis=1)
+        winners = np.where(won, self.player_turn, 0)
+
+        self.player_turn *= -1
+        self.reset(done)
+        return winners, done
+
+
+def vectorise(choose_move: Callable[[np.ndarray], int]) -> Policy:
+    """Makes a policy from a function that chooses a move for one board at a time."""
+
+    def policy(boards: np.ndarray) -> np.ndarray:
+        return np.array([choose_move(board) for board in boards], dtype=int)
+
+    return policy
+
+
+def random_policy(boards: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Random legal move on every board (a column has space if its top square is empty).
+
+    Args:
+        rng: Defaults to the global np.random state. Use functools.partial to pass one to
+             evaluate()
+    """
+    rng = rng if rng is not None else np.random
+    scores = rng.random(boards[:, 0].shape) * (boards[:, 0] == 0)
+    return np.argmax(scores, axis=1)
+
+
+def evaluate(
+    policy_a: Policy,
+    policy_b: Policy,
+    n_games: int,
+    n_boards: int = 1024,
+    rows: int = 6,
+    cols: int = 8,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, int]:
+    """Plays policy_a against policy_b until at least n_games have finished.
+
+    Who goes first is random in every game.
+
+    Returns:
+        Number of wins, draws and losses for policy_a
+    """
+    env = BatchConnect4(min(n_boards, n_games), rows, cols, rng)
+    results = {"wins": 0, "draws": 0, "losses": 0}
+    while sum(results.values()) < n_games:
+        views = env.views
+        a_to_move = env.player_turn == 1
+        moves = np.empty(env.n_boards, dtype=int)
+        if a_to_move.any():
+            moves[a_to_move] = policy_a(views[a_to_move])
+        if not a_to_move.all():
+            moves[~a_to_move] = policy_b(views[~a_to_move])
+
+        winners, done = env.step(moves)
+        results["wins"] += int(np.sum(winners == 1))
+        results["losses"] += int(np.sum(winners == -1))
+        results["draws"] += int(np.sum(done & (winners == 0)))
+    return results
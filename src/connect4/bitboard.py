@@ -0,0 +1,148 @@
+"""Connect 4 position stored as one integer per player, with a bit for each square.
+
+Bits run up each column, then on to the next column. Every column has an extra empty bit on
+top, so shifting a line of pieces never wraps from the top of one column into the next:
+
+    6 13 20 ...
+    5 12 19
+    ...
+    0  7 14 ...
+
+A line of 4 in any direction is then found with 2 shifts and 2 ands, no matter the board size.
+
+The numpy board (row 0 at the top, pieces fall to the last row) that competitors' code
+expects is kept up to date alongside, so it never has to be rebuilt from the bits.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def count_pieces(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class BitBoard:
+    def __init__(self, rows: int = 6, cols: int = 8):
+        self.rows = rows
+        self.cols = cols
+        # Bits per column, including the empty one on top
+        self.height = rows + 1
+        # Shifts to the next square up, right, up-right and down-right
+        self.directions = (1, self.height, self.height + 1, self.height - 1)
+
+        self.pieces: Dict[int, int] = {1: 0, -1: 0}
+        self.column_heights = [0] * cols
+        self.n_pieces = 0
+        self.moves: List[int] = []
+
+        # The board from each player's point of view: their pieces are 1's
+        self._views = {1: np.zeros((rows, cols), dtype=int), -1: np.zeros((rows, cols), dtype=int)}
+        for view in self._views.values():
+            view.flags.writeable = False
+
+    @classmethod
+    def from_array(cls, board: np.ndarray) -> "BitBoard":
+        """Builds a bitboard from a numpy board. Pieces are placed bottom up, column by column,
+        so the move history doesn't match the real game."""
+        rows, cols = board.shape
+        bitboard = cls(rows, cols)
+        for col in range(cols):
+            for row in range(rows - 1, -1, -1):
+                if board[row, col] == 0:
+                    break
+                bitboard.place_piece(col, int(board[row, col]))
+        return bitboard
+
+    def copy(self) -> "BitBoard":
+        bitboard = BitBoard(self.rows, self.cols)
+        bitboard.pieces = dict(self.pieces)
+        bitboard.column_heights = list(self.column_heights)
+        bitboard.n_pieces = self.n_pieces
+        bitboard.moves = list(self.moves)
+        for player, view in self._views.items():
+            bitboard._views[player] = view.copy()
+            bitboard._views[player].flags.writeable = False
+        return bitboard
+
+    @property
+    def board(self) -> np.ndarray:
+        """Read-only numpy board: 1's are player 1's pieces, -1's are player -1's."""
+        return self._views[1]
+
+    def view(self, player: int) -> np.ndarray:
+        """Read-only numpy board from player's point of view (their pieces are 1's)."""
+        return self._views[player]
+
+    def is_column_full(self, col: int) -> bool:
+        return self.column_heights[col] == self.rows
+
+    @property
+    def legal_moves(self) -> List[int]:
+        return [col for col in range(self.cols) if self.column_heights[col] < self.rows]
+
+    @property
+    def is_full(self) -> bool:
+        return self.n_pieces == self.rows * self.cols
+
+    def count(self, player: int) -> int:
+        return count_pieces(self.pieces[player])
+
+    def place_piece(self, col: int, player: int) -> int:
+        """Drops player's piece into col.
+
+        Returns:
+            The row index of the new piece on the numpy board
+        """
+        assert not self.is_column_full(col), f"Column {col} is full"
+        height = self.column_heights[col]
+        self.pieces[player] |= 1 << (col * self.height + height)
+        self.column_heights[col] += 1
+        self.n_pieces += 1
+        self.moves.append(col)
+
+        row = self.rows - 1 - height
+        self._set_square(row, col, player)
+        return row
+
+    def undo(self) -> None:
+        """Takes back the last move."""
+        col = self.moves.pop()
+        self.column_heights[col] -= 1
+        self.n_pieces -= 1
+        bit = 1 << (col * self.height + self.column_heights[col])
+        for player in self.pieces:
+            self.pieces[player] &= ~bit
+        self._set_square(self.rows - 1 - self.column_heights[col], col, 0)
+
+    def has_won(self, player: int) -> bool:
+        """Whether player has 4 in a row anywhere on the board."""
+        pieces = self.pieces[player]
+        for shift in self.directions:
+            pairs = pieces & (pieces >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True
+        return False
+
+    def winner(self) -> Optional[int]:
+        """The player with 4 in a row, if there is one."""
+        for player in self.pieces:
+            if self.has_won(player):
+                return player
+        return None
+
+    def _set_square(self, row: int, col: int, player: int) -> None:
+        for view_player, view in self._views.items():
+            view.flags.writeable = True
+            view[row, col] = player * view_player
+            view.flags.writeable = False
+
+
+def choose_move_randomly(board: np.ndarray, rng: Optional[np.random.Generator] = None) -> int:
+    """Random legal move. A column has space if its top square (row 0) is empty.
+
+    Args:
+        rng: Defaults to the global np.random state
+    """
+    return int((rng if rng is not None else np.random).choice(np.flatnonzero(board[0] == 0)))
@@ -1,13 +1,10 @@
+from typing import Optional
+
 import numpy as np
 
 from competition_controller import wait_for_click
-from delta_connect4.game_mechanics import (
-    choose_move_randomly,
-    get_empty_board,
-    has_won,
-    is_column_full,
-    place_piece,
-)
+from connect4.bitboard import BitBoard, choose_move_randomly
+from delta_connect4.game_mechanics import get_empty_board, place_piece
 from game_parent import HeadToHeadGame
 from team import Outcome, Result, Team
 
@@ -23,11 +20,13 @@ class Connect4Game(HeadToHeadGame):
         name: str,
         rows: int = 6,
         cols: int = 8,
+        rng: Optional[np.random.Generator] = None,
     ) -> None:
         super().__init__(
             team_a,
             team_b,
             f"{name}: {team_a.name} vs {team_b.name}",
+            rng=rng,
         )
 
         # Board dimensions
@@ -36,7 +35,7 @@ class Connect4Game(HeadToHeadGame):
 
         self.num_games_played = 0
 
-        self.player_turn = np.random.choice([-1, 1])
+        self.player_turn = int(self.rng.choice([-1, 1]))
         self.went_first = self.player_turn
         self.reset_game()
         self.reset_me = False
@@ -44,9 +43,18 @@ class Connect4Game(HeadToHeadGame):
         self.team_a_counter_to_win = None
         self.team_b_counter_to_win = None
 
+    @property
+    def board(self) -> np.ndarray:
+        """Read-only numpy view of the bitboard."""
+        return self.state.board
+
+    @board.setter
+    def board(self, board: np.ndarray) -> None:
+        self.state = BitBoard.from_array(board)
+
     def reset_game(self) -> None:
         """Resets the game state (board and variables)"""
-        self.board = get_empty_board(self.rows, self.cols)
+        self.state = BitBoard(self.rows, self.cols)
         super().reset_game()
         # Alternate first turn .
         # (Gets flipped twice for the first game but oh well)
@@ -64,17 +72,19 @@ class Connect4Game(HeadToHeadGame):
             self.reset_game()
         # Get the right next player whose turn it is
         player = self.team_a if self.player_turn == 1 else self.team_b
-        column_index = player.choose_move(board=self.player_turn * self.board)
-        possible_moves = list(range(self.board.shape[1]))
-        possible_moves = [
-            move for move in possible_moves if not is_column_full(self.board, move)
-        ]
-        assert column_index in possible_moves
-        self.board, row_idx = place_piece(self.board, column_index, self.player_turn)
+        # The robot draws from the game's rng so seeded games are reproducible
+        robot_kwargs = {"rng": self.rng} if player == self.ROBOT_PLAYER else {}
+        # Copied as competitors' code may change the board it's given
+        column_index = player.choose_move(
+            board=self.state.view(self.player_turn).copy(), **robot_kwargs
+        )
+        assert column_index in self.state.legal_moves
+        row_idx = self.state.place_piece(column_index, self.player_turn)
+        self.log_move(column_index)
+        won = self.state.has_won(self.player_turn)
         self.player_turn *= -1
 
-        won = has_won(self.board, column_index)
-        drawn = np.all(self.board != 0) and not won
+        drawn = self.state.is_full and not won
         game_over = won or drawn
 
         self.most_recent_column = column_index  # For the visuals
@@ -89,10 +99,11 @@ class Connect4Game(HeadToHeadGame):
             if self.board[row_idx, column_index] == 1:
                 self.team_a_score += 1
                 # Store number of counters it took team_a to win to act as tie-breaker
-                self.team_a_counter_to_win = np.sum(self.board == 1)
+                self.team_a_counter_to_win = self.state.count(1)
             else:
                 self.team_b_score += 1
-                self.team_b_counter_to_win = np.sum(self.board == -1)
+                self.team_b_counter_to_win = self.state.count(-1)
+        self.log_board_end()
 
         if self.num_games_played < 2:
             self.reset_me = True
@@ -111,19 +122,32 @@ class Connect4Game(HeadToHeadGame):
             elif self.team_a_counter_to_win > self.team_b_counter_to_win:
                 self.team_b_score += 0.1
             else:
-                self.both_teams_progess()
+                self.both_teams_progress()
 
         self.complete()
 
-    def both_teams_progess(self) -> None:
+    def both_teams_progress(self) -> None:
+        # Leagues score a drawn match as a draw instead
+        if self.draws_allowed:
+            return
         self.team_a_score += 1
         self.team_a.name = f"{self.team_a.name} & {self.team_b.name}"
 
+    @classmethod
+    def replay_start(cls, first_player: int) -> np.ndarray:
+        return get_empty_board()
+
+    @classmethod
+    def replay_move(cls, board: np.ndarray, move: int, player: int) -> np.ndarray:
+        return place_piece(board.copy(), move, player)[0]
+
     def store_results(self) -> None:
         """This may not be 100% reliable, untested."""
+        # The match log has every move, so no need to keep a copy of the board too
+        final_board = None if self.match_log is not None else self.board
         self.team_a.results.append(
             Result(
-                final_board=self.board.copy(),
+                final_board=final_board if final_board is None else final_board.copy(),
                 outcome=Outcome(
                     1
                     if self.winner == self.team_a
@@ -135,7 +159,7 @@ class Connect4Game(HeadToHeadGame):
         )
         self.team_b.results.append(
             Result(
-                final_board=self.board.copy(),
+                final_board=final_board if final_board is None else final_board.copy(),
                 outcome=Outcome(
                     1
                     if self.winner == self.team_b
@@ -1,8 +1,11 @@
 import enum
 import random
 from abc import ABC
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from match_log import MatchLogWriter
 from team import Team
 
 
@@ -22,18 +25,42 @@ def no_robot_action_set():
     raise NotImplementedError("No robot action set - override ROBOT_PLAYER to do so!")
 
 
+def spawn_rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """A new generator seeded from rng, so each game gets its own reproducible stream.
+
+    If rng is None, the new generator is seeded from fresh entropy.
+    """
+    if rng is None:
+        return np.random.default_rng()
+    return np.random.default_rng(rng.integers(2**63))
+
+
+def random_choice(options: Sequence[Any], rng: Optional[np.random.Generator] = None) -> Any:
+    """A random item of options, drawn from rng or the global random state if it's None.
+
+    Unlike rng.choice, this keeps the items as they are rather than making an array of them.
+    """
+    return options[rng.integers(len(options))] if rng is not None else random.choice(options)
+
+
 class Game(ABC):
     NAME = None
     ROBOT_PLAYER = Team("Robot", no_robot_action_set)
 
-    def __init__(self, name: str, *args):
+    def __init__(self, name: str, *args, rng: Optional[np.random.Generator] = None):
         self.name = name
+        # All randomness in the game should come from here so a seed reproduces it
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.game_type = None
         self.play_state: PlayState = PlayState.YET_TO_START
 
     def __repr__(self):
         return self.name
 
+    @staticmethod
+    def init_worker_process() -> None:
+        """Runs once in each worker process that plays games (CompetitionController n_processes)."""
+
     def step(self) -> None:
         """Performs a step in the game."""
         raise NotImplementedError
@@ -72,17 +99,23 @@ class HeadToHeadGame(Game, ABC):
         team_a_color: Tuple[int, int, int] = YELLOW_COLOR,
         team_b_color: Tuple[int, int, int] = RED_COLOR,
         both_teams_progress_on_draw: bool = False,
+        rng: Optional[np.random.Generator] = None,
     ):
-        super().__init__(name)
+        super().__init__(name, rng=rng)
         self.team_a = team_a
         self.team_b = team_b
         self.team_a_score = 0
         self.team_b_score = 0
-        self.player_turn: int = random.choice([-1, 1])
+        self.player_turn: int = int(self.rng.choice([-1, 1]))
         self.went_first: int = self.player_turn
         self.team_a_color = team_a_color
         self.team_b_color = team_b_color
         self.both_teams_progress_on_draw = both_teams_progress_on_draw
+        # Set by league formats, which score a drawn match as a draw. The game then never breaks
+        # the tie or merges the teams into "Team A & Team B" to send both through.
+        self.draws_allowed = False
+        # Set by the controller to record every move of the match
+        self.match_log: Optional[MatchLogWriter] = None
 
     def reset_game(self) -> None:
         super(HeadToHeadGame, self).reset_game()
@@ -158,15 +191,45 @@ class HeadToHeadGame(Game, ABC):
     def next_to_play(self) -> Team:
         return self.team_a if self.player_turn == 1 else self.team_b
 
+    def log_move(self, move: Any, player: Optional[int] = None) -> None:
+        """Records a move in the match log. Call before the turn changes.
+
+        Args:
+            move: the move that was just played
+            player: who played it (1 for team_a, -1 for team_b). Defaults to player_turn
+        """
+        if self.match_log is None:
+            return
+        player = self.player_turn if player is None else player
+        team = self.team_a if player == 1 else self.team_b
+        self.match_log.write_move(player, move, team.move_times[-1] if team.move_times else 0)
+
+    def log_board_end(self) -> None:
+        """Records the scores in the match log when one board of the match finishes."""
+        if self.match_log is not None:
+            self.match_log.write_board_end(self.team_a_score, self.team_b_score)
+
+    @classmethod
+    def replay_start(cls, first_player: int) -> Any:
+        """The empty board a match log replay starts from."""
+        raise NotImplementedError(f"Replays aren't supported for {cls.NAME}")
+
+    @classmethod
+    def replay_move(cls, board: Any, move: Any, player: int) -> Any:
+        """Returns the board after player (1 is team_a, -1 is team_b) plays a logged move."""
+        raise NotImplementedError(f"Replays aren't supported for {cls.NAME}")
+
     def complete(self) -> None:
         super().complete()
-        if self.both_teams_progressing:
+        if self.both_teams_progressing and not self.draws_allowed:
             self.team_a.name = f"{self.team_a.name} & {self.team_b.name}"
+        if self.match_log is not None:
+            self.match_log.close()
 
 
 class PointsGame(Game, ABC):
-    def __init__(self, name: str, team: Team):
-        super().__init__(name)
+    def __init__(self, name: str, team: Team, rng: Optional[np.random.Generator] = None):
+        super().__init__(name, rng=rng)
         self._team = team
         self.score = 0
 
@@ -180,9 +243,10 @@ class MultiPlayerGame(Game, ABC):
         self,
         teams: List[Team],
         name: str,
+        rng: Optional[np.random.Generator] = None,
     ):
         """Parent class for a game when all players play on the same board at the same time."""
-        super().__init__(name)
+        super().__init__(name, rng=rng)
         self._teams = teams
         self.team_scores = [0] * len(self.teams)
 
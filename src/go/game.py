@@ -1,4 +1,6 @@
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from delta_go.game_mechanics import KOMI
 from delta_go.game_mechanics import score as game_scorer
@@ -15,8 +17,10 @@ class GoGame(HeadToHeadGame):
     ROBOT_PLAYER = Team("Robot", choose_move_randomly)
     WIN_THRESHOLD = 1
 
-    def __init__(self, team_a: Team, team_b: Team, name: str):
-        super().__init__(team_a, team_b, name)
+    def __init__(
+        self, team_a: Team, team_b: Team, name: str, rng: Optional[np.random.Generator] = None
+    ):
+        super().__init__(team_a, team_b, name, rng=rng)
         self.env = GoEnv(
             self.team_b.choose_move,
             verbose=False,
@@ -56,6 +60,7 @@ class GoGame(HeadToHeadGame):
         )
 
         self.env._step(move)
+        self.log_move(move, player=1 if team_a_turn else -1)
         self.most_recent_move = move
         done = self.env.done
         if done:
@@ -73,6 +78,7 @@ class GoGame(HeadToHeadGame):
                 self.team_a_score += 1
             else:
                 self.team_b_score += 1
+            self.log_board_end()
 
             if self.WIN_THRESHOLD in [self.team_a_score, self.team_b_score]:
                 self.play_state = PlayState.COMPLETED
@@ -6,7 +6,8 @@ from warnings import warn
 import numpy as np
 
 from competition import Competition
-from game_parent import Game, HeadToHeadGame
+from game_parent import Game, HeadToHeadGame, spawn_rng
+from ratings import Ratings
 from team import Team
 
 
@@ -17,24 +18,32 @@ class KnockoutCompetition(Competition):
         name: str,
         game: Type[HeadToHeadGame],
         is_third_playoff: bool = True,
+        rng: Optional[np.random.Generator] = None,
+        ratings: Optional[Ratings] = None,
     ):
         if all(team == game.ROBOT_PLAYER for team in teams):
             warn(f"All competitors in {game.NAME} game are robots!")
 
         # Randomly draw the matchups
-        np.random.shuffle(teams)
-        teams = self.add_robot_teams(teams, game)
+        rng = rng if rng is not None else np.random.default_rng()
+        rng.shuffle(teams)
+        if ratings is not None:
+            # Best teams get the byes and can't meet each other until late on
+            teams[:] = self.seed_teams(teams, game, ratings)
+        else:
+            teams = self.add_robot_teams(teams, game)
         self.original_draw_names = [team.name for team in teams]
         self.tournament_tree_visualised = False
         self.is_third_playoff = is_third_playoff
 
-        super(KnockoutCompetition, self).__init__(teams, name, game)
+        super(KnockoutCompetition, self).__init__(teams, name, game, rng)
 
         self.rounds = [
             KnockoutCompetitionRound(
                 teams,
                 get_competition_round_name(self.name, 1, len(self.teams)),
                 game,
+                self.rng,
             )
         ]
 
@@ -52,6 +61,19 @@ class KnockoutCompetition(Competition):
 
         return teams
 
+    @staticmethod
+    def seed_teams(
+        teams: List[Team], game: Type[HeadToHeadGame], ratings: Ratings
+    ) -> List[Team]:
+        """Orders teams by rating into a standard seeded bracket (1 v 8, 4 v 5, 2 v 7, 3 v 6).
+
+        Robots are added as the lowest seeds, so the highest rated teams get the byes.
+        """
+        seeds = sorted(teams, key=lambda team: ratings.rating(team.name), reverse=True)
+        round_size = 2 ** math.ceil(math.log2(len(teams)))
+        seeds += [copy(game.ROBOT_PLAYER) for _ in range(round_size - len(teams))]
+        return [seeds[seed] for seed in bracket_order(round_size)]
+
     @property
     def live_games(self) -> List[Game]:
         games = []
@@ -76,6 +98,7 @@ class KnockoutCompetition(Competition):
                             semi_losers,
                             f"3rd/4th Play-Off of {self.name}",
                             self.game,
+                            self.rng,
                         ),
                     )
                 self.rounds.append(
@@ -83,6 +106,7 @@ class KnockoutCompetition(Competition):
                         semi_winners,
                         get_competition_round_name(self.name, len(self.rounds) + 1, 2),
                         self.game,
+                        self.rng,
                     )
                 )
             else:
@@ -98,6 +122,7 @@ class KnockoutCompetition(Competition):
                             self.name, len(self.rounds) + 1, len(self.teams)
                         ),
                         self.game,
+                        self.rng,
                     )
                 )
         for comp_round in self.live_rounds:
@@ -184,10 +209,17 @@ class KnockoutCompetition(Competition):
 
 
 class KnockoutCompetitionRound:
-    def __init__(self, teams: List[Team], name: str, game: Type[HeadToHeadGame]):
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[HeadToHeadGame],
+        rng: Optional[np.random.Generator] = None,
+    ):
         self.teams = teams
         self.games = [
-            game(teams[i], teams[i + 1], name) for i in range(0, len(teams) - 1, 2)
+            game(teams[i], teams[i + 1], name, rng=spawn_rng(rng))
+            for i in range(0, len(teams) - 1, 2)
         ]
         self.name = name
         self.robot_v_robot = all(team == game.ROBOT_PLAYER for team in teams)
@@ -215,6 +247,14 @@ class KnockoutCompetitionRound:
         return [team.name for game in self.games for team in game.teams]
 
 
+def bracket_order(round_size: int) -> List[int]:
+    """Seed (0 is the best) in each slot of a bracket, e.g. [0, 3, 1, 2] for 4 teams."""
+    order = [0]
+    while len(order) < round_size:
+        order = [seed for prev in order for seed in (prev, 2 * len(order) - 1 - prev)]
+    return order
+
+
 def remove_robots(teams: List[Team], robot: Team) -> List[Team]:
     """Removes the robots from a team."""
     return [team for team in teams if team.name != robot.name]
@@ -0,0 +1,160 @@
+from abc import abstractmethod
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Type
+from uuid import UUID
+
+import numpy as np
+
+from competition import Competition
+from game_parent import HeadToHeadGame, spawn_rng
+from team import Team
+
+# Points for each result
+WIN_POINTS = 1.0
+DRAW_POINTS = 0.5
+BYE_POINTS = 1.0
+
+
+class LeagueCompetition(Competition):
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[HeadToHeadGame],
+        rng: Optional[np.random.Generator] = None,
+    ):
+        """Parent class for formats where every team plays every round and scores points.
+
+        Standings are updated as each round finishes rather than being recomputed from all
+        the games played so far. Subclasses decide the number of rounds and the pairings.
+        """
+        super().__init__(list(teams), name, game, rng)
+        # Nothing to draw for a league, the viewer only draws knockout trees
+        self.tournament_tree_visualised = True
+
+        self.points: Dict[UUID, float] = {team.team_id: 0.0 for team in self.teams}
+        self.opponents: Dict[UUID, List[UUID]] = defaultdict(list)
+        self.had_bye: Dict[UUID, bool] = {team.team_id: False for team in self.teams}
+
+        self.rounds = [self.new_round(1)]
+
+    @property
+    @abstractmethod
+    def n_rounds(self) -> int:
+        pass
+
+    @abstractmethod
+    def pair_round(self, round_num: int) -> Tuple[List[Tuple[Team, Team]], Optional[Team]]:
+        """Returns the matchups for a round and the team with a bye (if any)."""
+
+    def new_round(self, round_num: int) -> "LeagueRound":
+        pairings, bye = self.pair_round(round_num)
+        name = f"Round {round_num} of {self.name}"
+        games = [
+            self.game(team_a, team_b, name, rng=spawn_rng(self.rng)) for team_a, team_b in pairings
+        ]
+        for game in games:
+            # A draw scores DRAW_POINTS each, rather than renaming a team that plays on
+            game.draws_allowed = True
+        return LeagueRound(games, name, bye)
+
+    @property
+    def live_games(self) -> List[HeadToHeadGame]:
+        return [game for comp_round in self.rounds if comp_round.live for game in comp_round.games]
+
+    def complete_round(self) -> bool:
+        self.update_standings()
+        if not self.rounds[-1].live and len(self.rounds) < self.n_rounds:
+            self.rounds.append(self.new_round(len(self.rounds) + 1))
+        return True
+
+    def update_standings(self) -> None:
+        """Adds the results of any rounds that have finished since the last update."""
+        for comp_round in self.rounds:
+            if not comp_round.live or not comp_round.completed():
+                continue
+            for game in comp_round.games:
+                self.record_game(game)
+            if comp_round.bye is not None:
+                self.points[comp_round.bye.team_id] += BYE_POINTS
+                self.had_bye[comp_round.bye.team_id] = True
+            comp_round.live = False
+
+    def record_game(self, game: HeadToHeadGame) -> None:
+        a_id, b_id = game.team_a.team_id, game.team_b.team_id
+        if game.team_a_score > game.team_b_score:
+            self.points[a_id] += WIN_POINTS
+        elif game.team_a_score < game.team_b_score:
+            self.points[b_id] += WIN_POINTS
+        else:
+            self.points[a_id] += DRAW_POINTS
+            self.points[b_id] += DRAW_POINTS
+        self.opponents[a_id].append(b_id)
+        self.opponents[b_id].append(a_id)
+
+    def tiebreak(self, team: Team) -> float:
+        """Buchholz score: the total points of everyone the team has played."""
+        return sum(self.points[opponent] for opponent in self.opponents[team.team_id])
+
+    @property
+    def standings(self) -> List[Tuple[Team, float]]:
+        """Teams and their points so far, best first."""
+        self.update_standings()
+        ordered = sorted(
+            self.teams,
+            key=lambda team: (self.points[team.team_id], self.tiebreak(team)),
+            reverse=True,
+        )
+        return [(team, self.points[team.team_id]) for team in ordered]
+
+    @property
+    def finished(self) -> bool:
+        return len(self.rounds) == self.n_rounds and self.rounds[-1].completed()
+
+    @property
+    def winner(self) -> Optional[Team]:
+        if not self.finished:
+            return None
+        return self.standings[0][0]
+
+    @property
+    def ranking(self) -> Optional[Dict[int, List[Team]]]:
+        if not self.finished:
+            return None
+
+        ranking: Dict[int, List[Team]] = {}
+        prev = None
+        rank = 0
+        for count, team in enumerate(team for team, _ in self.standings):
+            key = (self.points[team.team_id], self.tiebreak(team))
+            if key != prev:
+                rank = count + 1
+            ranking.setdefault(rank, []).append(team)
+            prev = key
+        return ranking
+
+
+class LeagueRound:
+    def __init__(self, games: List[HeadToHeadGame], name: str, bye: Optional[Team] = None):
+        self.games = games
+        self.name = name
+        self.bye = bye
+        self.live = True
+
+    def __repr__(self) -> str:
+        return f"League Round: '{self.name}'"
+
+    def completed(self) -> bool:
+        return all(game.completed for game in self.games)
+
+    @property
+    def winners(self) -> List[Team]:
+        return [game.winner for game in self.games if game.winner is not None]
+
+    @property
+    def losers(self) -> List[Team]:
+        return [game.loser for game in self.games if game.loser is not None]
+
+    @property
+    def team_names(self) -> List[str]:
+        return [team.name for game in self.games for team in game.teams]
@@ -0,0 +1,226 @@
+"""Compact, append-only binary log of the moves in a head-to-head match.
+
+A log is a header (match and team names) followed by records:
+    MOVE: player (+1 team_a, -1 team_b), time taken to choose the move, the move
+    BOARD_END: team_a_score and team_b_score after a board (one game of the match) finishes
+
+Moves can be None, ints (or int enums) or tuples of ints, which covers every head-to-head
+game here. MatchReplay rebuilds any position by re-applying the moves, for games that define
+replay_start() and replay_move() (Connect 4 and Othello so far).
+"""
+import enum
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from game_parent import HeadToHeadGame
+
+MAGIC = b"DLML"
+VERSION = 1
+
+MOVE_RECORD = 0
+BOARD_END_RECORD = 1
+
+NONE_MOVE = 0
+INT_MOVE = 1
+TUPLE_MOVE = 2
+
+_MOVE = struct.Struct("<Bbf")  # record type, player, duration
+_BOARD_END = struct.Struct("<Bff")  # record type, team_a_score, team_b_score
+_INT = struct.Struct("<i")
+
+
+class MatchLogWriter:
+    def __init__(
+        self,
+        path: Path,
+        match_name: str,
+        team_a_name: str,
+        team_b_name: str,
+        buffer_size: int = 64 * 1024,
+    ):
+        """Streams a match's moves to path. Records are buffered and only ever appended.
+
+        Any existing file at path is overwritten, so a rerun never mixes its moves into an old
+        log. The file is closed when the writer is pickled (e.g. to play the game in another
+        process) and reopened in append mode on the next write.
+        """
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[IO[bytes]] = self.path.open("wb", buffering=buffer_size)
+        header = MAGIC + bytes([VERSION])
+        for name in [match_name, team_a_name, team_b_name]:
+            header += _encode_str(name)
+        self._write(header)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self.close()
+        return self.__dict__.copy()
+
+    def write_move(self, player: int, move: Any, duration: float) -> None:
+        self._write(_MOVE.pack(MOVE_RECORD, player, duration) + _encode_move(move))
+
+    def write_board_end(self, team_a_score: float, team_b_score: float) -> None:
+        self._write(_BOARD_END.pack(BOARD_END_RECORD, team_a_score, team_b_score))
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = self.path.open("ab", buffering=self.buffer_size)
+        self._file.write(data)
+
+
+@dataclass
+class LoggedMove:
+    player: int
+    move: Any
+    duration: float
+
+
+@dataclass
+class LoggedBoard:
+    moves: List[LoggedMove] = field(default_factory=list)
+    # None if the match log ends part way through the board
+    team_a_score: Optional[float] = None
+    team_b_score: Optional[float] = None
+
+    @property
+    def first_player(self) -> Optional[int]:
+        return self.moves[0].player if self.moves else None
+
+
+@dataclass
+class MatchLog:
+    match_name: str
+    team_a_name: str
+    team_b_name: str
+    boards: List[LoggedBoard]
+
+
+def read_match_log(path: Path) -> MatchLog:
+    data = Path(path).read_bytes()
+    assert data[: len(MAGIC)] == MAGIC, f"{path} is not a match log"
+    assert data[len(MAGIC)] == VERSION, f"Unknown match log version {data[len(MAGIC)]}"
+
+    offset = len(MAGIC) + 1
+    names = []
+    for _ in range(3):
+        name, offset = _decode_str(data, offset)
+        names.append(name)
+
+    boards = [LoggedBoard()]
+    while offset < len(data):
+        if data[offset] == MOVE_RECORD:
+            _, player, duration = _MOVE.unpack_from(data, offset)
+            move, offset = _decode_move(data, offset + _MOVE.size)
+            boards[-1].moves.append(LoggedMove(player, move, duration))
+        elif data[offset] == BOARD_END_RECORD:
+            _, boards[-1].team_a_score, boards[-1].team_b_score = _BOARD_END.unpack_from(
+                data, offset
+            )
+            offset += _BOARD_END.size
+            boards.append(LoggedBoard())
+        else:
+            raise ValueError(f"Corrupt match log {path} at byte {offset}")
+
+    # Drop the empty board started after the last BOARD_END
+    if not boards[-1].moves:
+        boards.pop()
+    return MatchLog(*names, boards)
+
+
+class MatchReplay:
+    def __init__(self, log: MatchLog, game: Type["HeadToHeadGame"]):
+        """Reconstructs positions from a match log using game.replay_start & game.replay_move.
+
+        Positions are cached per board, so scrubbing back and forth is cheap.
+        """
+        self.log = log
+        self.game = game
+        self._positions: Dict[int, List[Any]] = {}
+
+    @property
+    def n_boards(self) -> int:
+        return len(self.log.boards)
+
+    def n_moves(self, board_index: int) -> int:
+        return len(self.log.boards[board_index].moves)
+
+    def positions(self, board_index: int) -> List[Any]:
+        """The board before any moves, then after each move, of one board of the match."""
+        if board_index not in self._positions:
+            logged_board = self.log.boards[board_index]
+            assert logged_board.first_player is not None
+            board = self.game.replay_start(logged_board.first_player)
+            positions = [board]
+            for logged_move in logged_board.moves:
+                board = self.game.replay_move(board, logged_move.move, logged_move.player)
+                positions.append(board)
+            self._positions[board_index] = positions
+        return self._positions[board_index]
+
+    def board_at(self, board_index: int, move_number: int) -> Any:
+        """Position after move_number moves (0 is the starting position)."""
+        return self.positions(board_index)[move_number]
+
+    def show(self, game: "HeadToHeadGame", board_index: int, move_number: int) -> None:
+        """Puts a position onto a game object so the game's viewer can draw it."""
+        game.board = self.board_at(board_index, move_number)
+        moves = self.log.boards[board_index].moves
+        game.player_turn = (
+            -moves[move_number - 1].player if move_number > 0 else moves[0].player
+        )
+
+
+def match_log_path(directory: Path, match_name: str, round_num: int, match_num: int) -> Path:
+    """Where a match's log goes. Many games name every match in a round the same, so the
+    round and match numbers keep each match's log separate."""
+    name = re.sub(r"[^A-Za-z0-9]+", "_", match_name).strip("_")
+    return Path(directory) / f"{round_num:03d}_{match_num:03d}_{name}.dlml"
+
+
+def _encode_str(text: str) -> bytes:
+    encoded = text.encode()
+    return struct.pack("<H", len(encoded)) + encoded
+
+
+def _decode_str(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    return data[offset : offset + length].decode(), offset + length
+
+
+def _encode_move(move: Any) -> bytes:
+    if isinstance(move, enum.Enum):
+        move = move.value
+    if move is None:
+        return bytes([NONE_MOVE])
+    if isinstance(move, (tuple, list)):
+        return bytes([TUPLE_MOVE, len(move)]) + b"".join(_INT.pack(int(m)) for m in move)
+    return bytes([INT_MOVE]) + _INT.pack(int(move))
+
+
+def _decode_move(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == NONE_MOVE:
+        return None, offset
+    if tag == INT_MOVE:
+        return _INT.unpack_from(data, offset)[0], offset + _INT.size
+    length = data[offset]
+    offset += 1
+    move = struct.unpack_from(f"<{length}i", data, offset)
+    return tuple(move), offset + length * _INT.size
@@ -3,15 +3,21 @@ from typing import Dict, List, Optional, Type
 import numpy as np
 
 from competition import Competition
-from game_parent import Game, MultiPlayerGame, PointsGame
+from game_parent import Game, MultiPlayerGame, PointsGame, spawn_rng
 from team import Team
 
 
 class MultiplayerCompetition(Competition):
-    def __init__(self, teams: List[Team], name: str, game: Type[MultiPlayerGame]):
-        super(MultiplayerCompetition, self).__init__(teams, name, game)
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[MultiPlayerGame],
+        rng: Optional[np.random.Generator] = None,
+    ):
+        super(MultiplayerCompetition, self).__init__(teams, name, game, rng)
         assert issubclass(game, MultiPlayerGame)
-        self.game = game(teams, name)
+        self.game = game(teams, name, rng=spawn_rng(self.rng))
 
     @property
     def ranking(self) -> Dict[int, List]:
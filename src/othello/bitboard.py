@@ -0,0 +1,157 @@
+"""Othello position stored as one integer per player, with a bit for each square.
+
+Square (row, col) is bit row * size + col. Moving every piece one square in a direction is
+a single shift, with a mask so pieces on an edge don't wrap round to the other side. Legal
+moves and the discs a move flips are then found a whole line at a time rather than square
+by square.
+
+Disc counts and numpy views of the board (as competitors' code expects them) are updated
+with each move, so they never need a scan of the whole board.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# (row, col) steps to the 8 neighbouring squares
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def count_discs(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class BitBoard:
+    def __init__(self, size: int = 6):
+        self.size = size
+        self.full = (1 << size * size) - 1
+
+        first_col = sum(1 << row * size for row in range(size))
+        last_col = first_col << size - 1
+        # For each direction, the shift and the squares that can move that way
+        self.shifts = []
+        for d_row, d_col in DIRECTIONS:
+            can_move = self.full
+            if d_col == 1:
+                can_move &= ~last_col
+            elif d_col == -1:
+                can_move &= ~first_col
+            self.shifts.append((d_row * size + d_col, can_move))
+
+        self.pieces: Dict[int, int] = {1: 0, -1: 0}
+        self.counts: Dict[int, int] = {1: 0, -1: 0}
+
+        # The board from each player's point of view: their discs are 1's
+        self._views = {1: np.zeros((size, size)), -1: np.zeros((size, size))}
+        for view in self._views.values():
+            view.flags.writeable = False
+
+    @classmethod
+    def from_array(cls, board: np.ndarray) -> "BitBoard":
+        bitboard = cls(board.shape[0])
+        for row, col in zip(*np.nonzero(board)):
+            player = int(np.sign(board[row, col]))
+            bitboard.pieces[player] |= bitboard.bit(row, col)
+            bitboard.counts[player] += 1
+            bitboard._set_squares(bitboard.bit(row, col), player)
+        return bitboard
+
+    def copy(self) -> "BitBoard":
+        bitboard = BitBoard(self.size)
+        bitboard.pieces = dict(self.pieces)
+        bitboard.counts = dict(self.counts)
+        for player, view in self._views.items():
+            bitboard._views[player] = view.copy()
+            bitboard._views[player].flags.writeable = False
+        return bitboard
+
+    @property
+    def board(self) -> np.ndarray:
+        """Read-only numpy board: 1's are player 1's discs, -1's are player -1's."""
+        return self._views[1]
+
+    def view(self, player: int) -> np.ndarray:
+        """Read-only numpy board from player's point of view (their discs are 1's)."""
+        return self._views[player]
+
+    def bit(self, row: int, col: int) -> int:
+        return 1 << int(row) * self.size + int(col)
+
+    def squares(self, bits: int) -> List[Tuple[int, int]]:
+        """(row, col) of every set bit, in row order."""
+        squares = []
+        while bits:
+            lowest = bits & -bits
+            squares.append(divmod(lowest.bit_length() - 1, self.size))
+            bits ^= lowest
+        return squares
+
+    @property
+    def empty(self) -> int:
+        return self.full & ~(self.pieces[1] | self.pieces[-1])
+
+    @property
+    def is_full(self) -> bool:
+        return self.counts[1] + self.counts[-1] == self.size * self.size
+
+    def _shift(self, bits: int, direction: int) -> int:
+        shift, can_move = self.shifts[direction]
+        bits &= can_move
+        return (bits << shift if shift > 0 else bits >> -shift) & self.full
+
+    def legal_move_mask(self, player: int) -> int:
+        """Bit set for every square player can move to."""
+        own, opponent, empty = self.pieces[player], self.pieces[-player], self.empty
+        legal = 0
+        for direction in range(len(self.shifts)):
+            # Lines of opponent discs running out from one of player's discs
+            line = self._shift(own, direction) & opponent
+            for _ in range(self.size - 3):
+                line |= self._shift(line, direction) & opponent
+            legal |= self._shift(line, direction) & empty
+        return legal
+
+    def legal_moves(self, player: int) -> List[Tuple[int, int]]:
+        return self.squares(self.legal_move_mask(player))
+
+    def has_legal_move(self, player: int) -> bool:
+        return self.legal_move_mask(player) != 0
+
+    @property
+    def game_over(self) -> bool:
+        return self.is_full or not (self.has_legal_move(1) or self.has_legal_move(-1))
+
+    def flips(self, player: int, move: Tuple[int, int]) -> int:
+        """Bits of the opponent's discs that move would flip."""
+        own, opponent = self.pieces[player], self.pieces[-player]
+        flips = 0
+        for direction in range(len(self.shifts)):
+            line = 0
+            square = self._shift(self.bit(*move), direction)
+            while square & opponent:
+                line |= square
+                square = self._shift(square, direction)
+            if square & own:
+                flips |= line
+        return flips
+
+    def make_move(self, player: int, move: Optional[Tuple[int, int]]) -> None:
+        """Plays move (None to pass) for player, who must be able to move there."""
+        if move is None:
+            return
+        placed = self.bit(*move)
+        flips = self.flips(player, move)
+        assert placed & self.empty and flips, f"Illegal move {move}"
+
+        n_flips = count_discs(flips)
+        self.pieces[player] |= placed | flips
+        self.pieces[-player] &= ~flips
+        self.counts[player] += n_flips + 1
+        self.counts[-player] -= n_flips
+        self._set_squares(placed | flips, player)
+
+    def _set_squares(self, bits: int, player: int) -> None:
+        rows, cols = zip(*self.squares(bits))
+        for view_player, view in self._views.items():
+            view.flags.writeable = True
+            view[rows, cols] = player * view_player
+            view.flags.writeable = False
@@ -1,16 +1,11 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
 from competition_controller import wait_for_click
-from game_mechanics import (
-    choose_move_randomly,
-    get_empty_board,
-    get_legal_moves,
-    has_legal_move,
-    make_move,
-)
+from game_mechanics import choose_move_randomly, get_empty_board
 from game_parent import HeadToHeadGame
+from othello.bitboard import BitBoard
 from team import Outcome, Result, Team
 
 BLACK_COLOR = (6, 9, 16)
@@ -28,6 +23,7 @@ class OthelloGame(HeadToHeadGame):
         name: str,
         rows: int = 6,
         cols: int = 6,
+        rng: Optional[np.random.Generator] = None,
     ) -> None:
         super().__init__(
             team_a,
@@ -35,6 +31,7 @@ class OthelloGame(HeadToHeadGame):
             f"{name}: {team_a.name} vs {team_b.name}",
             WHITE_COLOR,
             BLACK_COLOR,
+            rng=rng,
         )
 
         # Board dimensions
@@ -43,7 +40,7 @@ class OthelloGame(HeadToHeadGame):
 
         self.n_consec_draws = 0
         self.n_completed_games = 0
-        self.player_turn = np.random.choice([-1, 1])
+        self.player_turn = int(self.rng.choice([-1, 1]))
         self.went_first = self.player_turn
         self.team_a_tile_count = 2
         self.team_b_tile_count = 2
@@ -54,6 +51,15 @@ class OthelloGame(HeadToHeadGame):
 
         self.reset_game()
 
+    @property
+    def board(self) -> np.ndarray:
+        """Read-only numpy view of the bitboard."""
+        return self.state.board
+
+    @board.setter
+    def board(self, board: np.ndarray) -> None:
+        self.state = BitBoard.from_array(board)
+
     def reset_game(self) -> None:
         """Resets the game state (board and variables)"""
 
@@ -86,17 +92,15 @@ class OthelloGame(HeadToHeadGame):
             return
         # Get the right next player whose turn it is
         player = self.team_a if self.player_turn == 1 else self.team_b
-        move = player.choose_move(state=self.player_turn * self.board)
-        if possible_moves := get_legal_moves(self.player_turn * self.board):
+        # Copied as competitors' code may change the board it's given
+        move = player.choose_move(state=self.state.view(self.player_turn).copy())
+        if possible_moves := self.state.legal_moves(self.player_turn):
             assert move in possible_moves
 
         else:
             assert move is None
-        # Suboptimal double board flip
-        if move is not None:
-            self.board = (
-                make_move(self.board * self.player_turn, move) * self.player_turn
-            )
+        self.log_move(move)
+        self.state.make_move(self.player_turn, move)
         self.player_turn *= -1
 
         self.team_a_tile_count = self.tile_count[1] + self.team_a_previous_count
@@ -120,6 +124,7 @@ class OthelloGame(HeadToHeadGame):
 
         self.team_a_previous_count += self.tile_count[1]
         self.team_b_previous_count += self.tile_count[-1]
+        self.log_board_end()
 
         self.store_results()
 
@@ -137,7 +142,7 @@ class OthelloGame(HeadToHeadGame):
                 self.team_a_score += 1
             elif self.team_a_tile_count < self.team_b_tile_count:
                 self.team_b_score += 1
-            else:
+            elif not self.draws_allowed:
                 # Stops infinite draws. If you get two draws both teams progress
                 # with team_a representing.
                 self.team_a_score += 1
@@ -146,21 +151,29 @@ class OthelloGame(HeadToHeadGame):
         self.complete()
 
     @property
-    def tile_count(self) -> Dict:
-        return {1: np.sum(self.board == 1), -1: np.sum(self.board == -1)}
+    def tile_count(self) -> Dict[int, int]:
+        return self.state.counts
 
     @property
     def game_over(self) -> bool:
-        return (
-            not has_legal_move(self.board, self.player_turn)
-            and not has_legal_move(self.board, self.player_turn * -1)
-            or np.sum(self.board != 0) == self.board.shape[0] ** 2
-        )
+        return self.state.game_over
+
+    @classmethod
+    def replay_start(cls, first_player: int) -> np.ndarray:
+        return get_empty_board(board_dim=6, player_start=first_player)
+
+    @classmethod
+    def replay_move(cls, board: np.ndarray, move: Optional[Tuple], player: int) -> np.ndarray:
+        state = BitBoard.from_array(board)
+        state.make_move(player, move)
+        return np.array(state.board)
 
     def store_results(self) -> None:
+        # The match log has every move, so no need to keep a copy of the board too
+        final_board = None if self.match_log is not None else self.board
         self.team_a.results.append(
             Result(
-                final_board=self.board.copy(),
+                final_board=final_board if final_board is None else final_board.copy(),
                 outcome=Outcome(
                     1
                     if self.round_winner == self.team_a
@@ -172,7 +185,7 @@ class OthelloGame(HeadToHeadGame):
         )
         self.team_b.results.append(
             Result(
-                final_board=self.board.copy(),
+                final_board=final_board if final_board is None else final_board.copy(),
                 outcome=Outcome(
                     1
                     if self.round_winner == self.team_b
@@ -1,8 +1,16 @@
 import enum
+import random
 from time import sleep
+from typing import List, Optional, Tuple
 
 import numpy as np
 
+# Boards games are played on are picked from this many, generated in advance
+BANK_SIZE = 256
+BANK_SEED = 0
+
+_board_bank: Optional[np.ndarray] = None
+
 
 def play_pathfinder(board, choose_move):
     assert isinstance(board, np.ndarray), "`board` has not been loaded as a numpy array."
@@ -57,75 +65,89 @@ def play_pathfinder(board, choose_move):
     score = (number_of_path_steps - np.count_nonzero(board == 1)) * 100 / count
 
     print("Game complete!\nYou scored:", score)
-    generate_new_board(10, 10)
+    np.savetxt("board.csv", generate_new_board(10, 10), delimiter=",")
 
 
 def count_adjacent_1s(board, position):
     """Go through the next possible moves on adjacent squares and count how many 1's there are."""
-    adjacent_positions = get_next_positions(position)
     count = 0
-    for p in adjacent_positions:
-        pos = adjacent_positions[p]
-        if 0 > pos[0] > len(board[0]) - 1:
-            continue
-
-        elif 0 > pos[1] > len(board) - 1:
-            continue
-
-        try:
-            if board[pos[0]][pos[1]] == 1:
-                count += 1
-        except:
-            pass
-
+    for pos in get_next_positions(position).values():
+        if 0 <= pos[0] < len(board) and 0 <= pos[1] < len(board[0]) and board[pos[0]][pos[1]] == 1:
+            count += 1
     return count
 
 
-def generate_new_board(num_rows: int = 10, num_cols: int = 10) -> np.ndarray:
+def generate_new_board(
+    num_rows: int = 10, num_cols: int = 10, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
     """Function to produce a new board with a random path through it.
 
-    Output takes the form of the starting location, the board of 0's and 1's forming a path, and the
-    final goal location.
+    The path starts in the first column (not the top row), ends in the last column and never
+    runs next to itself. When it reaches a dead end it backs up and tries another way, rather
+    than starting again.
     """
-
-    board = np.zeros((num_rows, num_cols))
-
-    start = int(np.random.choice(np.linspace(1, num_cols - 1, num_cols - 1)))
-    generator_position = [start, 0]
-
-    while generator_position[1] < num_rows:
-        board[start][0] = 1
-        next_positions = get_next_positions(generator_position)
-        possible_moves = []
-
-        for p in next_positions:
-            pos = next_positions[p]
-            if (
-                0 < pos[0] < num_cols
-                and 0 < pos[1] < num_rows
-                and board[pos[0]][pos[1]] != 1
-                and count_adjacent_1s(board, pos) <= 1
-            ):
-                possible_moves.append(pos)
-
-        if generator_position[1] == num_cols - 1:
-            board[generator_position[0]][generator_position[1]] = 1
-            np.savetxt("board.csv", board, delimiter=",")
-            return board
-
-        if possible_moves:
-            ind = np.random.choice(np.arange(len(possible_moves)))
-            move = possible_moves[ind]
-            print(move)
-            board[move[0]][move[1]] = 1
-            generator_position = move
-
-        else:
-            board = np.zeros((num_rows, num_cols))
-            generator_position = [start, 0]
-
-    np.savetxt("board.csv", board, delimiter=",")
-    return board
+    rng = rng if rng is not None else np.random.default_rng()
+    # Python's generator is much quicker at the many tiny shuffles
+    shuffler = random.Random(int(rng.integers(2**63)))
+
+    # Squares are numbered along the rows of the board with a border of 0's round it, so
+    # the 4 neighbours of any square are at fixed offsets with no bounds checks
+    width = num_cols + 2
+    offsets = [1, -1, width, -width]
+    path_squares = [0] * ((num_rows + 2) * width)
+    # Squares the path may use: not in the top row, first column or the border
+    allowed = [
+        0 < square // width - 1 < num_rows and 0 < square % width - 1 < num_cols
+        for square in range(len(path_squares))
+    ]
+
+    def can_move_to(square: int) -> bool:
+        return (
+            allowed[square]
+            and not path_squares[square]
+            # Only the square it came from is next to it
+            and sum(path_squares[square + offset] for offset in offsets) <= 1
+        )
+
+    def next_squares(square: int) -> List[int]:
+        squares = [square + offset for offset in offsets]
+        shuffler.shuffle(squares)
+        return squares
+
+    start = (int(rng.integers(1, num_rows)) + 1) * width + 1
+    path = [start]
+    path_squares[start] = 1
+    # Squares still to try from each square on the path
+    to_try = [next_squares(start)]
+    while path[-1] % width != num_cols:
+        if not to_try[-1]:
+            path_squares[path.pop()] = 0
+            to_try.pop()
+            continue
+        square = to_try[-1].pop()
+        if can_move_to(square):
+            path.append(square)
+            path_squares[square] = 1
+            to_try.append(next_squares(square))
+
+    board = np.array(path_squares, dtype=float).reshape(num_rows + 2, width)
+    return board[1:-1, 1:-1].copy()
+
+
+def board_bank() -> np.ndarray:
+    """BANK_SIZE read-only (10, 10) boards, generated once per process from BANK_SEED."""
+    global _board_bank
+    if _board_bank is None:
+        rng = np.random.default_rng(BANK_SEED)
+        _board_bank = np.stack([generate_new_board(10, 10, rng) for _ in range(BANK_SIZE)])
+        _board_bank.flags.writeable = False
+    return _board_bank
+
+
+def random_board(rng: np.random.Generator) -> np.ndarray:
+    """A copy of a board picked from the bank."""
+    bank = board_bank()
+    return bank[rng.integers(len(bank))].copy()
 
 
 def get_next_positions(position):
@@ -1,17 +1,19 @@
-import random
-from typing import Callable, Tuple
+from functools import partial
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
-from game_parent import PointsGame
-from pathfinder.competitor_code.game_mechanics import generate_new_board
+from game_parent import PointsGame, random_choice
+from pathfinder.competitor_code.game_mechanics import random_board
 from pathfinder.competitor_code.robot import choose_move
 from team import Team
 
 
 class PathfinderMechanics:
-    def __init__(self):
-        self.board = generate_new_board(10, 10)
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        # Picks each board from the bank, and the move made in place of an invalid one
+        self.board_rng = rng if rng is not None else np.random.default_rng()
+        self.board = random_board(self.board_rng)
         self.position = (np.where(self.board[:, 0] != 0)[0][0], 0)
         self.goal = (np.where(self.board[:, -1] != 0)[0][0], 9)
         self.orig_path_length = np.count_nonzero(self.board == 1)
@@ -20,7 +22,7 @@ class PathfinderMechanics:
         )
 
     def reset(self):
-        self.board = generate_new_board(10, 10)
+        self.board = random_board(self.board_rng)
         self.position = (np.where(self.board[:, 0] != 0)[0][0], 0)
         self.goal = (np.where(self.board[:, -1] != 0)[0][0], 9)
         self.orig_path_length = np.count_nonzero(self.board == 1)
@@ -47,7 +49,7 @@ class PathfinderMechanics:
                 for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]
                 if self.is_position_valid((self.position[0] + move[0], self.position[1] + move[1]))
             ]
-            move = random.choice(possible_moves)
+            move = random_choice(possible_moves, self.board_rng)
         # Make previous location 2
         self.board[self.position[0]][self.position[1]] = 2
         self.position = (self.position[0] + move[0], self.position[1] + move[1])
@@ -69,9 +71,10 @@ class PathfinderGame(PointsGame, PathfinderMechanics):
         self,
         name: str,
         team: Team,
+        rng: Optional[np.random.Generator] = None,
     ):
-        PointsGame.__init__(self, name, team)
-        PathfinderMechanics.__init__(self)
+        PointsGame.__init__(self, name, team, rng=rng)
+        PathfinderMechanics.__init__(self, self.rng)
         self.max_steps = 100
 
     def step(self) -> None:
@@ -80,7 +83,11 @@ class PathfinderGame(PointsGame, PathfinderMechanics):
 
         self.num_steps_taken += 1
 
-        self.update(self._team.choose_move)
+        choose_move = self._team.choose_move
+        if self._team == self.ROBOT_PLAYER:
+            # The robot draws from the game's rng so seeded games are reproducible
+            choose_move = partial(choose_move, rng=self.rng)
+        self.update(choose_move)
 
         if (
             self.steps_remaining == 0
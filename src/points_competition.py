@@ -3,14 +3,20 @@ from typing import Dict, List, Optional, Type
 import numpy as np
 
 from competition import Competition
-from game_parent import Game, PointsGame
+from game_parent import Game, PointsGame, spawn_rng
 from team import Team
 
 
 class PointsCompetition(Competition):
-    def __init__(self, teams: List[Team], name: str, game: Type[PointsGame]):
-        super(PointsCompetition, self).__init__(teams, name, game)
-        self.games = [game(name, team) for team in teams]
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[PointsGame],
+        rng: Optional[np.random.Generator] = None,
+    ):
+        super(PointsCompetition, self).__init__(teams, name, game, rng)
+        self.games = [game(name, team, rng=spawn_rng(self.rng)) for team in teams]
 
     @property
     def ranking(self) -> Dict[int, List]:
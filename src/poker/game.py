@@ -1,4 +1,6 @@
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from game_mechanics import PokerEnv, choose_move_randomly, wait_for_click
 from game_parent import HeadToHeadGame, PlayState
@@ -12,8 +14,10 @@ class PokerGame(HeadToHeadGame):
     NAME = "Poker"
     ROBOT_PLAYER = Team("Robot", choose_move_randomly)
 
-    def __init__(self, team_a: Team, team_b: Team, name: str):
-        super().__init__(team_a, team_b, name)
+    def __init__(
+        self, team_a: Team, team_b: Team, name: str, rng: Optional[np.random.Generator] = None
+    ):
+        super().__init__(team_a, team_b, name, rng=rng)
         self.env = PokerEnv(
             self.team_b.choose_move,
             verbose=False,
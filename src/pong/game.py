@@ -1,3 +1,7 @@
+from typing import Optional
+
+import numpy as np
+
 from delta_pong.game_mechanics import PongEnv, robot_choose_move
 from game_parent import HeadToHeadGame, PlayState
 from team import Team
@@ -13,12 +17,14 @@ class PongGame(HeadToHeadGame):
         team_a: Team,
         team_b: Team,
         name: str,
+        rng: Optional[np.random.Generator] = None,
     ):
         HeadToHeadGame.__init__(
             self,
             team_a,
             team_b,
             name,
+            rng=rng,
         )
         self.reset_game()
 
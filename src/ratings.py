@@ -0,0 +1,177 @@
+import json
+import math
+from abc import ABC, abstractmethod
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple, Type
+
+# Ratings are keyed by team name so they carry over between tournaments
+
+
+class Ratings(ABC):
+    SYSTEM = ""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Skill ratings, updated one match at a time.
+
+        Args:
+            path: Where to save the ratings (e.g. the file they were loaded from)
+        """
+        self.path = path
+
+    @abstractmethod
+    def update(self, team_a: str, team_b: str, team_a_result: float) -> None:
+        """Update both teams' ratings after a match.
+
+        Args:
+            team_a_result: 1 if team_a won, 0 if team_b won and 0.5 for a draw
+        """
+
+    @abstractmethod
+    def rating(self, team: str) -> float:
+        """Single number to rank or seed teams by, higher is better."""
+
+    @abstractmethod
+    def to_dict(self) -> Dict:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, ratings: Dict, path: Optional[Path] = None) -> "Ratings":
+        pass
+
+    def ranked(self, teams: List[str]) -> List[str]:
+        return sorted(teams, key=self.rating, reverse=True)
+
+    def save(self, path: Optional[Path] = None) -> None:
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as file:
+            json.dump({"system": self.SYSTEM, "ratings": self.to_dict()}, file)
+
+
+class EloRatings(Ratings):
+    SYSTEM = "elo"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        k_factor: float = 32,
+        initial_rating: float = 1500,
+    ):
+        super().__init__(path)
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.ratings: Dict[str, float] = {}
+
+    def rating(self, team: str) -> float:
+        return self.ratings.get(team, self.initial_rating)
+
+    def expected_result(self, team_a: str, team_b: str) -> float:
+        """Probability team_a beats team_b (counting a draw as half a win)."""
+        return 1 / (1 + 10 ** ((self.rating(team_b) - self.rating(team_a)) / 400))
+
+    def update(self, team_a: str, team_b: str, team_a_result: float) -> None:
+        change = self.k_factor * (team_a_result - self.expected_result(team_a, team_b))
+        self.ratings[team_a] = self.rating(team_a) + change
+        self.ratings[team_b] = self.rating(team_b) - change
+
+    def to_dict(self) -> Dict:
+        return self.ratings
+
+    @classmethod
+    def from_dict(cls, ratings: Dict, path: Optional[Path] = None) -> "EloRatings":
+        elo = cls(path)
+        elo.ratings = {team: float(rating) for team, rating in ratings.items()}
+        return elo
+
+
+class GaussianRatings(Ratings):
+    SYSTEM = "gaussian"
+    _normal = NormalDist()
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mu: float = 25,
+        sigma: float = 25 / 3,
+        beta: float = 25 / 6,
+        tau: float = 25 / 300,
+        draw_probability: float = 0.1,
+    ):
+        """Each team's skill is a Gaussian (mu, sigma), updated like TrueSkill for 1 v 1.
+
+        Args:
+            beta: Spread of performance in a single match
+            tau: Added to sigma before each match so ratings can keep moving
+            draw_probability: How often two equally skilled teams draw
+        """
+        super().__init__(path)
+        self.mu, self.sigma, self.beta, self.tau = mu, sigma, beta, tau
+        self.draw_margin = self._normal.inv_cdf((draw_probability + 1) / 2) * math.sqrt(2) * beta
+        self.ratings: Dict[str, Tuple[float, float]] = {}
+
+    def skill(self, team: str) -> Tuple[float, float]:
+        return self.ratings.get(team, (self.mu, self.sigma))
+
+    def rating(self, team: str) -> float:
+        """Conservative estimate of skill: 99.7% sure the team is at least this good."""
+        mu, sigma = self.skill(team)
+        return mu - 3 * sigma
+
+    def update(self, team_a: str, team_b: str, team_a_result: float) -> None:
+        if team_a_result < 0.5:
+            # Always update from the winner's point of view
+            team_a, team_b, team_a_result = team_b, team_a, 1 - team_a_result
+        (mu_a, sigma_a), (mu_b, sigma_b) = self.skill(team_a), self.skill(team_b)
+        var_a, var_b = sigma_a**2 + self.tau**2, sigma_b**2 + self.tau**2
+
+        c = math.sqrt(2 * self.beta**2 + var_a + var_b)
+        t, eps = (mu_a - mu_b) / c, self.draw_margin / c
+        v, w = (self._v_w_draw if team_a_result == 0.5 else self._v_w_win)(t, eps)
+
+        self.ratings[team_a] = (
+            mu_a + var_a / c * v,
+            math.sqrt(var_a * max(1 - var_a / c**2 * w, 1e-6)),
+        )
+        self.ratings[team_b] = (
+            mu_b - var_b / c * v,
+            math.sqrt(var_b * max(1 - var_b / c**2 * w, 1e-6)),
+        )
+
+    def _v_w_win(self, t: float, eps: float) -> Tuple[float, float]:
+        x = t - eps
+        v = self._normal.pdf(x) / max(self._normal.cdf(x), 1e-12)
+        return v, v * (v + x)
+
+    def _v_w_draw(self, t: float, eps: float) -> Tuple[float, float]:
+        pdf, cdf = self._normal.pdf, self._normal.cdf
+        denominator = max(cdf(eps - t) - cdf(-eps - t), 1e-12)
+        v = (pdf(-eps - t) - pdf(eps - t)) / denominator
+        w = v**2 + ((eps - t) * pdf(eps - t) + (eps + t) * pdf(eps + t)) / denominator
+        return v, w
+
+    def to_dict(self) -> Dict:
+        return {team: list(skill) for team, skill in self.ratings.items()}
+
+    @classmethod
+    def from_dict(cls, ratings: Dict, path: Optional[Path] = None) -> "GaussianRatings":
+        gaussian = cls(path)
+        gaussian.ratings = {team: (mu, sigma) for team, (mu, sigma) in ratings.items()}
+        return gaussian
+
+
+RATING_SYSTEMS: Dict[str, Type[Ratings]] = {
+    EloRatings.SYSTEM: EloRatings,
+    GaussianRatings.SYSTEM: GaussianRatings,
+}
+
+
+def load_ratings(path: Path, system: Type[Ratings] = EloRatings) -> Ratings:
+    """Loads saved ratings, or starts new ratings of type system if path doesn't exist."""
+    path = Path(path)
+    if not path.exists():
+        return system(path)
+    with path.open() as file:
+        stored = json.load(file)
+    return RATING_SYSTEMS[stored["system"]].from_dict(stored["ratings"], path)
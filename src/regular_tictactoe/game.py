@@ -1,28 +1,35 @@
-import random
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 import numpy as np
 
 
+import tictactoe_table
 from delta_tictactoe.game_mechanics import (
     get_empty_board,
-    is_board_full,
-    is_winner,
     place_counter,
     Cell,
     WildTictactoeEnv,
-    choose_move_randomly as robot_choose_move,
     convert_board_to_regular_ttt,
     flip_board,
 )
-from game_parent import HeadToHeadGame
+from game_parent import HeadToHeadGame, random_choice
 from team import Team
 
 TEAM_A_COLOR = (245, 66, 96)
 TEAM_B_COLOR = (16, 181, 227)
 
 
+def robot_choose_move(board: List, rng: Optional[np.random.Generator] = None) -> int:
+    """Random empty square."""
+    return random_choice(tictactoe_table.legal_moves(tictactoe_table.board_code(board)), rng)
+
+
+def choose_move_perfectly(board: List, rng: Optional[np.random.Generator] = None) -> int:
+    """Never loses. Takes the board teams are given, where the player to move's counters are 1."""
+    return random_choice(tictactoe_table.best_moves(tictactoe_table.board_code(board), 1), rng)
+
+
 @dataclass
 class Turn:
     row: int
@@ -31,13 +38,17 @@ class Turn:
 
 class TicTacToeGame(HeadToHeadGame):
     NAME = "Tic-tac-toe"
+    # Fills empty slots in the draw, so it plays randomly to make a bye winnable
     ROBOT_PLAYER = Team("Robot", robot_choose_move)
+    # For checking a solution against
+    PERFECT_PLAYER = Team("Perfect Robot", choose_move_perfectly)
 
     def __init__(
         self,
         team_a: Team,
         team_b: Team,
         name: str,
+        rng: Optional[np.random.Generator] = None,
     ):
 
         HeadToHeadGame.__init__(
@@ -48,6 +59,7 @@ class TicTacToeGame(HeadToHeadGame):
             TEAM_A_COLOR,
             TEAM_B_COLOR,
             both_teams_progress_on_draw=True,
+            rng=rng,
         )
         WildTictactoeEnv.__init__(self)
         self.game_over = False
@@ -56,6 +68,8 @@ class TicTacToeGame(HeadToHeadGame):
         self.robot_first_move = False
         self.robot_first_move_location: Optional[Tuple] = None
         self.board = get_empty_board()
+        # tictactoe_table code of self.board
+        self.code = 0
 
     def reset_game(self) -> None:
         self.player_turn = int(self.went_first) * -1
@@ -63,6 +77,7 @@ class TicTacToeGame(HeadToHeadGame):
         super(TicTacToeGame, self).reset_game()
         self.game_over = False
         self.board = get_empty_board()
+        self.code = 0
 
     def step(self) -> None:
         if self.completed:
@@ -75,16 +90,14 @@ class TicTacToeGame(HeadToHeadGame):
             return
 
         # Random first tile if there's no conclusive winner after 2 games.
-        if self.board.count(" ") == 9 and self.n_games_round >= 2:
+        if self.code == 0 and self.n_games_round >= 2:
             # We switch turn order because a move is always taken at random at the start.
             # This way the player who plays first alternates in the same order:
             # I.e. if team A goes first in game 1, they go first in game 3, 5, 7 etc.
             self.player_turn *= -1
 
             if self.robot_first_move_location is None:
-                move = robot_choose_move(
-                    convert_board_to_regular_ttt(self.board.copy())
-                )
+                move = robot_choose_move(convert_board_to_regular_ttt(self.board.copy()), self.rng)
                 self.robot_first_move_location = move
             else:
                 # Alternate between picking randomly and using the last randomly-picked move.
@@ -98,18 +111,24 @@ class TicTacToeGame(HeadToHeadGame):
                 if self.player_turn == -1:
                     processed_board = flip_board(processed_board)
 
-                move = self.next_to_play.choose_move(board=processed_board)
+                # Robots draw from the game's rng so seeded games are reproducible
+                robot_kwargs = (
+                    {"rng": self.rng}
+                    if self.next_to_play in [self.ROBOT_PLAYER, self.PERFECT_PLAYER]
+                    else {}
+                )
+                move = self.next_to_play.choose_move(board=processed_board, **robot_kwargs)
             except Exception as e:
                 print(
                     f"Invalid move from {self.next_to_play.name} choosing move randomly {e}"
                 )
                 move = robot_choose_move(
-                    convert_board_to_regular_ttt(board=self.board.copy())
+                    convert_board_to_regular_ttt(board=self.board.copy()), self.rng
                 )
 
             self.robot_first_move = False
 
-        poss_move_list = poss_moves(self.board)
+        poss_move_list = tictactoe_table.legal_moves(self.code)
         if move not in poss_move_list:
             raise ValueError(
                 f"{self.next_to_play.name} failed to play a move! Their move was: {move}, possible moves: {poss_move_list}"
@@ -117,9 +136,12 @@ class TicTacToeGame(HeadToHeadGame):
 
         counter = Cell.X if self.player_turn == 1 else Cell.O
         self.board = place_counter(self.board, move, counter)
+        self.code = tictactoe_table.place(self.code, move, self.player_turn)
+        self.log_move(move)
         self.game_over = self.is_game_over()
 
         if self.game_over:
+            self.log_board_end()
             if self.is_draw():
                 self.n_consec_draws += 1
             else:
@@ -140,7 +162,7 @@ class TicTacToeGame(HeadToHeadGame):
         self.player_turn *= -1
 
     def check_win(self) -> bool:
-        if is_winner(self.board):
+        if tictactoe_table.winner(self.code) != 0:
             if self.next_to_play == self.team_a:
                 self.team_a_score += 1
             else:
@@ -149,7 +171,7 @@ class TicTacToeGame(HeadToHeadGame):
         return False
 
     def is_draw(self) -> bool:
-        return is_board_full(self.board)
+        return tictactoe_table.is_full(self.code)
 
     def is_game_over(self) -> bool:
         return self.check_win() or self.is_draw()
@@ -0,0 +1,35 @@
+from typing import List, Optional, Tuple
+
+from league_competition import LeagueCompetition
+from team import Team
+
+
+class RoundRobinCompetition(LeagueCompetition):
+    """Every team plays every other team once. With an odd number of teams, one team has a
+    bye each round."""
+
+    def __repr__(self) -> str:
+        return f"Round Robin Competition: '{self.name}'"
+
+    @property
+    def n_rounds(self) -> int:
+        return len(self.teams) - 1 if len(self.teams) % 2 == 0 else len(self.teams)
+
+    def pair_round(self, round_num: int) -> Tuple[List[Tuple[Team, Team]], Optional[Team]]:
+        # Circle method: fix the first slot and rotate everyone else by one each round
+        if round_num == 1:
+            self._circle: List[Optional[Team]] = list(self.teams)
+            self.rng.shuffle(self._circle)
+            if len(self._circle) % 2 == 1:
+                self._circle.append(None)
+        else:
+            self._circle = [self._circle[0], self._circle[-1]] + self._circle[1:-1]
+
+        half = len(self._circle) // 2
+        pairings, bye = [], None
+        for team_a, team_b in zip(self._circle[:half], reversed(self._circle[half:])):
+            if team_a is None or team_b is None:
+                bye = team_a if team_b is None else team_b
+            else:
+                pairings.append((team_a, team_b))
+        return pairings, bye
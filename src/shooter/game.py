@@ -1,4 +1,7 @@
 import time
+from typing import Optional
+
+import numpy as np
 
 from delta_shooter.game_mechanics import ShooterEnv, choose_move_randomly
 from game_parent import HeadToHeadGame, PlayState
@@ -15,7 +18,9 @@ class ShooterGame(HeadToHeadGame):
     WIN_THRESHOLD = 10
     MAX_TIME = 60
 
-    def __init__(self, team_a: Team, team_b: Team, name: str):
+    def __init__(
+        self, team_a: Team, team_b: Team, name: str, rng: Optional[np.random.Generator] = None
+    ):
         # Set colours relating to the two sprites below - currently red and yellow
         super().__init__(
             team_a,
@@ -24,6 +29,7 @@ class ShooterGame(HeadToHeadGame):
             team_a_color=PLAYER_ONE_COLOR,
             team_b_color=PLAYER_TWO_COLOR,
             both_teams_progress_on_draw=True,
+            rng=rng,
         )
         self.env = ShooterEnv(self.team_b.choose_move, False)
         self.both_teams_progress_on_draw = True
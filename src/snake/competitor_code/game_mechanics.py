@@ -8,7 +8,8 @@ from game_mechanics import play_snake
 """
 import enum
 import random
-from typing import Callable, List, Tuple
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pygame
 
@@ -56,12 +57,15 @@ class Orientation(enum.Enum):
 
 
 class Snake:
-    def __init__(self):
-        self.snake_direction = random.choice(
+    def __init__(self, seed: Optional[int] = None, verbose: bool = True):
+        # Seeding this makes the starting position and food positions reproducible
+        self._random = random.Random(seed)
+        self.verbose = verbose
+        self.snake_direction = self._random.choice(
             [Orientation.EAST, Orientation.WEST, Orientation.NORTH, Orientation.SOUTH]
         )
-        snake_head_x = random.randint(ARENA_WIDTH // 4, 3 * ARENA_WIDTH // 4)
-        snake_head_y = random.randint(ARENA_HEIGHT // 4, 3 * ARENA_HEIGHT // 4)
+        snake_head_x = self._random.randint(ARENA_WIDTH // 4, 3 * ARENA_WIDTH // 4)
+        snake_head_y = self._random.randint(ARENA_HEIGHT // 4, 3 * ARENA_HEIGHT // 4)
         snake_tail_x = (
             snake_head_x - 1
             if self.snake_direction == Orientation.EAST
@@ -78,20 +82,48 @@ class Snake:
         )
         self.snake_positions = [(snake_head_x, snake_head_y), (snake_tail_x, snake_tail_y)]
         self.food_position = (
-            random.randint(0, ARENA_WIDTH - 1),
-            random.randint(0, ARENA_HEIGHT - 1),
+            self._random.randint(0, ARENA_WIDTH - 1),
+            self._random.randint(0, ARENA_HEIGHT - 1),
         )
         self.snake_alive = True
         self.num_steps_taken = 0
 
+    @property
+    def snake_positions(self) -> List[Tuple[int, int]]:
+        """Head first. A new list each time, so changing it doesn't change the snake."""
+        return list(self._positions)
+
+    @snake_positions.setter
+    def snake_positions(self, positions: List[Tuple[int, int]]) -> None:
+        self._positions: Deque[Tuple[int, int]] = deque(positions)
+        # Number of pieces of snake on each square (2 if the snake has hit itself)
+        self._occupied: Dict[Tuple[int, int], int] = {}
+        # Squares without snake, plus where each one is in the list so it can be removed
+        self._free_squares = [(x, y) for x in range(ARENA_WIDTH) for y in range(ARENA_HEIGHT)]
+        self._free_index = {square: idx for idx, square in enumerate(self._free_squares)}
+        for position in self._positions:
+            self._add_to_square(position)
+
+    def _add_to_square(self, position: Tuple[int, int]) -> None:
+        self._occupied[position] = self._occupied.get(position, 0) + 1
+        if position in self._free_index:
+            # Swap the last free square into this one's place
+            idx = self._free_index.pop(position)
+            last = self._free_squares.pop()
+            if last != position:
+                self._free_squares[idx] = last
+                self._free_index[last] = idx
+
+    def _remove_from_square(self, position: Tuple[int, int]) -> None:
+        self._occupied[position] -= 1
+        if self._occupied[position] == 0:
+            del self._occupied[position]
+            if 0 <= position[0] < ARENA_WIDTH and 0 <= position[1] < ARENA_HEIGHT:
+                self._free_index[position] = len(self._free_squares)
+                self._free_squares.append(position)
+
     def generate_food(self):
-        possible_food_positions = [
-            (x, y)
-            for x in range(ARENA_WIDTH)
-            for y in range(ARENA_HEIGHT)
-            if (x, y) not in self.snake_positions
-        ]
-        self.food_position = random.choice(possible_food_positions)
+        self.food_position = self._random.choice(self._free_squares)
 
     def update(
         self,
@@ -99,11 +131,13 @@ class Snake:
     ) -> None:
         try:
             action = choose_action(self.snake_positions, self.snake_direction, self.food_position)
-            if action not in [Action.MOVE_FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT]:
+            # Compare values, as a bot may have imported this file under a different name
+            if action.value not in [valid_action.value for valid_action in Action]:
                 raise ValueError(f"Invalid action: {action}")
         except Exception as e:
-            print(e)
-            action = random.choice([Action.MOVE_FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT])
+            if self.verbose:
+                print(e)
+            action = self._random.choice([Action.MOVE_FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT])
         if action.value == Action.MOVE_FORWARD.value:
             new_orientation = self.snake_direction.value
         elif action.value == Action.TURN_LEFT.value:
@@ -120,12 +154,13 @@ class Snake:
             x += 2 - new_orientation
 
         # Update snake position and orientation
-        self.snake_positions.insert(0, (x, y))
+        self._positions.appendleft((x, y))
+        self._add_to_square((x, y))
         self.snake_direction = Orientation(new_orientation)
 
         # If snake eats apple, don't remove the end of the tail
         if self.snake_head != self.food_position:
-            del self.snake_positions[-1]
+            self._remove_from_square(self._positions.pop())
         else:
             # Generate new apple
             self.generate_food()
@@ -135,11 +170,12 @@ class Snake:
             self.snake_alive = False
 
         self.num_steps_taken += 1
-        if self.num_steps_taken % 1000 == 0:
+        if self.verbose and self.num_steps_taken % 1000 == 0:
             print(f"{self.num_steps_taken} steps taken")
 
         if self.num_steps_taken >= 10000:
-            print("RUN OUT OF TIME!")
+            if self.verbose:
+                print("RUN OUT OF TIME!")
             self.snake_alive = False
 
     def has_hit_boundaries(self) -> bool:
@@ -148,15 +184,15 @@ class Snake:
         return y_boundary_hit or x_boundary_hit
 
     def has_hit_self(self) -> bool:
-        return self.snake_head in self.snake_body
+        return self._occupied[self.snake_head] > 1
 
     @property
     def snake_length(self) -> int:
-        return len(self.snake_positions)
+        return len(self._positions)
 
     @property
     def snake_head(self) -> Tuple[int, int]:
-        return self.snake_positions[0]
+        return self._positions[0]
 
     @property
     def snake_body(self) -> List[Tuple[int, int]]:
@@ -0,0 +1,162 @@
+"""Plays snake bots over many seeded games without drawing or printing anything.
+
+Used to check a bot qualifies and to rank bots against each other on the same games. From
+src:
+
+    python -m snake.evaluate
+"""
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+
+import snake.competitor_code.game_mechanics as game_mechanics
+from snake.competitor_code import Snake, robot_choose_move
+
+COMPETITOR_CODE_DIR = Path(__file__).parent.resolve() / "competitor_code"
+
+N_GAMES = 100
+
+
+@dataclass
+class SnakeEvaluation:
+    name: str
+    seeds: np.ndarray
+    # snake_length - 2 at the end of each game, as scored in the competition
+    scores: np.ndarray
+    steps: np.ndarray
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "mean_score": float(np.mean(self.scores)),
+            "median_score": float(np.median(self.scores)),
+            "min_score": float(np.min(self.scores)),
+            "max_score": float(np.max(self.scores)),
+            "mean_steps": float(np.mean(self.steps)),
+        }
+
+
+def play_headless(choose_move: Callable, seed: int) -> Tuple[int, int]:
+    """Plays one game with no drawing or printing.
+
+    The seed sets the snake's start and food positions, and also seeds random and
+    np.random in case the bot uses them. Anything the bot prints is thrown away.
+
+    Returns:
+        The score (snake_length - 2) and the number of steps survived
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    game = Snake(seed=seed, verbose=False)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        while game.snake_alive:
+            game.update(choose_move)
+    return game.snake_length - 2, game.num_steps_taken
+
+
+def game_seeds(n_games: int, seed: int = 0) -> np.ndarray:
+    """The same n_games seeds for every bot evaluated with this seed."""
+    return np.random.default_rng(seed).integers(2**32, size=n_games)
+
+
+def evaluate(
+    choose_move: Callable,
+    n_games: int = N_GAMES,
+    seed: int = 0,
+    n_processes: int = 1,
+    name: str = "",
+) -> SnakeEvaluation:
+    """Plays choose_move over n_games seeded games.
+
+    Args:
+        n_processes: Play games in this many processes at once. choose_move must be picklable
+                     (i.e. defined at the top level of a module) if this is more than 1.
+    """
+    seeds = game_seeds(n_games, seed)
+    play = partial(play_headless, choose_move)
+    if n_processes > 1:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            results = list(
+                executor.map(play, seeds.tolist(), chunksize=max(1, n_games // (4 * n_processes)))
+            )
+    else:
+        results = [play(game_seed) for game_seed in seeds.tolist()]
+
+    scores, steps = zip(*results)
+    return SnakeEvaluation(name, seeds, np.array(scores), np.array(steps))
+
+
+@contextmanager
+def example_games_disabled() -> Iterator[None]:
+    """Stops solutions from playing a game with visuals when they're imported.
+
+    The example solutions call play_snake() at the top level and import game_mechanics
+    directly. While this is active, that import gets this package's game_mechanics (so the
+    solutions share its Action and Orientation) with play_snake() doing nothing.
+    """
+    previous = sys.modules.get("game_mechanics")
+    sys.modules["game_mechanics"] = game_mechanics
+    try:
+        with patch.object(game_mechanics, "play_snake", lambda *args, **kwargs: None):
+            yield
+    finally:
+        if previous is None:
+            del sys.modules["game_mechanics"]
+        else:
+            sys.modules["game_mechanics"] = previous
+
+
+def load_solutions() -> Dict[str, Callable]:
+    """choose_move from every solution in competitor_code and the robot's.
+
+    Team files are named by their TEAM_NAME, other solutions by their file name.
+    """
+    # Solutions may import other files in competitor_code directly
+    sys.path.append(str(COMPETITOR_CODE_DIR))
+    solutions = {"Robot": robot_choose_move}
+    for path in sorted(COMPETITOR_CODE_DIR.glob("*.py")):
+        if path.stem in {"__init__", "game_mechanics", "robot"}:
+            continue
+        try:
+            with example_games_disabled():
+                module = import_module(f"snake.competitor_code.{path.stem}")
+        except Exception as e:
+            print(f"Couldn't import {path.stem}: {e}")
+            continue
+        if hasattr(module, "choose_move"):
+            solutions[getattr(module, "TEAM_NAME", path.stem)] = module.choose_move
+    return solutions
+
+
+def rank_solutions(
+    solutions: Dict[str, Callable],
+    n_games: int = N_GAMES,
+    seed: int = 0,
+    n_processes: int = 1,
+) -> List[SnakeEvaluation]:
+    """Evaluates every solution on the same games, best mean score first."""
+    evaluations = [
+        evaluate(choose_move, n_games, seed, n_processes, name)
+        for name, choose_move in solutions.items()
+    ]
+    return sorted(evaluations, key=lambda evaluation: np.mean(evaluation.scores), reverse=True)
+
+
+def main() -> None:
+    ranking = rank_solutions(load_solutions(), n_processes=os.cpu_count() or 1)
+    for rank, evaluation in enumerate(ranking, start=1):
+        summary = ", ".join(f"{stat}: {value:.1f}" for stat, value in evaluation.summary().items())
+        print(f"{rank}. {evaluation.name} - {summary}")
+
+
+if __name__ == "__main__":
+    main()
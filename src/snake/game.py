@@ -1,3 +1,7 @@
+from typing import Optional
+
+import numpy as np
+
 from game_parent import PlayState, PointsGame
 from snake.competitor_code import Snake, robot_choose_move
 from team import Team
@@ -12,14 +16,14 @@ class SnakeGame(PointsGame, Snake):
         self,
         name: str,
         team: Team,
+        rng: Optional[np.random.Generator] = None,
     ):
-        PointsGame.__init__(self, name, team)
-        Snake.__init__(self)
+        PointsGame.__init__(self, name, team, rng=rng)
+        Snake.__init__(self, seed=int(self.rng.integers(2**32)))
 
     def step(self) -> None:
         if self.completed:
             return
-        print(self._team.name, "is playing...")
         self.update(self._team.choose_move)
         self.score = self.snake_length - 2
         if not self.snake_alive or self.steps_remaining == 0:
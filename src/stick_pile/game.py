@@ -1,6 +1,18 @@
-from typing import Tuple
-from delta_stick_pile.game_mechanics import StickPile, choose_move_randomly
-from game_parent import HeadToHeadGame, PlayState, PointsGame
+from functools import partial
+from typing import Optional, Tuple
+
+import numpy as np
+
+from delta_stick_pile.game_mechanics import StickPile
+from game_parent import HeadToHeadGame, PlayState, PointsGame, random_choice
+from stick_pile.solver import (
+    DEFAULT_TAKES,
+    MAX_STICKS,
+    MIN_STICKS,
+    choose_move_perfectly,
+    choose_move_randomly,
+    get_table,
+)
 from team import Team
 
 
@@ -11,15 +23,25 @@ class StickPileGame(HeadToHeadGame):
     """Inherit from PointsGame or HeadToHeadGame."""
 
     NAME = "StickPile"
+    # Fills empty slots in the draw, so it plays randomly to make a bye winnable. It's given
+    # the game's TAKES and rng when it plays.
     ROBOT_PLAYER = Team("Robot", choose_move_randomly)
     WIN_THRESHOLD = 3
-
-    def __init__(self, team_a: Team, team_b: Team, name: str):
+    # Sticks a player may take each turn, and the range of pile sizes games start with
+    TAKES = DEFAULT_TAKES
+    MIN_STICKS = MIN_STICKS
+    MAX_STICKS = MAX_STICKS
+
+    def __init__(
+        self, team_a: Team, team_b: Team, name: str, rng: Optional[np.random.Generator] = None
+    ):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.team_a = team_a
         self.team_b = team_b
         self.team_a_color = BLACK_COLOR
         self.team_b_color = BLACK_COLOR
         self.both_teams_progress_on_draw = False
+        self.table = get_table(self.TAKES)
         self.env = StickPile(
             self.team_b.choose_move,
             verbose=False,
@@ -37,10 +59,20 @@ class StickPileGame(HeadToHeadGame):
 
         self.most_recent_move = None
 
+    @classmethod
+    def perfect_player(cls) -> Team:
+        """A player that never loses a game it can win with this game's TAKES, for validation."""
+        return Team("Perfect Robot", partial(choose_move_perfectly, takes=cls.TAKES))
+
     def reset_game(self) -> int:
-        print("reset game called")
         self.invalid_move = False
-        self.number_of_sticks_remaining, _, _, _ = self.env.reset(take_first_step=False)
+        self.env.reset(take_first_step=False)
+        # StickPile picks who starts with the global random state
+        self.env.player_move = random_choice(["player", "opponent"], self.rng)
+        self.env.number_of_sticks_remaining = int(
+            self.rng.integers(self.MIN_STICKS, self.MAX_STICKS + 1)
+        )
+        self.number_of_sticks_remaining = self.env.number_of_sticks_remaining
 
         if self.went_first is not None and self.went_first == self.env.player_move:
             self.env.switch_player()
@@ -57,7 +89,6 @@ class StickPileGame(HeadToHeadGame):
             return
 
         if self.round_over:
-            print("resetting")
             self.doing_reset = True
             self.reset_game()
             return
@@ -67,19 +98,21 @@ class StickPileGame(HeadToHeadGame):
         team_a_turn = self.env.player_move == "player"
         player_to_play = self.team_a if team_a_turn else self.team_b
 
+        robot_kwargs = (
+            {"takes": self.TAKES, "rng": self.rng} if player_to_play == self.ROBOT_PLAYER else {}
+        )
         try:
             move = player_to_play.choose_move(
-                number_of_sticks_remaining=self.env.number_of_sticks_remaining,
+                number_of_sticks_remaining=self.env.number_of_sticks_remaining, **robot_kwargs
             )
         except:
             self.invalid_move = True
             move = None
 
-        print(f"player to play {player_to_play.name}")
         if move is None:
             move = 0
         # This handles the player switch
-        move_result = self.env._step(move)
+        move_result = self.take_sticks(move)
 
         self.most_recent_move = move
 
@@ -87,16 +120,12 @@ class StickPileGame(HeadToHeadGame):
         if move_result == -1:
 
             self.invalid_move = True
-            print(
-                f'{"team a" if team_a_turn else 'team_b'} made an invalid move and loses!'
-            )
             if team_a_turn:
                 self.team_b_score += 1
             else:
                 self.team_a_score += 1
 
             self.round_over = True
-            print([self.team_a_score, self.team_b_score])
             if self.WIN_THRESHOLD in [self.team_a_score, self.team_b_score]:
                 self.play_state = PlayState.COMPLETED
             return
@@ -109,16 +138,30 @@ class StickPileGame(HeadToHeadGame):
         self.number_of_sticks_remaining = self.env.number_of_sticks_remaining
 
         if move_result == 1:
-            print(
-                f"{self.team_a.name if team_a_turn else self.team_b.name} takes the last stick and wins!"
-            )
             if team_a_turn:
                 self.team_a_score += 1
             else:
                 self.team_b_score += 1
 
             self.round_over = True
-            print([self.team_a_score, self.team_b_score])
             if self.WIN_THRESHOLD in [self.team_a_score, self.team_b_score]:
                 self.play_state = PlayState.COMPLETED
             return
+
+    def take_sticks(self, move: object) -> int:
+        """Same as StickPile._step, checking the move against the solved table.
+
+        Returns:
+            -1 for an invalid move, 1 if the last stick was taken, otherwise 0
+        """
+        if not self.table.is_valid(self.env.number_of_sticks_remaining, move):
+            self.env.done = True
+            return -1
+
+        self.env.number_of_sticks_remaining -= move
+        if self.env.number_of_sticks_remaining == 0:
+            self.env.done = True
+            return 1
+
+        self.env.switch_player()
+        return 0
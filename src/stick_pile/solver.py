@@ -0,0 +1,151 @@
+"""Stick pile solved: who wins from every pile size with perfect play, and how.
+
+Players take turns removing sticks from a pile, and whoever takes the last stick wins. With
+the usual takes of 1, 2 or 3 sticks, the player to move loses exactly when the pile is a
+multiple of 4. Any other set of takes is solved the same way, working up from an empty
+pile. A player left with fewer sticks than the smallest take can't move, and loses.
+
+Tables are built once for each set of takes and grown when a bigger pile turns up, so
+perfect moves and move validation are list lookups.
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_TAKES = (1, 2, 3)
+MIN_STICKS = 15
+MAX_STICKS = 25
+
+
+class StickPileTable:
+    def __init__(self, takes: Sequence[int] = DEFAULT_TAKES, max_sticks: int = MAX_STICKS):
+        assert takes and all(take > 0 for take in takes), f"Invalid takes {takes}"
+        self.takes = tuple(sorted(set(takes)))
+        self._take_set = frozenset(self.takes)
+        # wins[n] is True if the player to move with n sticks left can force a win
+        self.wins: List[bool] = []
+        # A take that wins from n sticks, 0 if there isn't one
+        self.winning_take: List[int] = []
+        self.extend(max_sticks)
+
+    @property
+    def max_sticks(self) -> int:
+        return len(self.wins) - 1
+
+    def extend(self, max_sticks: int) -> None:
+        """Solves every pile up to max_sticks sticks."""
+        for n_sticks in range(len(self.wins), max_sticks + 1):
+            # Takes that leave the opponent in a losing position
+            winning_takes = [
+                take for take in self.takes if take <= n_sticks and not self.wins[n_sticks - take]
+            ]
+            self.wins.append(bool(winning_takes))
+            self.winning_take.append(winning_takes[0] if winning_takes else 0)
+
+    def is_valid(self, n_sticks: int, take: object) -> bool:
+        """Whether take is an allowed number of sticks to remove from n_sticks."""
+        return isinstance(take, int) and take in self._take_set and take <= n_sticks
+
+    def legal_takes(self, n_sticks: int) -> List[int]:
+        return [take for take in self.takes if take <= n_sticks]
+
+    def is_win(self, n_sticks: int) -> bool:
+        """Whether the player to move with n_sticks left can force a win."""
+        if n_sticks > self.max_sticks:
+            self.extend(n_sticks)
+        return self.wins[n_sticks]
+
+    def best_take(self, n_sticks: int) -> Optional[int]:
+        """A winning take if there is one, otherwise the smallest take (None if there's no move)."""
+        if n_sticks > self.max_sticks:
+            self.extend(n_sticks)
+        if self.winning_take[n_sticks]:
+            return self.winning_take[n_sticks]
+        return self.takes[0] if self.takes[0] <= n_sticks else None
+
+
+_tables: Dict[Tuple[int, ...], StickPileTable] = {}
+
+
+def get_table(takes: Sequence[int] = DEFAULT_TAKES) -> StickPileTable:
+    """The table for a set of takes, shared by everything in the process."""
+    key = tuple(sorted(set(takes)))
+    if key not in _tables:
+        _tables[key] = StickPileTable(key)
+    return _tables[key]
+
+
+def choose_move_perfectly(
+    number_of_sticks_remaining: int, takes: Sequence[int] = DEFAULT_TAKES
+) -> int:
+    """Player that never loses a game it can win. Use functools.partial to set other takes."""
+    return get_table(takes).best_take(number_of_sticks_remaining)
+
+
+def choose_move_randomly(
+    number_of_sticks_remaining: int,
+    takes: Sequence[int] = DEFAULT_TAKES,
+    rng: Optional[np.random.Generator] = None,
+) -> Optional[int]:
+    """A random allowed take (None if there's no move)."""
+    legal_takes = get_table(takes).legal_takes(number_of_sticks_remaining)
+    if not legal_takes:
+        return None
+    rng = rng if rng is not None else np.random.default_rng()
+    return legal_takes[rng.integers(len(legal_takes))]
+
+
+def play_match(
+    choose_move_a: Callable[[int], int],
+    choose_move_b: Callable[[int], int],
+    n_sticks: int,
+    a_first: bool = True,
+    takes: Sequence[int] = DEFAULT_TAKES,
+) -> int:
+    """Plays one game with no drawing, printing or waiting.
+
+    A player loses if they make an invalid move, their function raises an exception or they
+    have no move left.
+
+    Returns:
+        1 if a wins, -1 if b wins
+    """
+    table = get_table(takes)
+    player = 1 if a_first else -1
+    while True:
+        if n_sticks < table.takes[0]:
+            return -player
+        choose_move = choose_move_a if player == 1 else choose_move_b
+        try:
+            take = choose_move(number_of_sticks_remaining=n_sticks)
+        except Exception:
+            return -player
+        if not table.is_valid(n_sticks, take):
+            return -player
+        n_sticks -= take
+        if n_sticks == 0:
+            return player
+        player = -player
+
+
+def play_matches(
+    choose_move_a: Callable[[int], int],
+    choose_move_b: Callable[[int], int],
+    n_games: int,
+    takes: Sequence[int] = DEFAULT_TAKES,
+    min_sticks: int = MIN_STICKS,
+    max_sticks: int = MAX_STICKS,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, int]:
+    """Plays n_games games, alternating who goes first, with random pile sizes.
+
+    Returns:
+        Number of wins and losses for choose_move_a
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    pile_sizes = rng.integers(min_sticks, max_sticks + 1, size=n_games).tolist()
+    results = {"wins": 0, "losses": 0}
+    for game, n_sticks in enumerate(pile_sizes):
+        winner = play_match(choose_move_a, choose_move_b, n_sticks, game % 2 == 0, takes)
+        results["wins" if winner == 1 else "losses"] += 1
+    return results
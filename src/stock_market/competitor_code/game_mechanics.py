@@ -1,6 +1,7 @@
+import os
 import random
 from pathlib import Path
-from typing import Callable, Tuple
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 import torch
@@ -10,33 +11,125 @@ ONE_MILLION = 1_000_000.00
 
 HERE = Path(__file__).parent.resolve()
 
+# Days of prices a forecast is made from
+WINDOW = 5
+# How many stocks to buy or sell in each trade
+N_STOCKS_TRADE = 100
+
+# Forecasts are small forward passes, which more threads only slow down. Only set in worker
+# processes playing games, see limit_inference_threads()
+INFERENCE_THREADS = 1
+
+_stock_prices: Dict[str, np.ndarray] = {}
+# Loaded networks, by team name and whether they were converted to TorchScript
+_networks: Dict[Tuple[str, bool], nn.Module] = {}
+
 
 def save_network(network: nn.Module, team_name: str) -> None:
     assert isinstance(network, nn.Module), f"train() function outputs an invalid network: {network}"
     assert "/" not in team_name, "Invalid TEAM_NAME. '/' are illegal in TEAM_NAME"
     torch.save(network, f"{team_name}_network")
+    # So the new network is loaded next time
+    for script in [False, True]:
+        _networks.pop((team_name, script), None)
+
+
+def network_path(team_name: str) -> Path:
+    return HERE / f"{team_name}_network"
+
+
+def load_network(team_name: str, script: bool = False) -> nn.Module:
+    """The team's saved network, ready for inference.
+
+    Each network is loaded and warmed up once per process. Networks loaded before worker
+    processes are forked are shared with them, as nothing writes to the weights.
+
+    Args:
+        script: Convert the network to frozen TorchScript, if it can be
+    """
+    key = (team_name, script)
+    if key not in _networks:
+        net_path = network_path(team_name)
+        assert (
+            net_path.exists()
+        ), f"Network saved using TEAM_NAME='{team_name}' doesn't exist! ({net_path})"
+        model = torch.load(net_path)
+        model.eval()
+        model.requires_grad_(False)
+        example = torch.zeros(1, WINDOW)
+        if script:
+            try:
+                model = torch.jit.freeze(torch.jit.trace(model, example))
+            except Exception:
+                # Not every network can be traced, those run as they are
+                pass
+        with torch.inference_mode():
+            model(example)
+        _networks[key] = model
+    return _networks[key]
+
+
+def limit_inference_threads() -> None:
+    """Stops torch starting a thread per core in each of many worker processes."""
+    torch.set_num_threads(INFERENCE_THREADS)
+
+
+def preload_networks(team_names: Iterable[str], script: bool = False) -> None:
+    """Loads the saved network of every team that has one, e.g. before forking workers."""
+    for team_name in team_names:
+        if network_path(team_name).exists():
+            load_network(team_name, script)
+
+
+def load_stock_price(name: str) -> np.ndarray:
+    """Read-only prices from data/stock_price_{name}.npy, memory-mapped once per process."""
+    if name not in _stock_prices:
+        stock_price = np.load(HERE / "data" / f"stock_price_{name}.npy", mmap_mode="r")
+        # Viewed as a plain array so indexing skips np.memmap's __getitem__
+        _stock_prices[name] = stock_price.view(np.ndarray)
+    return _stock_prices[name]
+
+
+def load_scenarios() -> np.ndarray:
+    """Read-only (n_scenarios, n_days) prices of every market in the scenario bank.
+
+    The bank is generated and saved to data/ the first time it's needed.
+    """
+    path = HERE / "data" / "stock_price_scenarios.npy"
+    if not path.exists():
+        from generate_data import save_scenario_bank
+
+        # Written to a temporary file first so other processes never see half a bank
+        temp_path = path.with_name(f"{path.stem}_{os.getpid()}.npy")
+        save_scenario_bank(temp_path)
+        os.replace(temp_path, path)
+    return load_stock_price("scenarios")
 
 
-def load_network(team_name: str) -> nn.Module:
-    net_path = HERE / f"{team_name}_network"
-    assert (
-        net_path.exists()
-    ), f"Network saved using TEAM_NAME='{team_name}' doesn't exist! ({net_path})"
-    model = torch.load(net_path)
-    model.eval()
-    return model
+def price_windows(stock: np.ndarray) -> np.ndarray:
+    """Every WINDOW days in a row of prices, as a (..., n_days - WINDOW + 1, WINDOW) view."""
+    return np.lib.stride_tricks.sliding_window_view(stock, WINDOW, axis=-1)
+
+
+def forecast_windows(prices: np.ndarray, number_of_forecasts: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The WINDOW days before each of the last number_of_forecasts days, and those days' prices.
+
+    Works on one series or on a (n_series, n_days) batch of them.
+
+    Returns:
+        windows: (..., number_of_forecasts, WINDOW) view of prices
+        next_prices: (..., number_of_forecasts) view of prices
+    """
+    windows = price_windows(prices)[..., -number_of_forecasts - 1 : -1, :]
+    return windows, prices[..., -number_of_forecasts:]
 
 
 def training_data_from_stock(stock: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    x, y = [], []
-    for start_chunk, end_chunk in enumerate(range(5, len(stock))):
-        x.append(stock[start_chunk:end_chunk])
-        y.append(stock[end_chunk])
-    return np.array(x), np.array(y)
+    return price_windows(stock)[:-1].copy(), np.array(stock[WINDOW:])
 
 
 def train_network(train: Callable, team_name: str) -> None:
-    stock_price = np.load(f"{HERE}/data/stock_price_train.npy")
+    stock_price = load_stock_price("train")
     previous_5_days, next_days = training_data_from_stock(stock_price)
     previous_5_days = torch.tensor(previous_5_days).float()
     next_days = torch.unsqueeze(torch.tensor(next_days), dim=1).float()
@@ -46,6 +139,61 @@ def train_network(train: Callable, team_name: str) -> None:
     save_network(neural_network, team_name)
 
 
+def network_forecasts(network: nn.Module, windows: np.ndarray) -> np.ndarray:
+    """Forecasts for every window in a (..., WINDOW) array, from one forward pass of network."""
+    inputs = torch.from_numpy(np.array(windows, dtype=np.float32).reshape(-1, WINDOW))
+    with torch.inference_mode():
+        forecasts = network(inputs)
+    return forecasts.numpy().reshape(windows.shape[:-1])
+
+
+def checked_forecast(predict_price: Callable[[torch.Tensor], float], window: torch.Tensor) -> float:
+    """predict_price's forecast for a (1, WINDOW) window. Raises if it isn't a float."""
+    forecast = predict_price(window)
+    assert isinstance(forecast, float), "You must return a float!"
+    return forecast
+
+
+def predict_forecasts(
+    predict_price: Callable[[torch.Tensor], float], windows: np.ndarray
+) -> np.ndarray:
+    """Forecasts for every window in a (..., WINDOW) array, calling predict_price on each.
+
+    Like StockMarket.update(), a forecast that fails or isn't a float is replaced by a random
+    day's price. Any no-grad context is up to predict_price, so teams can keep training while
+    they forecast.
+    """
+    inputs = torch.tensor(np.array(windows)).float()
+    forecasts = np.empty(windows.shape[:-1])
+    for index in np.ndindex(forecasts.shape):
+        try:
+            forecasts[index] = checked_forecast(predict_price, inputs[index].unsqueeze(0))
+        except Exception:
+            forecasts[index] = random.choice(windows[index])
+    return forecasts
+
+
+def trading_money(
+    forecasts: np.ndarray, windows: np.ndarray, next_prices: np.ndarray
+) -> np.ndarray:
+    """Money at the end of trading on every series of forecasts at once.
+
+    Matches TradingGame (up to float rounding): each day it goes long if the forecast is above
+    today's closing price, short if it's below, and closes the position at the next price.
+
+    Args:
+        forecasts: (..., n_days) forecasts for each day
+        windows: (..., n_days, WINDOW) prices before each day, from forecast_windows()
+        next_prices: (..., n_days) price each day
+
+    Returns:
+        Money at the end of each series
+    """
+    today_closing = windows[..., -1]
+    positions = np.sign(forecasts - today_closing)
+    return ONE_MILLION + N_STOCKS_TRADE * np.sum(positions * (next_prices - today_closing), axis=-1)
+
+
 def play_the_market(take_action: Callable, number_of_forecasts: int) -> None:
     market = StockMarket("", 1, number_of_forecasts=number_of_forecasts)
 
@@ -60,8 +208,7 @@ class TradingGame:
     def __init__(self, initial_stock_price: float, verbose: bool = True) -> None:
         self.starting_money = self.current_money = ONE_MILLION
         self.starting_stocks = self.stocks_held = 1000
-        # How many stocks to buy or sell in each trade
-        self.n_stocks_trade = 100
+        self.n_stocks_trade = N_STOCKS_TRADE
         self.intial_cost = initial_stock_price * self.starting_stocks
         self.current_position = "none"
 
@@ -129,7 +276,14 @@ class StockMarket:
         team_name: str,
         game_speed_multiplier: float,
         number_of_forecasts: int,
+        scenario_seed: Optional[int] = None,
     ) -> None:
+        """A market to trade on for number_of_forecasts days.
+
+        Args:
+            scenario_seed: Trade on a market from the scenario bank picked with this seed,
+                           rather than the test set
+        """
         self.team_name = team_name
         self.game_speed_multiplier = game_speed_multiplier
         self.number_of_forecasts = number_of_forecasts
@@ -137,10 +291,19 @@ class StockMarket:
         self.forecasts_done = 0
         self.game_over = False
         self.total_error = 0
-        self._stock_price = np.load(f"{HERE}/data/stock_price_test.npy")
+        if scenario_seed is None:
+            self._stock_price = load_stock_price("test")
+        else:
+            scenarios = load_scenarios()
+            scenario = np.random.default_rng(scenario_seed).integers(len(scenarios))
+            self._stock_price = scenarios[scenario]
         assert (
             self._stock_price.shape[0] - 5 >= number_of_forecasts
         ), f"Number of forecasts requested ({number_of_forecasts}) exceeds the maximum number of forecasts in test set: {self._stock_price.shape[0] - 5}"
+        # The WINDOW days before each forecast, shaped (number_of_forecasts, 1, WINDOW)
+        # (a copy, as torch warns about tensors made from read-only arrays)
+        windows, _ = forecast_windows(self._stock_price, number_of_forecasts)
+        self._forecast_windows = torch.tensor(np.array(windows)).float().unsqueeze(1)
 
         self.trading_game = TradingGame(self.current_ticker[-1], False)
 
@@ -163,11 +326,14 @@ class StockMarket:
         return self.trading_game.get_final_return()
 
     def update(self, take_action: Callable[[np.ndarray], float]) -> None:
-        data = torch.unsqueeze(torch.tensor(self.current_ticker[-5:]), dim=1).T.float()
+        assert self.forecasts_done < self.number_of_forecasts, (
+            f"All {self.number_of_forecasts} forecasts have been made. Ask for more with "
+            "number_of_forecasts, or call reset()"
+        )
+        data = self._forecast_windows[self.forecasts_done]
 
         try:
-            forecast = take_action(data)
-            assert isinstance(forecast, float), "You must return a float!"
+            forecast = checked_forecast(take_action, data)
         except Exception as e:
             print(e)
             forecast = float(random.choice(data[0]))
@@ -1,9 +1,21 @@
 # For learney eyes only
 
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Sequence
 
 import numpy as np
-from matplotlib import pyplot as plt
+
+# Need to be slightly unstable dynamics otherwise noise dominates
+# This in conjuction with a sigma of 10 and a length of 200 gives
+# a vector that looks like a stock, but is dominated by the AR dynamics,
+# not the noise. A cheater than knows the weights will win every time with this.
+# AR_PHI = [0.7, 0.1, 0.6, -0.3, -0.3]
+AR_PHI = [0.7, 0.1, 0.6, -0.3, -0.2]
+
+# Markets StockMarket can be played on, as well as the fixed test set
+N_SCENARIOS = 256
+SCENARIO_LENGTH = 1000
+SCENARIO_SEED = 0
 
 
 class GenerateDataAR:
@@ -42,12 +54,9 @@ class GenerateDataAR:
         -------
         ar_value : float
             sampled signal for time t
-
-        TODO: This can be vectorized
         """
-        ar_value = [self.previous_value[i] * self.ar_params[i] for i in range(len(self.ar_params))]
         noise = np.random.normal(loc=0.0, scale=self.sigma)
-        ar_value = np.sum(ar_value) + noise
+        ar_value = np.dot(self.previous_value, self.ar_params) + noise
         self.previous_value = self.previous_value[1:] + [ar_value]
         return ar_value
 
@@ -74,12 +83,7 @@ def generate_stock_price(sigma: float = 10, length: int = 1000, plot: bool = Fal
         Length of the stock price vector
     """
 
-    # Need to be slightly unstable dynamics otherwise noise dominates
-    # This in conjuction with a sigma of 10 and a length of 200 gives
-    # a vector that looks like a stock, but is dominated by the AR dynamics,
-    # not the noise. A cheater than knows the weights will win every time with this.
-    # ar_phi = [0.7, 0.1, 0.6, -0.3, -0.3]
-    ar_phi = [0.7, 0.1, 0.6, -0.3, -0.2]
+    ar_phi = AR_PHI
     data = list(np.random.randint(90, 110, size=len(ar_phi)))
 
     ar = GenerateDataAR(ar_params=ar_phi, sigma=sigma, start_values=data)
@@ -90,6 +94,8 @@ def generate_stock_price(sigma: float = 10, length: int = 1000, plot: bool = Fal
     if sigma == 0.0:
         test_is_ar(ar_phi, return_data)
     if plot:
+        from matplotlib import pyplot as plt
+
         plt.plot(return_data)
         plt.ylabel("Stock price")
         plt.xlabel("Days")
@@ -97,6 +103,44 @@ def generate_stock_price(sigma: float = 10, length: int = 1000, plot: bool = Fal
     return return_data
 
 
+def generate_stock_prices(
+    n_series: int,
+    sigma: float = 10,
+    length: int = 1000,
+    ar_phi: Sequence[float] = AR_PHI,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Many stock prices at once, generated like generate_stock_price().
+
+    Every series is stepped forward together, so there's one numpy operation per day rather
+    than one per day per series.
+
+    Returns:
+        Array of shape (n_series, len(ar_phi) + length)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    n_params = len(ar_phi)
+    prices = np.empty((n_series, n_params + length))
+    prices[:, :n_params] = rng.integers(90, 110, size=(n_series, n_params))
+    noise = rng.normal(loc=0.0, scale=sigma, size=(n_series, length))
+    # Oldest value first, to line up with each window of previous values
+    weights = np.array(ar_phi[::-1], dtype=float)
+    for day in range(length):
+        prices[:, n_params + day] = prices[:, day : n_params + day] @ weights + noise[:, day]
+    return prices - prices.min(axis=1, keepdims=True) + 10  # Min each stock at 10
+
+
+def save_scenario_bank(
+    path: Path,
+    n_scenarios: int = N_SCENARIOS,
+    length: int = SCENARIO_LENGTH,
+    seed: int = SCENARIO_SEED,
+) -> None:
+    """Saves n_scenarios stock prices to path as one (n_scenarios, 5 + length) array."""
+    prices = generate_stock_prices(n_scenarios, length=length, rng=np.random.default_rng(seed))
+    np.save(path, prices)
+
+
 if __name__ == "__main__":
     stock = generate_stock_price(plot=True)
     with open("stock_price_train2.npy", "wb") as f:
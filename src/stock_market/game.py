@@ -1,10 +1,23 @@
 import os
+from typing import Optional
 
+import numpy as np
 import pygame
 from pygame import Surface
 
 from game_parent import PointsGame
-from stock_market.competitor_code.game_mechanics import ONE_MILLION, StockMarket
+from stock_market.competitor_code.game_mechanics import (
+    ONE_MILLION,
+    StockMarket,
+    forecast_windows,
+    limit_inference_threads,
+    load_network,
+    load_scenarios,
+    network_forecasts,
+    network_path,
+    predict_forecasts,
+    trading_money,
+)
 from stock_market.competitor_code.robot import predict_price as robot_choose_move
 from team import Team
 
@@ -16,26 +29,42 @@ class StockGame(PointsGame, StockMarket):
     ROBOT_PLAYER = Team("Robot", robot_choose_move)
     GAME_SPEED_MULTIPLIER = 100
     TOTAL_ROUNDS = 100
+    # If set, teams are scored by their average money over this many markets from the scenario
+    # bank rather than by the one market shown
+    N_SCORING_SCENARIOS = 0
+    # Score scenarios with one forward pass of each team's saved network rather than calling
+    # predict_price on every window. Only for teams whose predict_price just runs that network
+    # on the raw window, as any other processing in predict_price is skipped.
+    SCORE_WITH_SAVED_NETWORK = False
 
     def __init__(
         self,
         name: str,
         team: Team,
+        rng: Optional[np.random.Generator] = None,
     ):
         PointsGame.__init__(
             self,
             name,
             team,
+            rng=rng,
         )
         self.n_rounds = 0
         StockMarket.__init__(
-            self, team.name, StockGame.GAME_SPEED_MULTIPLIER, number_of_forecasts=10
+            self,
+            team.name,
+            StockGame.GAME_SPEED_MULTIPLIER,
+            number_of_forecasts=StockGame.TOTAL_ROUNDS,
         )
         self.n_total_guesses = 0
         self.n_rounds_solved = 0
         self.score = 100
         self.timeout = 1
 
+    @staticmethod
+    def init_worker_process() -> None:
+        limit_inference_threads()
+
     def draw_game(self, screen: Surface, scale: float) -> None:
         self.screen = screen
         self.scale = scale
@@ -90,4 +119,19 @@ class StockGame(PointsGame, StockMarket):
 
         if self.n_rounds == self.TOTAL_ROUNDS:
             self.score = self.trading_game.current_money
+            if self.N_SCORING_SCENARIOS:
+                self.score = float(np.mean(self.scenario_money(self.N_SCORING_SCENARIOS)))
             self.complete()
+
+    def scenario_money(self, n_scenarios: int) -> np.ndarray:
+        """Money the team ends with on each of the first n_scenarios markets in the scenario bank.
+
+        Every team trades on the same markets, with forecasts from the team's predict_price as in
+        the live game (or their saved network if SCORE_WITH_SAVED_NETWORK is set).
+        """
+        windows, next_prices = forecast_windows(load_scenarios()[:n_scenarios], self.TOTAL_ROUNDS)
+        if self.SCORE_WITH_SAVED_NETWORK and network_path(self._team.name).exists():
+            forecasts = network_forecasts(load_network(self._team.name), windows)
+        else:
+            forecasts = predict_forecasts(self._team.choose_move, windows)
+        return trading_money(forecasts, windows, next_prices)
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from competition_controller import CompetitionController
 from play_competition import play_competition
+from stock_market.competitor_code.game_mechanics import preload_networks
 from stock_market.game import StockGame
 from team import Team
 from tournament import StockTournament
@@ -36,6 +37,9 @@ def main() -> None:
 
             function_store[team_name] = func
 
+    # Loaded once here, so games played in worker processes share them
+    preload_networks(function_store)
+
     teams = [
         Team(name=name, choose_move_function=function) for name, function in function_store.items()
     ]
@@ -0,0 +1,124 @@
+import math
+from typing import List, Optional, Tuple, Type
+from warnings import warn
+
+import numpy as np
+
+from game_parent import HeadToHeadGame
+from league_competition import LeagueCompetition
+from team import Team
+
+
+class SwissCompetition(LeagueCompetition):
+    # Give up looking for a round with no rematches after this many pairings are tried
+    MAX_PAIRING_STEPS = 100_000
+
+    def __init__(
+        self,
+        teams: List[Team],
+        name: str,
+        game: Type[HeadToHeadGame],
+        rng: Optional[np.random.Generator] = None,
+        n_rounds: Optional[int] = None,
+    ):
+        """Each round, teams play someone with a similar number of points.
+
+        Args:
+            n_rounds: Defaults to log2(number of teams), enough to separate out a winner
+        """
+        self._n_rounds = (
+            n_rounds if n_rounds is not None else max(1, math.ceil(math.log2(len(teams))))
+        )
+        super().__init__(teams, name, game, rng)
+
+    def __repr__(self) -> str:
+        return f"Swiss Competition: '{self.name}'"
+
+    @property
+    def n_rounds(self) -> int:
+        return self._n_rounds
+
+    def pair_round(self, round_num: int) -> Tuple[List[Tuple[Team, Team]], Optional[Team]]:
+        if round_num == 1:
+            order = list(self.teams)
+            self.rng.shuffle(order)
+        else:
+            order = [team for team, _ in self.standings]
+
+        bye = None
+        if len(order) % 2 == 1:
+            # Lowest ranked team that hasn't had a bye yet
+            bye_idx = next(
+                (idx for idx in reversed(range(len(order))) if not self.had_bye[order[idx].team_id]),
+                len(order) - 1,
+            )
+            bye = order.pop(bye_idx)
+
+        pairings = self.pair_without_rematches(order)
+        if pairings is None:
+            warn(
+                f"{self.name} round {round_num}: every pairing has a rematch, "
+                "pairing teams with their closest opponent instead"
+            )
+            pairings = self.pair_closest(order)
+        return pairings, bye
+
+    def pair_without_rematches(self, order: List[Team]) -> Optional[List[Tuple[Team, Team]]]:
+        """Pairs each team with the closest team below them in order that they haven't played.
+
+        If the teams left at the bottom have all played each other, earlier pairings are undone
+        and the next closest opponent tried. This almost never goes back more than a pairing or
+        two, so it's close to O(n) per round.
+
+        Returns:
+            None if there's no way to pair everyone without a rematch (or finding one takes
+            more than MAX_PAIRING_STEPS steps)
+        """
+        paired = [False] * len(order)
+        # (team index, opponent index) of each pairing so far
+        stack: List[Tuple[int, int]] = []
+        idx = 0
+        # Where to start looking for idx's opponent, None for just below idx
+        start: Optional[int] = None
+        for _ in range(self.MAX_PAIRING_STEPS):
+            while idx < len(order) and paired[idx]:
+                idx += 1
+            if idx == len(order):
+                return [(order[team_idx], order[opponent_idx]) for team_idx, opponent_idx in stack]
+
+            opponents = self.opponents[order[idx].team_id]
+            opponent_idx = next(
+                (
+                    candidate
+                    for candidate in range(idx + 1 if start is None else start, len(order))
+                    if not paired[candidate] and order[candidate].team_id not in opponents
+                ),
+                None,
+            )
+            if opponent_idx is not None:
+                paired[idx] = paired[opponent_idx] = True
+                stack.append((idx, opponent_idx))
+                start = None
+            elif stack:
+                # Try the next opponent for the last team paired
+                idx, last_opponent_idx = stack.pop()
+                paired[idx] = paired[last_opponent_idx] = False
+                start = last_opponent_idx + 1
+            else:
+                return None
+        return None
+
+    def pair_closest(self, order: List[Team]) -> List[Tuple[Team, Team]]:
+        """Pairs each team with the closest team below them, preferring ones they haven't played."""
+        unpaired = list(order)
+        pairings = []
+        while unpaired:
+            team = unpaired.pop(0)
+            opponents = self.opponents[team.team_id]
+            opponent = next(
+                (candidate for candidate in unpaired if candidate.team_id not in opponents),
+                unpaired[0],
+            )
+            unpaired.remove(opponent)
+            pairings.append((team, opponent))
+        return pairings
@@ -1,5 +1,6 @@
 import enum
 from dataclasses import dataclass
+from time import perf_counter
 from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
@@ -16,6 +17,7 @@ except ModuleNotFoundError:
     nn = FakeNN
 
 
+from team_worker import TeamWorker
 from timeout import timeout
 
 
@@ -34,11 +36,17 @@ class Team:
         neural_network: Optional[nn.Module] = None,
         pkl_file: Optional[Any] = None,
         MctsClass: Optional[type] = None,
+        use_worker_process: bool = False,
     ):
+        """A competitor. If use_worker_process is True, choose_move runs in a long-lived
+        worker process with the deadline (self.timeout, can be a fraction of a second)
+        enforced from the parent rather than with SIGALRM."""
         self.team_id = uuid4()
         self.name = name
         self._choose_move_function = choose_move_function
         self.results: List[Result] = []
+        # Wall time in seconds of every choose_move call
+        self.move_times: List[float] = []
         self.timeout = 10
         self.value_function = value_function
         self.neural_network = neural_network
@@ -46,6 +54,8 @@ class Team:
         self.MctsClass = MctsClass
         # initialised instance of the team's MCTS class
         self.mcts = MctsClass() if MctsClass is not None else None
+        self.use_worker_process = use_worker_process
+        self._worker: Optional[TeamWorker] = None
 
     def __repr__(self) -> str:
         return f"Team: {self.name}"
@@ -53,6 +63,12 @@ class Team:
     def __eq__(self, other) -> bool:
         return isinstance(other, Team) and self.team_id == other.team_id
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes can't be pickled, a copy of the team starts its own if needed
+        state = self.__dict__.copy()
+        state["_worker"] = None
+        return state
+
     def already_played(self) -> List["Team"]:
         return [result.opponent for result in self.results]
 
@@ -61,6 +77,30 @@ class Team:
         return f"{win_lose} {self.results[-1].match_name}"
 
     def choose_move(self, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return self._choose_move(**kwargs)
+        finally:
+            self.move_times.append(perf_counter() - start)
+
+    def _choose_move(self, **kwargs: Any) -> Any:
+        if self.use_worker_process:
+            if self._worker is None:
+                self._worker = TeamWorker(
+                    self.name, self._choose_move_function, self._extra_kwargs()
+                )
+            return self._worker.choose_move(self.timeout, **kwargs)
+
+        kwargs.update(self._extra_kwargs())
+
+        @timeout(self.timeout)
+        def move_with_timeout(self: Team, **kwargs: Any) -> None:
+            return self._choose_move_function(**kwargs)
+
+        return move_with_timeout(self, **kwargs)
+
+    def _extra_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
         if self.value_function is not None:
             kwargs["value_function"] = self.value_function
         if self.neural_network is not None:
@@ -69,17 +109,19 @@ class Team:
             kwargs["pkl_file"] = self.pkl_file
         if self.mcts is not None:
             kwargs["mcts"] = self.mcts
+        return kwargs
 
-        @timeout(self.timeout)
-        def move_with_timeout(self: Team, **kwargs: Any) -> None:
-            return self._choose_move_function(**kwargs)
-
-        return move_with_timeout(self, **kwargs)
+    def close(self) -> None:
+        """Shuts down the team's worker process, if it has one."""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
 
 
 @dataclass
 class Result:
-    final_board: np.ndarray
+    # None when the match log has the moves instead
+    final_board: Optional[np.ndarray]
     outcome: Outcome
     match_name: str
     opponent: Team
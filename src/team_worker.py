@@ -0,0 +1,119 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional
+
+from timeout import TimeoutException
+
+
+def _worker_loop(
+    conn: Connection, choose_move_function: Callable, extra_kwargs: Dict[str, Any]
+) -> None:
+    """Runs in the worker process. Receives kwargs for each move and sends back the move.
+
+    A None message tells the worker to shut down.
+    """
+    while True:
+        try:
+            kwargs = conn.recv()
+        except EOFError:
+            return
+        if kwargs is None:
+            return
+
+        try:
+            conn.send(("move", choose_move_function(**kwargs, **extra_kwargs)))
+        except Exception as e:
+            try:
+                conn.send(("error", e))
+            except Exception:
+                # The exception itself may not be picklable
+                conn.send(("error", RuntimeError(repr(e))))
+
+
+class TeamWorker:
+    def __init__(
+        self,
+        name: str,
+        choose_move_function: Callable,
+        extra_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """A long-lived process that runs a team's choose_move function.
+
+        The competitor's function (and any value function, network, pkl file or MCTS
+        instance) is sent to the worker once. Each move only sends the game state over a
+        pipe, and the deadline is enforced from the parent, so it works off the main thread,
+        with sub-second timeouts and even if the competitor's code hangs inside C code.
+
+        Args:
+            name: name of the team (for error messages)
+            choose_move_function: the team's choose_move function
+            extra_kwargs: passed to every choose_move call, stays in the worker process
+        """
+        self.name = name
+        self._choose_move_function = choose_move_function
+        self._extra_kwargs = extra_kwargs or {}
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Optional[Connection] = None
+
+    def __repr__(self) -> str:
+        return f"TeamWorker: {self.name}"
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_worker_loop,
+            args=(child_conn, self._choose_move_function, self._extra_kwargs),
+            name=f"{self.name} worker",
+            daemon=True,
+        )
+        self._process.start()
+        # Only the worker needs its end of the pipe
+        child_conn.close()
+
+    def choose_move(self, timeout: float, **kwargs: Any) -> Any:
+        """Asks the worker for a move, killing and restarting it if it takes too long."""
+        if not self.is_alive:
+            self.start()
+        assert self._conn is not None
+
+        self._conn.send(kwargs)
+        if not self._conn.poll(timeout):
+            self.restart()
+            raise TimeoutException(f"{self.name} took longer than {timeout}s to choose a move")
+
+        try:
+            status, value = self._conn.recv()
+        except EOFError as e:
+            self.restart()
+            raise RuntimeError(f"{self.name}'s worker process died choosing a move") from e
+
+        if status == "error":
+            raise value
+        return value
+
+    def restart(self) -> None:
+        self.kill()
+        self.start()
+
+    def kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process, self._conn = None, None
+
+    def close(self) -> None:
+        """Asks the worker to shut down nicely, killing it if it doesn't."""
+        if self.is_alive:
+            assert self._conn is not None and self._process is not None
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=1)
+        self.kill()
@@ -1,11 +1,19 @@
 import pickle
 import random
+import sys
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pygame
 
+# The table of every board is shared by all the tic-tac-toe games and lives in src
+SRC_DIR = Path(__file__).resolve().parents[2]
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+import tictactoe_table  # isort:skip
+
 WIDTH = 600
 HEIGHT = 600
 LINE_WIDTH = 15
@@ -67,47 +75,30 @@ class TictactoeMechanics:
             [Cell.EMPTY, Cell.EMPTY, Cell.EMPTY],
             [Cell.EMPTY, Cell.EMPTY, Cell.EMPTY],
         ]
+        # tictactoe_table code of self.board
+        self.code = 0
 
     def mark_square(self, row: int, col: int, player: Cell):
+        square = row * BOARD_COLS + col
+        change = (
+            tictactoe_table.DIGITS[player.value]
+            - tictactoe_table.DIGITS[self.board[row][col].value]
+        )
+        self.code += change * tictactoe_table.POWERS[square]
         self.board[row][col] = player
 
     def __repr__(self):
         return str(np.array([x.value for xs in self.board for x in xs]).reshape((3, 3))) + "\n"
 
     def is_board_full(self):
-        """Check if the board is full by checking for empty cells after flattening board."""
-        return all(c != Cell.EMPTY for c in [i for sublist in self.board for i in sublist])
+        return tictactoe_table.is_full(self.code)
 
     def update(self, move: Tuple[int, int], piece: Cell):
         self.mark_square(move[0], move[1], piece)
 
-    def _check_winning_set(self, iterable: Iterable[Cell]) -> bool:
-        unique_pieces = set(iterable)
-        return Cell.EMPTY not in unique_pieces and len(unique_pieces) == 1
-
     def _check_winner(self) -> Optional[Cell]:
-        # Check rows
-        for row in self.board:
-            if self._check_winning_set(row):
-                return row[0]
-
-        # Check columns
-        for column in [*zip(*self.board)]:
-            if self._check_winning_set(column):
-                return column[0]
-
-        # Check major diagonal
-        size = len(self.board)
-        major_diagonal = [self.board[i][i] for i in range(size)]
-        if self._check_winning_set(major_diagonal):
-            return major_diagonal[0]
-
-        # Check minor diagonal
-        minor_diagonal = [self.board[i][size - i - 1] for i in range(size)]
-        if self._check_winning_set(minor_diagonal):
-            return minor_diagonal[0]
-
-        return None
+        winner = tictactoe_table.winner(self.code)
+        return Cell.X if winner == 1 else Cell.O if winner == -1 else None
 
     def switch_player(self) -> None:
         self.player_move = Cell.X if self.player_move == Cell.O else Cell.O
@@ -119,8 +110,8 @@ class TictactoeMechanics:
         assert not self.done, "Game is done. Call reset() before taking further steps."
 
         row, col = convert_to_indices(action)
-        assert (
-            self.board[row][col] == Cell.EMPTY
+        assert action in tictactoe_table.legal_moves(
+            self.code
         ), "You moved onto a square that already has a counter on it!"
 
         self.mark_square(row, col, self.player_move)
@@ -152,6 +143,7 @@ class TictactoeMechanics:
             [Cell.EMPTY, Cell.EMPTY, Cell.EMPTY],
             [Cell.EMPTY, Cell.EMPTY, Cell.EMPTY],
         ]
+        self.code = 0
 
         self.player_move = random.choice([Cell.X, Cell.O])
         self.done = False
@@ -268,9 +260,17 @@ def convert_to_indices(number: int) -> Tuple[int, int]:
 
 
 def robot_choose_move(board):
-    possible_moves = [tuple(tup) for tup in np.array(np.where(np.array(board) == Cell.EMPTY)).T]
+    """Random empty square, as (row, col), of a 3x3 board of Cells."""
+    code = tictactoe_table.board_code(cell for row in board for cell in row)
+    return convert_to_indices(int(np.random.choice(tictactoe_table.legal_moves(code))))
+
+
+def choose_move_perfectly(board: List[int]) -> int:
+    """Never loses: a random move out of those with the best minimax value.
 
-    return possible_moves[np.random.choice(range(len(possible_moves)))]
+    Takes the same flattened board as choose_move() (1 is yours, -1 the opponent's).
+    """
+    return random.choice(tictactoe_table.best_moves(tictactoe_table.board_code(board), 1))
 
 
 def render(choose_move: Callable[[List[int], Dict], int], player_dict: Dict):
@@ -1,12 +1,16 @@
-import random
 from dataclasses import dataclass
+from typing import Optional
 
+import numpy as np
+
+import tictactoe_table
 from game_parent import HeadToHeadGame
 from team import Team
 from tictactoe.competitor_code import team4_choose_move
 from tictactoe.competitor_code.game_mechanics import (
     Cell,
     TictactoeMechanics,
+    choose_move_perfectly,
     convert_to_indices,
     flatten_board,
 )
@@ -21,6 +25,8 @@ class Turn:
 class TictactoeGame(HeadToHeadGame, TictactoeMechanics):
     NAME = "Tictactoe"
     ROBOT_PLAYER = Team("Robot", team4_choose_move)
+    # For checking a solution against
+    PERFECT_PLAYER = Team("Perfect Robot", choose_move_perfectly)
 
     def __init__(
         self,
@@ -28,6 +34,7 @@ class TictactoeGame(HeadToHeadGame, TictactoeMechanics):
         team_b: Team,
         name: str,
         is_friendly: bool = False,
+        rng: Optional[np.random.Generator] = None,
     ):
         HeadToHeadGame.__init__(
             self,
@@ -35,49 +42,54 @@ class TictactoeGame(HeadToHeadGame, TictactoeMechanics):
             team_b,
             name,
             is_friendly,
+            rng=rng,
         )
         TictactoeMechanics.__init__(self)
         self.cell_to_team = {Cell.X: team_a, Cell.O: team_b}
 
     def reset_game(self):
         super(TictactoeGame, self).reset_game()
-        self.restart()
+        self.reset()
 
     def step(self) -> None:
         if self.completed:
             return
         if self.is_game_over() and self.winner is None:
+            self.log_board_end()
             self.reset_game()
             return
         flat_board = flatten_board(self.board)
         move = self.next_to_play.choose_move(flat_board)
-        poss_move_list = poss_moves(flat_board)
+        poss_move_list = tictactoe_table.legal_moves(self.code)
         if move not in poss_move_list:
             print(
                 f"{self.next_to_play.name} failed to play a move! Their move was: {move}"
             )
-            move = random.choice(poss_move_list)
+            move = poss_move_list[self.rng.integers(len(poss_move_list))]
         move_tuple = convert_to_indices(move)
         piece = Cell.X if self.next_to_play == self.team_a else Cell.O
+        # Keeps self.code up to date too
         self.update(move_tuple, piece)
+        self.log_move(move)
         self.player_turn *= -1
 
         if self.is_game_over() and any(
             score != 0 for score in [self.team_a_score, self.team_b_score]
         ):
+            self.log_board_end()
             self.complete()
 
     def is_game_over(self) -> bool:
-        winner = self._check_winner()
+        winner = tictactoe_table.winner(self.code)
 
-        if winner is not None:
-            if self.cell_to_team[winner] == self.team_a:
+        if winner != 0:
+            if self.cell_to_team[Cell.X if winner == 1 else Cell.O] == self.team_a:
                 self.team_a_score += 1
             else:
                 self.team_b_score += 1
             return True
 
-        is_draw = self.is_board_full()
+        is_draw = tictactoe_table.is_full(self.code)
         if is_draw:
             return is_draw
 
@@ -0,0 +1,161 @@
+"""Everything about every tic-tac-toe board, worked out once and looked up by board code.
+
+A board's code is its 9 squares as a base 3 number (square 0 is the lowest digit): 0 for
+empty, 1 for X and 2 for O. There are only 3^9 = 19683 codes, so the table is built the
+first time it's needed, saved next to this file and memory-mapped after that, so each
+process running games shares the same copy.
+
+Values are minimax values for the player about to move: 1 if they can force a win, 0 for a
+draw and -1 if they lose against perfect play. In regular tic-tac-toe that depends on which
+counter they play, in wild tic-tac-toe (either player places X or O and any line of 3 wins)
+it doesn't.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+TABLE_PATH = Path(__file__).parent / "tictactoe_table.npy"
+
+N_SQUARES = 9
+N_CODES = 3**N_SQUARES
+POWERS = [3**square for square in range(N_SQUARES)]
+LINES = [
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+]
+
+# Digit for each way a square is written: ints, strings or Cell enums (via their value)
+DIGITS = {0: 0, 1: 1, -1: 2, " ": 0, "X": 1, "O": 2}
+
+# Columns of the table
+WINNER = 0  # 1 if X has a line, -1 if O has a line, otherwise 0
+FULL = 1
+LEGAL = 2  # Bit n is set if square n is empty
+X_VALUE = 3  # Value for the player to move if they play X (regular tic-tac-toe)
+O_VALUE = 4  # Value for the player to move if they play O (regular tic-tac-toe)
+WILD_VALUE = 5  # Value for the player to move in wild tic-tac-toe
+
+# Empty squares for every LEGAL bitmask
+_MOVES = [[square for square in range(N_SQUARES) if mask >> square & 1] for mask in range(2**9)]
+
+_TABLE: Optional[np.ndarray] = None
+
+
+def build_table() -> np.ndarray:
+    codes = np.arange(N_CODES)
+    squares = np.stack([(codes // power) % 3 for power in POWERS], axis=1)
+    counters = np.where(squares == 2, -1, squares)
+
+    table = np.zeros((N_CODES, 6), dtype=np.int16)
+    for line in LINES:
+        line_counters = counters[:, line]
+        has_line = np.all(line_counters == line_counters[:, :1], axis=1) & (
+            line_counters[:, 0] != 0
+        )
+        table[:, WINNER] = np.where(
+            (table[:, WINNER] == 0) & has_line, line_counters[:, 0], table[:, WINNER]
+        )
+    table[:, FULL] = np.all(squares != 0, axis=1)
+    table[:, LEGAL] = (squares == 0) @ (1 << np.arange(N_SQUARES))
+
+    # Work back from full boards, each position's value comes from the positions after it
+    n_counters = np.sum(squares != 0, axis=1)
+    finished = (table[:, WINNER] != 0) | (table[:, FULL] == 1)
+    # A line on the board means the player who just moved won
+    for column in [X_VALUE, O_VALUE, WILD_VALUE]:
+        table[:, column] = np.where(table[:, WINNER] != 0, -1, 0)
+
+    for n in range(N_SQUARES - 1, -1, -1):
+        to_update = codes[(n_counters == n) & ~finished]
+        best = {column: np.full(len(to_update), -2) for column in [X_VALUE, O_VALUE, WILD_VALUE]}
+        for square in range(N_SQUARES):
+            empty = squares[to_update, square] == 0
+            for digit, column, next_column in [(1, X_VALUE, O_VALUE), (2, O_VALUE, X_VALUE)]:
+                # Codes of full squares aren't valid moves, so look up code 0 and ignore it
+                children = np.where(empty, to_update + digit * POWERS[square], 0)
+                for move_column, child_column in [(column, next_column), (WILD_VALUE, WILD_VALUE)]:
+                    child_value = np.where(empty, -table[children, child_column], -2)
+                    best[move_column] = np.maximum(best[move_column], child_value)
+        for column, value in best.items():
+            table[to_update, column] = value
+    return table
+
+
+def get_table() -> np.ndarray:
+    """The table, built and saved the first time it's needed and memory-mapped after."""
+    global _TABLE
+    if _TABLE is None:
+        try:
+            if not TABLE_PATH.exists():
+                # Written to a temporary file first so other processes never see half a table
+                temp_path = TABLE_PATH.with_name(f"{TABLE_PATH.stem}_{os.getpid()}.npy")
+                np.save(temp_path, build_table())
+                os.replace(temp_path, TABLE_PATH)
+            # Viewed as a plain array so lookups skip np.memmap's __getitem__
+            _TABLE = np.load(TABLE_PATH, mmap_mode="r").view(np.ndarray)
+        except OSError:
+            _TABLE = build_table()
+    return _TABLE
+
+
+def board_code(board: Iterable) -> int:
+    """Code of a board given as 9 squares of 0, 1 and -1, " ", "X" and "O" or Cell enums."""
+    code = 0
+    for square, power in zip(board, POWERS):
+        code += DIGITS[getattr(square, "value", square)] * power
+    return code
+
+
+def place(code: int, square: int, counter: int) -> int:
+    """Code after counter (1 for X, -1 for O) is placed on an empty square."""
+    return code + DIGITS[counter] * POWERS[square]
+
+
+def winner(code: int) -> int:
+    """1 if X has 3 in a row, -1 if O does, otherwise 0."""
+    return int(get_table()[code, WINNER])
+
+
+def is_full(code: int) -> bool:
+    return bool(get_table()[code, FULL])
+
+
+def legal_moves(code: int) -> List[int]:
+    return list(_MOVES[get_table()[code, LEGAL]])
+
+
+def value(code: int, counter: Optional[int] = None) -> int:
+    """Minimax value for the player to move, who plays counter (None for wild tic-tac-toe)."""
+    column = WILD_VALUE if counter is None else X_VALUE if counter == 1 else O_VALUE
+    return int(get_table()[code, column])
+
+
+def best_moves(code: int, counter: int) -> List[int]:
+    """Squares where counter (1 for X, -1 for O) keeps the best minimax value."""
+    table = get_table()
+    next_column = O_VALUE if counter == 1 else X_VALUE
+    values = {
+        square: -table[place(code, square, counter), next_column] for square in legal_moves(code)
+    }
+    best = max(values.values())
+    return [square for square, square_value in values.items() if square_value == best]
+
+
+def best_wild_moves(code: int) -> List[Tuple[int, int]]:
+    """(square, counter) moves that keep the best minimax value in wild tic-tac-toe."""
+    table = get_table()
+    values = {
+        (square, counter): -table[place(code, square, counter), WILD_VALUE]
+        for square in legal_moves(code)
+        for counter in [1, -1]
+    }
+    best = max(values.values())
+    return [move for move, move_value in values.items() if move_value == best]
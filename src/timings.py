@@ -0,0 +1,61 @@
+import csv
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+SUMMARY_FIELDS = ["count", "total", "mean", "p50", "p95", "max"]
+
+
+class Timings:
+    def __init__(self) -> None:
+        """Wall-clock durations (in seconds) grouped by a name, e.g. 'step' or 'redraw'."""
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name].append(perf_counter() - start)
+
+    def add(self, name: str, durations: List[float]) -> None:
+        self.durations[name] += durations
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {name: summarise(durations) for name, durations in self.durations.items()}
+
+
+def summarise(durations: List[float]) -> Dict[str, float]:
+    """count, total, mean, p50, p95 and max of a list of durations."""
+    if not durations:
+        return {field: 0.0 for field in SUMMARY_FIELDS}
+    array = np.asarray(durations)
+    return {
+        "count": len(array),
+        "total": float(array.sum()),
+        "mean": float(array.mean()),
+        "p50": float(np.percentile(array, 50)),
+        "p95": float(np.percentile(array, 95)),
+        "max": float(array.max()),
+    }
+
+
+def write_timing_report(report: Dict[str, Dict[str, Dict[str, float]]], path: Path) -> None:
+    """Writes {category: {name: summary}} to <path>.json and <path>.csv (one row per name)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with (path.parent / f"{path.name}.json").open("w") as file:
+        json.dump(report, file, indent=2)
+
+    with (path.parent / f"{path.name}.csv").open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["category", "name"] + SUMMARY_FIELDS)
+        for category, summaries in report.items():
+            for name, summary in summaries.items():
+                writer.writerow([category, name] + [summary[field] for field in SUMMARY_FIELDS])
@@ -1,4 +1,6 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from competition_controller import wait_for_click
 from delta_tron.game_mechanics import BIKE_COLORS, TronEnv
@@ -26,9 +28,15 @@ class TronGame(HeadToHeadGame):
         team_a: Team,
         team_b: Team,
         name: str,
+        rng: Optional[np.random.Generator] = None,
     ):
         super().__init__(
-            team_a, team_b, name, team_a_color=BIKE_COLORS[0], team_b_color=BIKE_COLORS[1]
+            team_a,
+            team_b,
+            name,
+            team_a_color=BIKE_COLORS[0],
+            team_b_color=BIKE_COLORS[1],
+            rng=rng,
         )
 
         # Choose the first team as the "team_a" so can use the game_mechanics env directly
@@ -36,7 +44,7 @@ class TronGame(HeadToHeadGame):
         self.team_b = team_b
 
         self.env = TronEnv(
-            opponent_choose_move=self.team_b.choose_move,
+            opponent_choose_move=self.choose_team_b_move,
             verbose=False,
             render=False,  # Call render ourselves
             game_speed_multiplier=100000,
@@ -62,6 +70,12 @@ class TronGame(HeadToHeadGame):
         self.env.reset()
         self.game_ranking: Dict[str, int] = {}
 
+    def choose_team_b_move(self, *args, **kwargs) -> Any:
+        """team_b's moves are chosen inside the env, this logs them as they're made."""
+        move = self.team_b.choose_move(*args, **kwargs)
+        self.log_move(move, player=-1)
+        return move
+
     def step(self) -> None:
         if self.completed:
             return
@@ -72,6 +86,7 @@ class TronGame(HeadToHeadGame):
             self.reset_game()
 
         team_a_action = self.team_a.choose_move(state=self.env.state)
+        self.log_move(team_a_action, player=1)
         _, reward, done, _ = self.env.step(team_a_action)
 
         if done:
@@ -83,6 +98,7 @@ class TronGame(HeadToHeadGame):
             else:
                 self.team_a_score += 1
                 self.team_b_score += 1
+            self.log_board_end()
             if any(score >= self.WIN_THRESHOLD for score in [self.team_a_score, self.team_b_score]):
                 self.play_state = PlayState.COMPLETED
             else:
@@ -7,10 +7,8 @@ This is a set of functions and classes written by Delta to be used by you during
 Read the README for more info!!
 """
 import enum
-import random
-from collections import Counter
 from time import sleep
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 
@@ -52,12 +50,14 @@ def get_possible_moves(grid: np.ndarray) -> List[Action]:
         a list of the actions that are valid for this game state (grid)
     """
 
-    grid_copy = grid.copy()
-    return [
-        move
-        for move in [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT]
-        if not np.all(grid == update_grid(grid_copy, move))
-    ]
+    board = pack_grid(grid)
+    if board is None:
+        return [
+            move
+            for move in [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT]
+            if not np.all(grid == _update_grid_unpacked(grid.copy(), move))
+        ]
+    return possible_moves_packed(board)
 
 
 def slide_up(grid: np.ndarray) -> np.ndarray:
@@ -97,6 +97,12 @@ def combine_tiles_vertically(grid: np.ndarray) -> np.ndarray:
         grid: np.ndarray (4,4) with a 2048 game state, updated with vertical combinations of adjacent tiles with the same value
     """
 
+    return _combine_tiles_vertically(grid)[0]
+
+
+def _combine_tiles_vertically(grid: np.ndarray) -> Tuple[np.ndarray, int]:
+    """combine_tiles_vertically() and the score: the sum of the new tiles, as in move_packed()."""
+    score = 0
     for row_idx, row in enumerate(grid):
         for col_idx, item in enumerate(row):
             if item != 0:
@@ -107,13 +113,14 @@ def combine_tiles_vertically(grid: np.ndarray) -> np.ndarray:
                         # merge those mfs
                         grid[row_idx, col_idx] = 2 * item
                         grid[row_idx + item_below_count + 1, col_idx] = 0
+                        score += 2 * item
                         break
-    return grid
+    return grid, score
 
 
 def update_grid(grid: np.ndarray, action: Action) -> np.ndarray:
-    """Takes a grid and an action and returns the updated grid. Depends on functions
-    'combine_tiles_vertically' and 'slide_up'.
+    """Takes a grid and an action and returns the updated grid. Gives the same result as
+    'combine_tiles_vertically' then 'slide_up' on the rotated grid, using the packed board tables.
 
     Args:
         grid: np.ndarray (4,4). An array representing a 2048 game state.
@@ -122,10 +129,23 @@ def update_grid(grid: np.ndarray, action: Action) -> np.ndarray:
     Returns:
         grid: np.ndarray(4,4). An updated array of the game state depending on the action taken.
     """
+    board = pack_grid(grid)
+    if board is None:
+        return _update_grid_unpacked(grid, action)
+    return unpack_grid(move_packed(board, action)[0])
+
+
+def _update_grid_unpacked(grid: np.ndarray, action: Action) -> np.ndarray:
+    """update_grid() for grids that can't be packed (e.g. with tiles that aren't 2, 4, 8...)."""
+    return _move_unpacked(grid, action)[0]
+
+
+def _move_unpacked(grid: np.ndarray, action: Action) -> Tuple[np.ndarray, int]:
+    """move_packed() for grids that can't be packed: the grid after the swipe and its score."""
     grid = np.rot90(grid, action.value)
-    grid = combine_tiles_vertically(grid)
+    grid, score = _combine_tiles_vertically(grid)
     grid = slide_up(grid)
-    return np.rot90(grid, -action.value)
+    return np.rot90(grid, -action.value), score
 
 
 def is_game_over(grid: np.ndarray) -> bool:
@@ -150,12 +170,312 @@ def get_side_tiles(grid: np.ndarray) -> np.ndarray:
     return np.append(grid[1:3, 0::3], grid[0::3, 1:3])
 
 
-def sample_tile_number() -> int:
+def sample_tile_number(rng: Optional[np.random.Generator] = None) -> int:
     """Draws the number that the next tile that spawns in will be.
 
     As in the real game, 90% of the time the tile is a 2 and 10% of the time it's a 4.
+
+    Args:
+        rng: Defaults to the global np.random state
+    """
+    return int((rng if rng is not None else np.random).choice([2, 4], p=[0.9, 0.1]))
+
+
+##### FAST PACKED BOARDS - SAME RULES AS ABOVE, MUCH QUICKER FOR LOOKAHEAD
+
+# A packed board is one int: 4 bits per tile holding log2 of the tile (0 for empty), so each
+# row is 16 bits. Tile (row, col) is at bit 16 * row + 4 * col. A row can only be in 65536
+# states, so the result of sliding every possible row left or right is worked out once.
+# Moving the board is then 4 table lookups (plus a transpose for up and down).
+# Tiles can be at most 2 ** 15 = 32768.
+
+_ROW_MASK = 0xFFFF
+_SHIFTS = np.arange(16, dtype=np.uint64) * np.uint64(4)
+_tables: Optional[Tuple[List[int], List[int], List[int]]] = None
+
+
+def _reverse_row(row: int) -> int:
+    return (
+        (row >> 12) & 0xF | (row >> 4) & 0xF0 | (row << 4) & 0xF00 | (row << 12) & 0xF000
+    )
+
+
+def _slide_row_left(row: int) -> Tuple[int, int]:
+    """Returns the row after sliding left and the score from the tiles merged."""
+    tiles = [(row >> (4 * col)) & 0xF for col in range(4) if (row >> (4 * col)) & 0xF]
+    merged: List[int] = []
+    score = 0
+    while tiles:
+        tile = tiles.pop(0)
+        if tiles and tiles[0] == tile and tile < 15:
+            tiles.pop(0)
+            tile += 1
+            score += 2**tile
+        merged.append(tile)
+    return sum(tile << (4 * col) for col, tile in enumerate(merged)), score
+
+
+def _row_tables() -> Tuple[List[int], List[int], List[int]]:
+    """Rows after sliding left, rows after sliding right and the score, for every row."""
+    global _tables
+    if _tables is None:
+        left, score = zip(*(_slide_row_left(row) for row in range(_ROW_MASK + 1)))
+        right = [_reverse_row(left[_reverse_row(row)]) for row in range(_ROW_MASK + 1)]
+        _tables = list(left), right, list(score)
+    return _tables
+
+
+def pack_grid(grid: np.ndarray) -> Optional[int]:
+    """Packs a (4, 4) grid of tiles into an int, or None if a tile isn't one of 2, 4, ... 32768."""
+    exponents = np.log2(np.maximum(grid, 1)).astype(np.uint64).ravel()
+    if np.any(exponents > 15) or np.any(np.where(exponents > 0, 1 << exponents, 0) != grid.ravel()):
+        return None
+    return int(np.bitwise_or.reduce(exponents << _SHIFTS))
+
+
+def unpack_grid(board: int) -> np.ndarray:
+    """The (4, 4) grid of tiles of a packed board."""
+    exponents = (np.uint64(board) >> _SHIFTS) & np.uint64(0xF)
+    return np.where(exponents > 0, 1 << exponents.astype(int), 0).reshape(GRID_DIMS)
+
+
+def transpose_packed(board: int) -> int:
+    """Swaps rows and columns of a packed board."""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def move_packed(board: int, action: Action) -> Tuple[int, int]:
+    """Swipes a packed board (without spawning a new tile).
+
+    Returns:
+        The packed board after the swipe and the score for the swipe
+    """
+    left, right, scores = _row_tables()
+    if action in (Action.UP, Action.DOWN):
+        board = transpose_packed(board)
+    table = left if action in (Action.UP, Action.LEFT) else right
+
+    moved, score = 0, 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & _ROW_MASK
+        moved |= table[row] << shift
+        score += scores[row]
+
+    if action in (Action.UP, Action.DOWN):
+        moved = transpose_packed(moved)
+    return moved, score
+
+
+def possible_moves_packed(board: int) -> List[Action]:
+    """Actions that change a packed board, in the same order as get_possible_moves()."""
+    return [
+        move
+        for move in [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT]
+        if move_packed(board, move)[0] != board
+    ]
+
+
+def count_empty_packed(board: int) -> int:
+    return sum(((board >> (4 * tile)) & 0xF) == 0 for tile in range(16))
+
+
+##### BATCHES OF BOARDS - THOUSANDS OF GAMES AT ONCE FOR ROLLOUTS AND LOOKAHEAD
+
+# Boards in a batch are stored as log2 of each tile, shape (n_boards, 4, 4). Each row is
+# looked up in the same row tables as the packed boards, so every board moves in one go.
+# Actions are Action values: UP = 0, RIGHT = 1, DOWN = 2, LEFT = 3.
+
+_ROW_POWERS = np.array([0, 4, 8, 12])
+_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+
+def _row_arrays() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The row tables as numpy arrays."""
+    global _arrays
+    if _arrays is None:
+        left, right, scores = _row_tables()
+        _arrays = np.array(left), np.array(right), np.array(scores)
+    return _arrays
+
+
+def _slide_rows(exponents: np.ndarray, table: np.ndarray, scores: np.ndarray) -> Tuple:
+    """Slides the rows of a (n_boards, 4, 4) batch using a row table."""
+    rows = np.sum(exponents.astype(np.int64) << _ROW_POWERS, axis=-1)
+    return (table[rows][..., None] >> _ROW_POWERS) & 0xF, np.sum(scores[rows], axis=-1)
+
+
+def move_batch(exponents: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Every action applied to every board of a batch (without spawning new tiles).
+
+    Args:
+        exponents: (n_boards, 4, 4) log2 of the tiles (0 for empty)
+
+    Returns:
+        (4, n_boards, 4, 4) boards and (4, n_boards) scores, indexed by Action value first
     """
-    return np.random.choice([2, 4], p=[0.9, 0.1])
+    left, right, scores = _row_arrays()
+    transposed = exponents.transpose(0, 2, 1)
+    up, up_score = _slide_rows(transposed, left, scores)
+    down, down_score = _slide_rows(transposed, right, scores)
+    moved_right, right_score = _slide_rows(exponents, right, scores)
+    moved_left, left_score = _slide_rows(exponents, left, scores)
+    return (
+        np.stack([up.transpose(0, 2, 1), moved_right, down.transpose(0, 2, 1), moved_left]),
+        np.stack([up_score, right_score, down_score, left_score]),
+    )
+
+
+class BatchTwentyFortyEight:
+    def __init__(self, n_boards: int, rng: Optional[np.random.Generator] = None) -> None:
+        """n_boards games of 2048 played in lockstep. Finished games stay as they are."""
+        self.n_boards = n_boards
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.exponents = np.zeros((n_boards, *GRID_DIMS), dtype=np.int64)
+        self.scores = np.zeros(n_boards, dtype=np.int64)
+        self.done = np.zeros(n_boards, dtype=bool)
+        self.reset()
+
+    @classmethod
+    def from_grid(
+        cls, grid: np.ndarray, n_boards: int, rng: Optional[np.random.Generator] = None
+    ) -> "BatchTwentyFortyEight":
+        """n_boards copies of one grid, e.g. the one your choose_move() was given."""
+        batch = cls(n_boards, rng)
+        batch.exponents[:] = np.log2(np.maximum(grid, 1)).astype(np.int64)
+        batch.scores[:] = 0
+        batch.done[:] = ~np.any(batch.possible_moves, axis=1)
+        return batch
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> None:
+        """Starts new games (with 3 random tiles, as in TwentyFortyEight) where mask is True."""
+        mask = np.ones(self.n_boards, dtype=bool) if mask is None else mask
+        self.exponents[mask] = 0
+        self.scores[mask] = 0
+        for _ in range(3):
+            self._spawn_tiles(mask)
+        self.done[mask] = False
+
+    @property
+    def grids(self) -> np.ndarray:
+        """(n_boards, 4, 4) tiles, as choose_move() is given them."""
+        return np.where(self.exponents > 0, 1 << self.exponents, 0)
+
+    @property
+    def highest_tiles(self) -> np.ndarray:
+        return 1 << self.exponents.max(axis=(1, 2))
+
+    @property
+    def possible_moves(self) -> np.ndarray:
+        """(n_boards, 4) bool, True where the action (by Action value) changes the board."""
+        moved, _ = move_batch(self.exponents)
+        return np.any(moved != self.exponents, axis=(2, 3)).T
+
+    def step(self, actions: np.ndarray) -> np.ndarray:
+        """Takes an action (Action values) on every board and spawns a tile where it moved.
+
+        Boards that are already finished, or don't change with their action, stay as they are.
+
+        Returns:
+            The score from each board's move
+        """
+        actions = np.asarray(actions)
+        # Finished boards don't move
+        active = np.flatnonzero(~self.done)
+        exponents = self.exponents[active]
+        moved, move_scores = move_batch(exponents)
+        boards = np.arange(len(active))
+        moved, move_scores = moved[actions[active], boards], move_scores[actions[active], boards]
+
+        changed = np.zeros(self.n_boards, dtype=bool)
+        changed[active] = np.any(moved != exponents, axis=(1, 2))
+        self.exponents[changed] = moved[changed[active]]
+        score = np.zeros(self.n_boards, dtype=np.int64)
+        score[changed] = move_scores[changed[active]]
+        self.scores += score
+        self._spawn_tiles(changed)
+
+        moved, _ = move_batch(self.exponents[active])
+        self.done[active] = ~np.any(moved != self.exponents[active][None], axis=(0, 2, 3))
+        return score
+
+    def _spawn_tiles(self, mask: np.ndarray) -> None:
+        """A 2 (90% of the time) or a 4 on a random empty square of each board in mask."""
+        empty = (self.exponents == 0).reshape(self.n_boards, -1)
+        spawn = mask & np.any(empty, axis=1)
+        squares = np.argmax(self.rng.random(empty.shape) * empty, axis=1)
+        exponents = np.where(self.rng.random(self.n_boards) < 0.9, 1, 2)
+        flat = self.exponents.reshape(self.n_boards, -1)
+        flat[spawn, squares[spawn]] = exponents[spawn]
+
+
+def random_actions(
+    possible_moves: np.ndarray, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """A random possible action (by Action value) for each row of a possible_moves mask."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return np.argmax(rng.random(possible_moves.shape) * possible_moves, axis=1)
+
+
+def rollout_scores(
+    grid: np.ndarray,
+    n_rollouts: int,
+    first_action: Optional[Action] = None,
+    max_moves: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Plays random moves from grid (after first_action if given) n_rollouts times at once.
+
+    Returns:
+        The score each rollout gained, counting first_action
+    """
+    batch = BatchTwentyFortyEight.from_grid(grid, n_rollouts, rng)
+    if first_action is not None:
+        batch.step(np.full(n_rollouts, first_action.value))
+    n_moves = 0
+    while not np.all(batch.done) and (max_moves is None or n_moves < max_moves):
+        batch.step(random_actions(batch.possible_moves, batch.rng))
+        n_moves += 1
+    return batch.scores
+
+
+def monte_carlo_action(
+    grid: np.ndarray,
+    n_rollouts: int = 100,
+    max_moves: Optional[int] = 20,
+    rng: Optional[np.random.Generator] = None,
+) -> Action:
+    """The possible action with the highest mean score over random rollouts."""
+    mean_scores = {
+        action: np.mean(rollout_scores(grid, n_rollouts, action, max_moves, rng))
+        for action in get_possible_moves(grid)
+    }
+    return max(mean_scores, key=mean_scores.get)
+
+
+def evaluate_batch(
+    choose_actions: Callable[[np.ndarray], np.ndarray],
+    n_games: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Plays n_games at once until they are all over.
+
+    Args:
+        choose_actions: Takes (n_games, 4, 4) grids and returns an Action value for each
+
+    Returns:
+        Final score of each game
+    """
+    batch = BatchTwentyFortyEight(n_games, rng)
+    while not np.all(batch.done):
+        batch.step(np.asarray(choose_actions(batch.grids)))
+    return batch.scores
 
 
 ##################################################################
@@ -164,7 +484,12 @@ def sample_tile_number() -> int:
 
 
 class TwentyFortyEight:
-    def __init__(self, competition: bool = False) -> None:
+    def __init__(
+        self, competition: bool = False, rng: Optional[np.random.Generator] = None
+    ) -> None:
+        """A game of 2048. Where tiles spawn, and the move played instead of an invalid one in
+        competition, are drawn from rng."""
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.reset()
         self.display_board()
         self.competition = competition
@@ -173,9 +498,9 @@ class TwentyFortyEight:
     def reset(self) -> None:
         self.score = 0
         self.board = self.blank_board
-        chosen_tile_ints = np.random.choice(range(16), replace=False, size=3)
+        chosen_tile_ints = self.rng.choice(16, replace=False, size=3)
         for tile_location in chosen_tile_ints:
-            self.board[tile_location // 4, tile_location % 4] = sample_tile_number()
+            self.board[tile_location // 4, tile_location % 4] = sample_tile_number(self.rng)
 
     def __repr__(self) -> str:
         """Return a string representation of the game state such that x and y are correctly
@@ -201,25 +526,29 @@ class TwentyFortyEight:
                 action in self.possible_actions
             ), f"Action: {action} not one of the possible actions: {self.possible_actions}"
         elif action.value not in [poss.value for poss in self.possible_actions]:
-            action = random.choice(self.possible_actions)
+            possible_actions = self.possible_actions
+            action = possible_actions[self.rng.integers(len(possible_actions))]
 
         self.last_move = action
 
         # Update the board
-        self.board = np.rot90(self.board, k=action.value)
-        self.combine_tiles()
-        self.slide_up()
+        board = pack_grid(self.board)
+        if board is None:
+            self.board, score = _move_unpacked(self.board, action)
+        else:
+            board, score = move_packed(board, action)
+            self.board = unpack_grid(board)
+        self.score += score
         self.spawn_new_tile()
-        self.board = np.rot90(self.board, k=-action.value)
         if not self.competition:
             self.display_board()
 
     def spawn_new_tile(self) -> None:
         """Spawn a new tile."""
         assert not self.game_over
-        self.board[
-            random.choice([tuple(loc) for loc in self.empty_locations])
-        ] = sample_tile_number()
+        empty_locations = self.empty_locations
+        location = tuple(empty_locations[self.rng.integers(len(empty_locations))])
+        self.board[location] = sample_tile_number(self.rng)
 
     def slide_up(self) -> None:
         """Slide all tiles up."""
@@ -227,13 +556,8 @@ class TwentyFortyEight:
 
     def combine_tiles(self) -> None:
         """Combine all tiles that can be combined vertically."""
-        tiles_before_combining = Counter([tile for row in self.board for tile in row])
-        self.board = combine_tiles_vertically(self.board)
-        tiles_after_combining = Counter([tile for row in self.board for tile in row])
-        for tile, post_count in tiles_after_combining.items():
-            pre_count = tiles_before_combining.get(tile, 0)
-            if post_count > pre_count:
-                self.score += (post_count - pre_count) * tile
+        self.board, score = _combine_tiles_vertically(self.board)
+        self.score += score
 
     def display_board(self) -> None:
         print(self, "\n")
@@ -251,11 +575,7 @@ class TwentyFortyEight:
     @property
     def possible_actions(self) -> List["Action"]:
         """Return a list of all possible actions."""
-        return [
-            move
-            for move in [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT]
-            if np.any(self.board != update_grid(self.board.copy(), move))
-        ]
+        return get_possible_moves(self.board)
 
     @property
     def blank_board(self) -> np.ndarray:
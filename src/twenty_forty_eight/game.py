@@ -1,3 +1,7 @@
+from typing import Optional
+
+import numpy as np
+
 from game_parent import PlayState, PointsGame
 from team import Team
 from twenty_forty_eight.competitor_code import TwentyFortyEight, robot_choose_move
@@ -11,13 +15,15 @@ class TwentyFortyEightGame(PointsGame, TwentyFortyEight):
         self,
         name: str,
         team: Team,
+        rng: Optional[np.random.Generator] = None,
     ):
         PointsGame.__init__(
             self,
             name,
             team,
+            rng=rng,
         )
-        TwentyFortyEight.__init__(self, competition=True)
+        TwentyFortyEight.__init__(self, competition=True, rng=self.rng)
 
     def step(self) -> None:
         if self.completed:
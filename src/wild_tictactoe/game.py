@@ -1,24 +1,33 @@
-import random
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+import tictactoe_table
 from delta_wild_tictactoe.game_mechanics import Cell, WildTictactoeEnv
-from delta_wild_tictactoe.game_mechanics import (
-    choose_move_randomly as robot_choose_move,
-)
-from delta_wild_tictactoe.game_mechanics import (
-    get_empty_board,
-    is_board_full,
-    is_winner,
-    place_counter,
-)
-from game_parent import HeadToHeadGame
+from delta_wild_tictactoe.game_mechanics import get_empty_board, place_counter
+from game_parent import HeadToHeadGame, random_choice
 from team import Team
 
 TEAM_A_COLOR = (245, 66, 96)
 TEAM_B_COLOR = (16, 181, 227)
 
 
+def robot_choose_move(board: List, rng: Optional[np.random.Generator] = None) -> Tuple[int, str]:
+    """Random counter on a random empty square."""
+    move = random_choice(tictactoe_table.legal_moves(tictactoe_table.board_code(board)), rng)
+    return move, random_choice([Cell.X, Cell.O], rng)
+
+
+def choose_move_perfectly(
+    board: List, rng: Optional[np.random.Generator] = None
+) -> Tuple[int, str]:
+    """A random counter and square out of those with the best minimax value."""
+    code = tictactoe_table.board_code(board)
+    move, counter = random_choice(tictactoe_table.best_wild_moves(code), rng)
+    return move, Cell.X if counter == 1 else Cell.O
+
+
 @dataclass
 class Turn:
     row: int
@@ -27,13 +36,17 @@ class Turn:
 
 class WildTictactoeGame(HeadToHeadGame):
     NAME = "Wild Tictactoe"
+    # Fills empty slots in the draw, so it plays randomly to make a bye winnable
     ROBOT_PLAYER = Team("Robot", robot_choose_move)
+    # For checking a solution against
+    PERFECT_PLAYER = Team("Perfect Robot", choose_move_perfectly)
 
     def __init__(
         self,
         team_a: Team,
         team_b: Team,
         name: str,
+        rng: Optional[np.random.Generator] = None,
     ):
 
         HeadToHeadGame.__init__(
@@ -44,6 +57,7 @@ class WildTictactoeGame(HeadToHeadGame):
             TEAM_A_COLOR,
             TEAM_B_COLOR,
             both_teams_progress_on_draw=True,
+            rng=rng,
         )
         WildTictactoeEnv.__init__(self)
         self.game_over = False
@@ -52,6 +66,8 @@ class WildTictactoeGame(HeadToHeadGame):
         self.robot_first_move = False
         self.robot_first_move_location: Optional[Tuple] = None
         self.board = get_empty_board()
+        # tictactoe_table code of self.board
+        self.code = 0
 
     def reset_game(self) -> None:
         self.player_turn = int(self.went_first) * -1
@@ -59,6 +75,7 @@ class WildTictactoeGame(HeadToHeadGame):
         super(WildTictactoeGame, self).reset_game()
         self.game_over = False
         self.board = get_empty_board()
+        self.code = 0
 
     def step(self) -> None:
         if self.completed:
@@ -71,14 +88,14 @@ class WildTictactoeGame(HeadToHeadGame):
             return
 
         # Random first tile if there's no conclusive winner after 2 games.
-        if self.board.count(" ") == 9 and self.n_games_round >= 2:
+        if self.code == 0 and self.n_games_round >= 2:
             # We switch turn order because a move is always taken at random at the start.
             # This way the player who plays first alternates in the same order:
             # I.e. if team A goes first in game 1, they go first in game 3, 5, 7 etc.
             self.player_turn *= -1
 
             if self.robot_first_move_location is None:
-                move, counter = robot_choose_move(self.board.copy())
+                move, counter = robot_choose_move(self.board.copy(), self.rng)
                 self.robot_first_move_location = (move, counter)
             else:
                 # Alternate between picking randomly and using the last randomly-picked move.
@@ -88,25 +105,36 @@ class WildTictactoeGame(HeadToHeadGame):
             self.robot_first_move = True
         else:
             try:
-                move, counter = self.next_to_play.choose_move(board=self.board.copy())
+                # Robots draw from the game's rng so seeded games are reproducible
+                robot_kwargs = (
+                    {"rng": self.rng}
+                    if self.next_to_play in [self.ROBOT_PLAYER, self.PERFECT_PLAYER]
+                    else {}
+                )
+                move, counter = self.next_to_play.choose_move(
+                    board=self.board.copy(), **robot_kwargs
+                )
             except Exception as e:
                 print(
                     f"Invalid move from {self.next_to_play.name} choosing move randomly"
                 )
-                move, counter = robot_choose_move(board=self.board.copy())
+                move, counter = robot_choose_move(board=self.board.copy(), rng=self.rng)
 
             self.robot_first_move = False
 
-        poss_move_list = poss_moves(self.board)
+        poss_move_list = tictactoe_table.legal_moves(self.code)
         if move not in poss_move_list:
             raise ValueError(
                 f"{self.next_to_play.name} failed to play a move! Their move was: {move}, possible moves: {poss_move_list}"
             )
 
         self.board = place_counter(self.board, move, counter)
+        self.code = tictactoe_table.place(self.code, move, 1 if counter == Cell.X else -1)
+        self.log_move((move, 1 if counter == Cell.X else -1))
         self.game_over = self.is_game_over()
 
         if self.game_over:
+            self.log_board_end()
             if self.is_draw():
                 self.n_consec_draws += 1
             else:
@@ -127,7 +155,7 @@ class WildTictactoeGame(HeadToHeadGame):
         self.player_turn *= -1
 
     def check_win(self) -> bool:
-        if is_winner(self.board):
+        if tictactoe_table.winner(self.code) != 0:
             if self.next_to_play == self.team_a:
                 self.team_a_score += 1
             else:
@@ -136,7 +164,7 @@ class WildTictactoeGame(HeadToHeadGame):
         return False
 
     def is_draw(self) -> bool:
-        return is_board_full(self.board)
+        return tictactoe_table.is_full(self.code)
 
     def is_game_over(self) -> bool:
         return self.check_win() or self.is_draw()
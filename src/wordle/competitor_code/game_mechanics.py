@@ -1,17 +1,19 @@
 import copy
 import os
 import pickle
-import random
 import time
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 
 from possible_words import possible_words
+from tile_colors import WORD_INDEX, tile_colors
 from visualisation import WorldleVisualisationController
 
 possible_words = possible_words()
 
+FREQUENCY_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "word_use_frequency.pkl")
+
 
 ############ Please do not edit this file!!!!! ###########################
 
@@ -44,6 +46,8 @@ def get_wordle_tile_colors(answer: str, guess: str) -> List[int]:
     ), f"answer must be a string, instead is {type(answer)}"
     assert isinstance(guess, str), f"guess must be a string, instead is {type(guess)}"
     assert len(answer) == len(guess), "answer and guess must be the same length"
+    if answer in WORD_INDEX and guess in WORD_INDEX:
+        return tile_colors(answer, guess)
     result = [0] * 5
 
     # Greens
@@ -91,20 +95,57 @@ def play_n_games(take_action: Callable[[dict], str], number_of_games: int) -> fl
     return n_guesses / number_of_games
 
 
+_frequencies: Optional[Dict[str, int]] = None
+# Cumulative word weights for each weight_strength used so far
+_cdfs: Dict[float, np.ndarray] = {}
+
+
+def word_frequencies() -> Dict[str, int]:
+    """Rank of each possible word in the word use frequency list, loaded once per process."""
+    global _frequencies
+    if _frequencies is None:
+        with open(FREQUENCY_PATH, "rb") as f:
+            _frequencies = pickle.load(f)
+    return _frequencies
+
+
+def word_cdf(weight_strength: float = 1) -> np.ndarray:
+    """Cumulative probability of each word in possible_words being the answer."""
+    if weight_strength not in _cdfs:
+        freq = word_frequencies()
+        weights = np.array([(1 / (freq[word] ** weight_strength)) for word in possible_words])
+        cdf = np.cumsum(weights)
+        _cdfs[weight_strength] = cdf / cdf[-1]
+    return _cdfs[weight_strength]
+
+
+def weighted_random_word(rng: np.random.Generator, weight_strength: float = 1) -> str:
+    """Picks a word from possible_words, weighted by how common it is.
+
+    Gives the same word as rng.choice(possible_words, p=weights) would.
+    """
+    index = np.searchsorted(word_cdf(weight_strength), rng.random(), side="right")
+    return possible_words[index]
+
+
 class Wordle:
-    def __init__(self, team_name: str, game_speed_multiplier: float) -> None:
+    def __init__(
+        self, team_name: str, game_speed_multiplier: float, random_seed: Optional[int] = None
+    ) -> None:
         self.n_guesses_allowed = 6
         self.team_name = team_name
         self.game_speed_multiplier = game_speed_multiplier
         self.visualisation_controller = WorldleVisualisationController(
             self.team_name, self.game_speed_multiplier
         )
-        self.reset(np.random.randint(0, 100))
+        self.reset(random_seed if random_seed is not None else np.random.randint(0, 100))
 
     def reset(self, random_seed: int = 42) -> None:
         self.game_over = False
         self.solved = False
         self.n_guesses = 0
+        # Picks the word and any replacement guesses, so the seed reproduces the game
+        self._rng = np.random.default_rng(random_seed)
         self._word = self.weighted_random_word(random_seed)
         self.previous_guesses: Dict[str, List[int]] = {}
         self.visualisation_controller.reset()
@@ -114,21 +155,7 @@ class Wordle:
 
         ~5% of the time, and "their" the second most common ~2.8% of the time.
         """
-
-        # Fix path
-        np.random.seed(random_seed)
-        with open(
-            os.path.join(
-                os.path.dirname(os.path.realpath(__file__)), "word_use_frequency.pkl"
-            ),
-            "rb",
-        ) as f:
-            freq = pickle.load(f)
-        weights = np.array(
-            [(1 / (freq[word] ** weight_strength)) for word in possible_words]
-        )
-        weights = weights / np.sum(weights)
-        return np.random.choice(possible_words, p=weights)
+        return weighted_random_word(np.random.default_rng(random_seed), weight_strength)
 
     def make_guess(self, guess: str) -> List[int]:
 
@@ -137,9 +164,9 @@ class Wordle:
             len(guess) == 5
         ), f"Invalid guess. You guessed: {guess}\n\nGuesses must be 5 letters long"
         assert (
-            guess in possible_words
+            guess in WORD_INDEX
         ), f"Invalid guess. You guessed: {guess}\n\nGuess must be in the possible_words list"
-        return get_wordle_tile_colors(self._word, guess)
+        return tile_colors(self._word, guess)
 
     def play_standalone_game(self, take_action: Callable[[dict], str]) -> None:
 
@@ -155,13 +182,13 @@ class Wordle:
         try:
             guess = take_action(self.previous_guesses).lower()
         except:
-            guess = random.choice(possible_words)
+            guess = str(self._rng.choice(possible_words))
         result = None
         while result is None:
             try:
                 result = self.make_guess(guess)
             except:
-                guess = random.choice(possible_words)
+                guess = str(self._rng.choice(possible_words))
         if display:
             self.visualisation_controller.display_word(guess, result)
         self.previous_guesses[guess] = result
@@ -0,0 +1,103 @@
+"""The tile colors for every guess and answer in possible_words, worked out once.
+
+Colors are stored as a pattern: the 5 colors as a base 3 number (the first letter is the
+lowest digit), so a pattern fits in a byte and 242 means every letter is green. The table
+is built the first time it's needed, saved next to this file and memory-mapped after that,
+so each process playing games shares the same copy.
+
+    table = get_table()
+    table[WORD_INDEX[guess], WORD_INDEX[answer]]  # pattern for guess when the answer is answer
+
+Solvers can keep the words still possible as an array of word indexes and narrow it down
+after each guess with filter_candidates().
+"""
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from possible_words import possible_words
+
+TABLE_PATH = Path(__file__).parent / "tile_colors.npy"
+
+WORDS = possible_words()
+WORD_INDEX = {word: index for index, word in enumerate(WORDS)}
+
+N_LETTERS = 5
+POWERS = [3**position for position in range(N_LETTERS)]
+ALL_GREEN = 2 * sum(POWERS)
+
+_TABLE: Optional[np.ndarray] = None
+
+
+def build_table() -> np.ndarray:
+    letters = np.array([[ord(letter) for letter in word] for word in WORDS], dtype=np.uint8)
+    guesses = letters[:, None, :]
+    answers = letters[None, :, :]
+    green = guesses == answers
+
+    table = np.zeros((len(WORDS), len(WORDS)), dtype=np.uint8)
+    for position in range(N_LETTERS):
+        letter = guesses[:, :, position]
+        # Times this letter is in the answer, not counting greens
+        in_answer = sum(
+            (answers[:, :, other] == letter) & ~green[:, :, other] for other in range(N_LETTERS)
+        )
+        # Times this letter comes earlier in the guess without being green
+        earlier = sum(
+            (guesses[:, :, other] == letter) & ~green[:, :, other] for other in range(position)
+        )
+        yellow = ~green[:, :, position] & (in_answer > earlier)
+        table += (2 * green[:, :, position] + yellow).astype(np.uint8) * POWERS[position]
+    return table
+
+
+def get_table() -> np.ndarray:
+    """The table, built and saved the first time it's needed and memory-mapped after."""
+    global _TABLE
+    if _TABLE is None:
+        try:
+            if not TABLE_PATH.exists():
+                # Written to a temporary file first so other processes never see half a table
+                temp_path = TABLE_PATH.with_name(f"{TABLE_PATH.stem}_{os.getpid()}.npy")
+                np.save(temp_path, build_table())
+                os.replace(temp_path, TABLE_PATH)
+            # Viewed as a plain array so lookups skip np.memmap's __getitem__
+            _TABLE = np.load(TABLE_PATH, mmap_mode="r").view(np.ndarray)
+        except OSError:
+            _TABLE = build_table()
+    return _TABLE
+
+
+def pattern(colors: List[int]) -> int:
+    """Pattern of a list of 5 tile colors."""
+    return sum(color * power for color, power in zip(colors, POWERS))
+
+
+def colors(code: int) -> List[int]:
+    """List of 5 tile colors from a pattern."""
+    return [int(code) // power % 3 for power in POWERS]
+
+
+def tile_colors(answer: str, guess: str) -> List[int]:
+    """Same as get_wordle_tile_colors(), for words in possible_words."""
+    return colors(get_table()[WORD_INDEX[guess], WORD_INDEX[answer]])
+
+
+def filter_candidates(candidates: np.ndarray, guess: str, guess_colors: List[int]) -> np.ndarray:
+    """The candidates (word indexes) that would give guess_colors if they were the answer."""
+    return candidates[get_table()[WORD_INDEX[guess], candidates] == pattern(guess_colors)]
+
+
+def remaining_candidates(previous_guesses: Dict[str, List[int]]) -> np.ndarray:
+    """Indexes of the words that could still be the answer, given the guesses so far."""
+    candidates = np.arange(len(WORDS))
+    for guess, guess_colors in previous_guesses.items():
+        candidates = filter_candidates(candidates, guess, guess_colors)
+    return candidates
+
+
+def remaining_words(previous_guesses: Dict[str, List[int]]) -> List[str]:
+    """The words that could still be the answer, given the guesses so far."""
+    return [WORDS[index] for index in remaining_candidates(previous_guesses)]
@@ -0,0 +1,143 @@
+"""Measures how well a guess_word function solves Wordle, without visuals or sleeps.
+
+Every answer in possible_words is played once (or a sample weighted by how common words
+are, like real games), with the games split across processes. From src:
+
+    python -m wordle.evaluate
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from wordle.competitor_code import (
+    WORD_INDEX,
+    possible_words,
+    robot_choose_move,
+    tile_colors,
+    weighted_random_word,
+)
+
+COMPETITOR_CODE_DIR = Path(__file__).parent.resolve() / "competitor_code"
+
+N_GUESSES_ALLOWED = 6
+
+
+@dataclass
+class WordleEvaluation:
+    name: str
+    answers: List[str]
+    # Guesses taken in each game, N_GUESSES_ALLOWED if it wasn't solved
+    n_guesses: np.ndarray
+    solved: np.ndarray
+
+    @property
+    def average_guesses(self) -> float:
+        return float(np.mean(self.n_guesses))
+
+    @property
+    def failure_rate(self) -> float:
+        return float(np.mean(~self.solved))
+
+    def worst_words(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The n answers that took the most guesses, unsolved ones first."""
+        order = np.lexsort((-self.n_guesses, self.solved))[:n]
+        return [(self.answers[index], int(self.n_guesses[index])) for index in order]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "average_guesses": self.average_guesses,
+            "failure_rate": self.failure_rate,
+        }
+
+
+def play_headless(guess_word: Callable, answer: str, seed: int = 0) -> Tuple[int, bool]:
+    """Plays one game of Wordle with the same rules as Wordle.update().
+
+    Guesses that raise an exception or aren't in possible_words are replaced by a random word,
+    picked with the seed.
+
+    Returns:
+        The number of guesses taken and whether the answer was found
+    """
+    rng = np.random.default_rng(seed)
+    previous_guesses: Dict[str, List[int]] = {}
+    for n_guesses in range(1, N_GUESSES_ALLOWED + 1):
+        try:
+            guess = guess_word(previous_guesses).lower()
+        except Exception:
+            guess = str(rng.choice(possible_words))
+        while guess not in WORD_INDEX:
+            guess = str(rng.choice(possible_words))
+        result = tile_colors(answer, guess)
+        previous_guesses[guess] = result
+        if sum(result) == 10:
+            return n_guesses, True
+    return N_GUESSES_ALLOWED, False
+
+
+def weighted_answers(n_games: int, seed: int = 0) -> List[str]:
+    """n_games answers picked the way Wordle games pick them."""
+    rng = np.random.default_rng(seed)
+    return [weighted_random_word(rng) for _ in range(n_games)]
+
+
+def evaluate(
+    guess_word: Callable,
+    answers: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    n_processes: int = 1,
+    name: str = "",
+) -> WordleEvaluation:
+    """Plays guess_word once against each answer.
+
+    Args:
+        answers: Defaults to every word in possible_words
+        n_processes: Play games in this many processes at once. guess_word must be picklable
+                     (i.e. defined at the top level of a module) if this is more than 1.
+    """
+    answers = list(possible_words if answers is None else answers)
+    seeds = np.random.default_rng(seed).integers(2**32, size=len(answers)).tolist()
+    play = partial(play_headless, guess_word)
+    if n_processes > 1:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            chunksize = max(1, len(answers) // (4 * n_processes))
+            results = list(executor.map(play, answers, seeds, chunksize=chunksize))
+    else:
+        results = [play(answer, game_seed) for answer, game_seed in zip(answers, seeds)]
+
+    n_guesses, solved = zip(*results)
+    return WordleEvaluation(name, answers, np.array(n_guesses), np.array(solved))
+
+
+def load_solutions() -> Dict[str, Callable]:
+    """guess_word from every team_ file in competitor_code, by TEAM_NAME, and the robot's."""
+    solutions = {"Robot": robot_choose_move}
+    for path in sorted(COMPETITOR_CODE_DIR.glob("team_*.py")):
+        try:
+            module = import_module(path.stem)
+        except ImportError as e:
+            print(f"Couldn't import {path.stem}: {e}")
+            continue
+        if hasattr(module, "guess_word"):
+            solutions[getattr(module, "TEAM_NAME", path.stem)] = module.guess_word
+    return solutions
+
+
+def main() -> None:
+    for name, guess_word in load_solutions().items():
+        evaluation = evaluate(guess_word, n_processes=os.cpu_count() or 1, name=name)
+        worst = ", ".join(f"{word} ({n_guesses})" for word, n_guesses in evaluation.worst_words(5))
+        print(
+            f"{name} - average guesses: {evaluation.average_guesses:.3f}, "
+            f"failure rate: {evaluation.failure_rate:.1%}, worst words: {worst}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 from game_parent import PlayState, PointsGame
@@ -15,16 +17,20 @@ class WordleGame(PointsGame, Wordle):
         self,
         name: str,
         team: Team,
+        rng: Optional[np.random.Generator] = None,
     ):
         PointsGame.__init__(
             self,
             name,
             team,
+            rng=rng,
         )
+        # Every team must get the same word, so this isn't drawn from the game's rng
         self.seed = 42
-        np.random.seed(self.seed)
         self.n_rounds = 0
-        Wordle.__init__(self, team.name, WordleGame.GAME_SPEED_MULTIPLIER)
+        Wordle.__init__(
+            self, team.name, WordleGame.GAME_SPEED_MULTIPLIER, random_seed=self.seed
+        )
         self.n_total_guesses = 0
         self.total_rounds = 6
         self.n_rounds_solved = 0
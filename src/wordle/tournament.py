@@ -2,7 +2,6 @@ import math
 import time
 from typing import Tuple
 
-import numpy as np
 import pygame
 
 from competition_controller import CompetitionController
@@ -60,7 +59,7 @@ class WorldleTournament(Observer):
         if self.n_rounds == self.N_ROUNDS_TOTAL - 1:  # lol
             return  # Game finished
         if event == Event.STATE_CHANGE:
-            random_seed = np.random.randint(0, high=100000)
+            random_seed = int(self.controller.rng.integers(0, high=100000))
             self.n_rounds += 1
             while True:  # Starts a new round with a new word
                 if pygame.event.get(pygame.MOUSEBUTTONUP):
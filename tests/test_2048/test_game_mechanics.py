@@ -1,8 +1,27 @@
 import random
+from typing import List, Tuple
 
 import numpy as np
 
-from src.twenty_forty_eight.competitor_code import Action, TwentyFortyEight
+from src.twenty_forty_eight.competitor_code import (
+    Action,
+    BatchTwentyFortyEight,
+    TwentyFortyEight,
+    get_possible_moves,
+    monte_carlo_action,
+    move_packed,
+    pack_grid,
+    random_actions,
+    rollout_scores,
+    transpose_packed,
+    unpack_grid,
+    update_grid,
+)
+from src.twenty_forty_eight.competitor_code import game_mechanics
+from src.twenty_forty_eight.competitor_code.game_mechanics import (
+    _move_unpacked,
+    _update_grid_unpacked,
+)
 
 
 def test_possible_actions() -> None:
@@ -143,3 +162,118 @@ def test_play_round() -> None:
 
     assert t.game_over
     assert np.all(t.board != 0)
+
+
+def test_pack_grid() -> None:
+    grid = np.array(
+        [
+            [2, 0, 0, 32768],
+            [4, 8, 0, 0],
+            [0, 0, 1024, 2],
+            [0, 2, 0, 0],
+        ]
+    )
+    board = pack_grid(grid)
+    assert np.all(unpack_grid(board) == grid)
+    assert np.all(unpack_grid(transpose_packed(board)) == grid.T)
+
+    assert pack_grid(np.ones((4, 4))) is None
+    assert pack_grid(np.full((4, 4), 65536)) is None
+
+
+def test_packed_moves_match_unpacked() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(1000):
+        grid = np.where(rng.random((4, 4)) < 0.3, 0, 2 ** rng.integers(1, 6, (4, 4)))
+        for action in Action:
+            assert np.all(update_grid(grid, action) == _update_grid_unpacked(grid.copy(), action))
+
+
+def test_packed_scores_match_unpacked() -> None:
+    rng = np.random.default_rng(1)
+    for _ in range(1000):
+        grid = np.where(rng.random((4, 4)) < 0.3, 0, 2 ** rng.integers(1, 6, (4, 4)))
+        for action in Action:
+            assert move_packed(pack_grid(grid), action)[1] == _move_unpacked(grid.copy(), action)[1]
+
+
+def test_update_scores_the_same_unpacked(monkeypatch) -> None:
+    def play(seed: int) -> int:
+        random.seed(seed)
+        game = TwentyFortyEight(competition=True, rng=np.random.default_rng(seed))
+        while not game.game_over:
+            game.update(lambda grid: random.choice(get_possible_moves(grid)))
+        return game.score
+
+    packed_score = play(3)
+    monkeypatch.setattr(game_mechanics, "pack_grid", lambda grid: None)
+    assert play(3) == packed_score
+
+
+def test_game_is_seeded() -> None:
+    def play(seed: int) -> Tuple[int, List[List[int]]]:
+        game = TwentyFortyEight(competition=True, rng=np.random.default_rng(seed))
+        while not game.game_over:
+            # Often invalid, so the game picks a move instead
+            game.update(lambda grid: Action.LEFT)
+        return game.score, game.board.tolist()
+
+    np.random.seed(0)
+    first = play(5)
+    np.random.seed(1)
+    assert play(5) == first
+
+
+def test_packed_move_score() -> None:
+    # 2, 2, 4, 4 -> 4, 8 scores 4 + 8
+    board = pack_grid(np.array([[2, 2, 4, 4], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]))
+    moved, score = move_packed(board, Action.LEFT)
+    assert score == 12
+    assert np.all(unpack_grid(moved)[0] == [4, 8, 0, 0])
+
+
+def test_batch_matches_single_board() -> None:
+    rng = np.random.default_rng(0)
+    batch = BatchTwentyFortyEight(200, rng)
+    for _ in range(100):
+        grids, done, scores = batch.grids.copy(), batch.done.copy(), batch.scores.copy()
+        actions = random_actions(batch.possible_moves, rng)
+        batch.step(actions)
+        for grid, new_grid, action, was_done, score, new_score in zip(
+            grids, batch.grids, actions, done, scores, batch.scores
+        ):
+            if was_done:
+                assert np.all(new_grid == grid)
+                continue
+            expected = update_grid(grid, Action(action))
+            # Exactly one tile spawned on an empty square
+            assert np.sum(new_grid != expected) == 1
+            assert expected[new_grid != expected] == 0
+            assert new_score - score == move_packed(pack_grid(grid), Action(action))[1]
+
+
+def test_batch_possible_moves() -> None:
+    grid = np.zeros((4, 4), dtype=int)
+    grid[3] = [2, 4, 8, 16]
+    batch = BatchTwentyFortyEight.from_grid(grid, 3)
+    assert np.all(batch.possible_moves == [True, False, False, False])
+    assert get_possible_moves(grid) == [Action.UP]
+
+    batch.step(np.array([Action.DOWN.value] * 3))
+    assert np.all(batch.grids == grid)
+    assert not np.any(batch.done)
+
+
+def test_batch_spawn_distribution() -> None:
+    batch = BatchTwentyFortyEight(10000, np.random.default_rng(0))
+    tiles = batch.grids[batch.grids > 0]
+    assert len(tiles) == 3 * 10000
+    assert 0.08 < np.mean(tiles == 4) < 0.12
+
+
+def test_rollouts() -> None:
+    grid = np.zeros((4, 4), dtype=int)
+    grid[0] = [2, 2, 4, 8]
+    # Swiping left or right merges the 2's, then the 4's, then the 8's
+    assert np.all(rollout_scores(grid, 10, Action.LEFT, max_moves=0) == 4)
+    assert monte_carlo_action(grid, n_rollouts=50, max_moves=1) in [Action.LEFT, Action.RIGHT]
@@ -1,11 +1,21 @@
 import math
+import pickle
+from copy import copy
+from typing import List
 
 import pytest
 
 from delta_connect4.game_mechanics import choose_move_randomly as robot_choose_move
-from src.competition_controller import CompetitionController
+from src.competition_controller import (
+    CompetitionController,
+    merge_played_game,
+    play_game_to_completion,
+)
 from src.connect4.game import Connect4Game
-from src.team import Team
+from src.team import Outcome, Result, Team
+
+# The controller checks games against game_parent imported from src/ directly
+from game_parent import HeadToHeadGame  # isort:skip
 
 
 def test_imports():  # Placeholder
@@ -51,3 +61,111 @@ def test_competition_controller_run_all_games(num_teams: int):
         == len({entry.team_id for team_list in controller.ranking.values() for entry in team_list})
         <= num_teams  # <= because draws reduce the number of teams in the rankings
     )
+
+
+@pytest.mark.parametrize("num_teams", [5, 10, 17])
+def test_competition_controller_run_headless(num_teams: int):
+    controller = CompetitionController(
+        "Delta Academy Connect-4 Competition",
+        [Team(f"Player{str(n).zfill(num_teams)}", robot_choose_move) for n in range(num_teams)],
+        Connect4Game,
+        min_time_per_step=1,
+    )
+    ranking = controller.run_headless()
+
+    assert controller.competitions_over
+    assert all(game.completed for games in controller.rounds_of_games for game in games)
+    assert ranking
+    assert max(ranking.keys()) <= num_teams
+
+
+def test_competition_controller_run_headless_in_processes():
+    num_teams = 9
+    controller = CompetitionController(
+        "Delta Academy Connect-4 Competition",
+        [Team(f"Player{n}", robot_choose_move) for n in range(num_teams)],
+        Connect4Game,
+        n_processes=2,
+    )
+    ranking = controller.run_headless()
+
+    assert all(game.completed for games in controller.rounds_of_games for game in games)
+    assert all(team.results for team in controller.teams)
+    assert sum(len(teams) for teams in ranking.values()) <= num_teams
+
+
+def test_competition_controller_timing_report(tmp_path):
+    teams = [Team(f"Player{n}", robot_choose_move) for n in range(6)]
+    controller = CompetitionController(
+        "Delta Academy Connect-4 Competition", teams, Connect4Game, min_time_per_step=0
+    )
+    controller.run_headless()
+
+    report = controller.timing_report()
+    assert set(report["team"]) == {team.name for team in controller.teams}
+    assert all(summary["count"] > 0 for summary in report["team"].values())
+    assert report["controller"]["step"]["p50"] <= report["controller"]["step"]["max"]
+
+    controller.write_timing_report(tmp_path)
+    assert (tmp_path / "Connect_4_timings.json").exists()
+    assert (tmp_path / "Connect_4_timings.csv").exists()
+
+
+def test_competition_controller_seed_reproduces_tournament():
+    def run(seed: int):
+        controller = CompetitionController(
+            "Delta Academy Connect-4 Competition",
+            [Team(f"Player{n}", robot_choose_move) for n in range(7)],
+            Connect4Game,
+            seed=seed,
+        )
+        ranking = controller.run_headless()
+        draw = controller.competitions[0].original_draw_names
+        return draw, {rank: [team.name for team in teams] for rank, teams in ranking.items()}
+
+    assert run(1) == run(1)
+
+
+class OneMoveGame(HeadToHeadGame):
+    """team_a wins after one move each."""
+
+    NAME = "One Move"
+
+    def step(self) -> None:
+        for team, opponent, outcome in [
+            (self.team_a, self.team_b, Outcome.WIN),
+            (self.team_b, self.team_a, Outcome.LOSE),
+        ]:
+            team.move_times.append(0.5)
+            team.results.append(Result(None, outcome, self.name, opponent))
+        self.team_a_score = 1
+        self.complete()
+
+
+def play_in_workers(games: List[HeadToHeadGame]) -> None:
+    """Plays copies of the games as worker processes would, then merges them back."""
+    sent = [pickle.loads(pickle.dumps(game)) for game in games]
+    played = [pickle.loads(pickle.dumps(play_game_to_completion(game))) for game in sent]
+    for game, (played_game, _, team_updates) in zip(games, played):
+        merge_played_game(game, played_game, team_updates)
+
+
+def test_merge_played_games_sharing_teams():
+    team = Team("Player", robot_choose_move)
+    robot = Team("Robot", robot_choose_move)
+    robots = [copy(robot) for _ in range(3)]
+    # team plays twice in the round, and two copies of the robot (same team_id) play each other
+    play_in_workers(
+        [
+            OneMoveGame(team, robots[0], "Game 1"),
+            OneMoveGame(robots[1], robots[2], "Game 2"),
+            OneMoveGame(robots[0], team, "Game 3"),
+        ]
+    )
+
+    assert [result.outcome for result in team.results] == [Outcome.WIN, Outcome.LOSE]
+    assert all(result.opponent is robots[0] for result in team.results)
+    assert team.move_times == [0.5, 0.5]
+    # Copies of the robot share one list of results
+    assert len(robot.results) == 4
+    assert [result.opponent for result in robot.results].count(team) == 2
@@ -0,0 +1,61 @@
+from functools import partial
+
+import numpy as np
+
+from src.connect4.batch import BatchConnect4, evaluate, random_policy, vectorise
+from src.connect4.bitboard import BitBoard, choose_move_randomly
+
+
+def test_batch_matches_bitboard():
+    rng = np.random.default_rng(1)
+    env = BatchConnect4(64, rng=rng)
+    bitboards = [BitBoard() for _ in range(env.n_boards)]
+    for _ in range(500):
+        player_turn = env.player_turn.copy()
+        moves = random_policy(env.views, rng)
+        winners, done = env.step(moves)
+        for n, bitboard in enumerate(bitboards):
+            bitboard.place_piece(int(moves[n]), int(player_turn[n]))
+            won = bitboard.has_won(int(player_turn[n]))
+            assert winners[n] == (player_turn[n] if won else 0)
+            assert done[n] == (won or bitboard.is_full)
+            if done[n]:
+                bitboards[n] = BitBoard()
+                assert np.all(env.boards[n] == 0)
+            else:
+                assert np.array_equal(env.boards[n], bitboard.board)
+                assert env.player_turn[n] == -player_turn[n]
+
+
+def test_views():
+    env = BatchConnect4(2)
+    env.player_turn[:] = [1, -1]
+    env.step(np.array([0, 0]))
+    # Both boards have one piece belonging to the player who just moved
+    assert env.views[0, -1, 0] == -1
+    assert env.views[1, -1, 0] == -1
+
+
+def test_evaluate():
+    results = evaluate(random_policy, vectorise(choose_move_randomly), 1000, n_boards=128)
+    assert sum(results.values()) >= 1000
+    assert results["wins"] > 300 and results["losses"] > 300
+
+
+def test_evaluate_is_seeded():
+    def seeded_results():
+        rng = np.random.default_rng(3)
+        policy = partial(random_policy, rng=rng)
+        return evaluate(policy, policy, 200, n_boards=32, rng=rng)
+
+    assert seeded_results() == seeded_results()
+
+
+def test_evaluate_always_plays_column_zero():
+    # A policy that plays the same column wins going first against itself
+    def column_zero(boards: np.ndarray) -> np.ndarray:
+        legal = boards[:, 0] == 0
+        return np.argmax(legal, axis=1)
+
+    results = evaluate(column_zero, column_zero, 100, n_boards=10)
+    assert results["draws"] == 0
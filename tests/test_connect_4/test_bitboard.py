@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from src.connect4.bitboard import BitBoard, choose_move_randomly
+
+
+def has_four_in_a_row(board: np.ndarray, player: int) -> bool:
+    rows, cols = board.shape
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                end_row, end_col = row + 3 * d_row, col + 3 * d_col
+                if not (0 <= end_row < rows and 0 <= end_col < cols):
+                    continue
+                if all(board[row + n * d_row, col + n * d_col] == player for n in range(4)):
+                    return True
+    return False
+
+
+@pytest.mark.parametrize("rows, cols", [(6, 8), (6, 7), (4, 4)])
+def test_random_games_match_numpy(rows: int, cols: int):
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        bitboard = BitBoard(rows, cols)
+        board = np.zeros((rows, cols), dtype=int)
+        player = 1
+        while not bitboard.is_full:
+            col = int(rng.choice(bitboard.legal_moves))
+            row = bitboard.place_piece(col, player)
+            assert board[row, col] == 0 and (row == rows - 1 or board[row + 1, col] != 0)
+            board[row, col] = player
+
+            assert np.array_equal(bitboard.board, board)
+            assert np.array_equal(bitboard.view(-1), -board)
+            assert bitboard.has_won(player) == has_four_in_a_row(board, player)
+            assert bitboard.count(player) == np.sum(board == player)
+            if bitboard.has_won(player):
+                break
+            player *= -1
+
+
+def test_undo():
+    bitboard = BitBoard()
+    for col in [3, 3, 4, 0]:
+        bitboard.place_piece(col, 1 if bitboard.n_pieces % 2 == 0 else -1)
+    before = bitboard.copy()
+    bitboard.place_piece(3, 1)
+    bitboard.undo()
+    assert bitboard.pieces == before.pieces
+    assert bitboard.column_heights == before.column_heights
+    assert np.array_equal(bitboard.board, before.board)
+
+
+def test_from_array():
+    bitboard = BitBoard()
+    for col, player in [(0, 1), (0, -1), (5, 1), (7, -1), (0, 1)]:
+        bitboard.place_piece(col, player)
+    rebuilt = BitBoard.from_array(np.array(bitboard.board))
+    assert rebuilt.pieces == bitboard.pieces
+    assert rebuilt.column_heights == bitboard.column_heights
+
+
+def test_no_wrap_between_columns():
+    # 3 at the top of column 0 and 1 at the bottom of column 1 are adjacent bits without the
+    # empty bit on top of each column
+    bitboard = BitBoard()
+    for player in [-1, -1, -1, 1, 1, 1]:
+        bitboard.place_piece(0, player)
+    bitboard.place_piece(1, 1)
+    assert not bitboard.has_won(1)
+
+
+def test_board_is_read_only():
+    bitboard = BitBoard()
+    with pytest.raises(ValueError):
+        bitboard.board[0, 0] = 1
+
+
+def test_choose_move_randomly():
+    bitboard = BitBoard()
+    for _ in range(6):
+        bitboard.place_piece(2, 1)
+    for _ in range(50):
+        move = choose_move_randomly(bitboard.board)
+        assert move in bitboard.legal_moves
+
+
+def test_choose_move_randomly_is_seeded():
+    board = BitBoard().board
+    moves = [choose_move_randomly(board, np.random.default_rng(5)) for _ in range(2)]
+    assert moves[0] == moves[1]
@@ -78,3 +78,20 @@ def test_take_move_timeout_works() -> None:
     )
 
     game.step()
+
+
+def test_match_log_replays_game(tmp_path):
+    from src.match_log import MatchLogWriter, MatchReplay, read_match_log
+
+    game = Connect4Game(
+        Team("Robot 1", robot_choose_move),
+        Team("Robot 2", robot_choose_move),
+        "Test Match (not cricket)",
+    )
+    game.match_log = MatchLogWriter(tmp_path / "match.dlml", game.name, "Robot 1", "Robot 2")
+    for _ in range(5):
+        game.step()
+    game.match_log.flush()
+
+    replay = MatchReplay(read_match_log(tmp_path / "match.dlml"), Connect4Game)
+    assert np.array_equal(replay.board_at(0, 5), game.board)
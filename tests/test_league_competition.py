@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+
+from delta_connect4.game_mechanics import choose_move_randomly as robot_choose_move
+from src.competition_controller import CompetitionController
+from src.connect4.game import Connect4Game
+from src.regular_tictactoe.game import TicTacToeGame, choose_move_perfectly
+from src.round_robin_competition import RoundRobinCompetition
+from src.swiss_competition import SwissCompetition
+from src.team import Team
+
+
+def run_comp(comp):
+    while comp.winner is None:
+        while any(not game.completed for game in comp.live_games):
+            [game.step() for game in comp.live_games]
+        comp.complete_round()
+
+
+@pytest.mark.parametrize("num_teams", [2, 5, 8])
+def test_round_robin_everyone_plays_everyone(num_teams: int):
+    comp = RoundRobinCompetition(
+        [Team(f"Player_{num}", robot_choose_move) for num in range(num_teams)],
+        "Test League",
+        Connect4Game,
+    )
+    run_comp(comp)
+
+    matchups = {
+        frozenset([game.team_a.team_id, game.team_b.team_id])
+        for comp_round in comp.rounds
+        for game in comp_round.games
+    }
+    assert len(matchups) == num_teams * (num_teams - 1) // 2
+    assert sum(len(teams) for teams in comp.ranking.values()) == num_teams
+
+
+def test_round_robin_draws_keep_team_names():
+    # Perfect players draw every match
+    teams = [Team(f"Player_{num}", choose_move_perfectly) for num in range(4)]
+    comp = RoundRobinCompetition(teams, "Test League", TicTacToeGame)
+    run_comp(comp)
+
+    assert [team.name for team in teams] == [f"Player_{num}" for num in range(4)]
+    assert all(points == 1.5 for _, points in comp.standings)
+
+
+@pytest.mark.parametrize("num_teams", [3, 16, 33])
+def test_swiss_no_rematches(num_teams: int):
+    comp = SwissCompetition(
+        [Team(f"Player_{num}", robot_choose_move) for num in range(num_teams)],
+        "Test Swiss",
+        Connect4Game,
+        rng=np.random.default_rng(num_teams),
+    )
+    run_comp(comp)
+
+    assert len(comp.rounds) == math.ceil(math.log2(num_teams))
+    assert all(
+        len(opponents) == len(set(opponents)) for opponents in comp.opponents.values()
+    )
+    assert comp.winner == comp.standings[0][0]
+
+
+def test_swiss_backtracks_to_avoid_rematches():
+    teams = [Team(f"Player_{num}", robot_choose_move) for num in range(4)]
+    comp = SwissCompetition(teams, "Test Swiss", Connect4Game, rng=np.random.default_rng(0))
+    comp.opponents[teams[2].team_id].append(teams[3].team_id)
+    comp.opponents[teams[3].team_id].append(teams[2].team_id)
+
+    # Pairing the top two would leave a rematch at the bottom
+    assert comp.pair_without_rematches(teams) == [(teams[0], teams[2]), (teams[1], teams[3])]
+
+    for team in teams:
+        comp.opponents[team.team_id] = [other.team_id for other in teams if other is not team]
+    assert comp.pair_without_rematches(teams) is None
+    with pytest.warns(UserWarning, match="rematch"):
+        pairings, _ = comp.pair_round(2)
+    assert len(pairings) == 2
+
+
+def test_controller_runs_swiss():
+    controller = CompetitionController(
+        "Delta Academy Connect-4 Competition",
+        [Team(f"Player{n}", robot_choose_move) for n in range(10)],
+        Connect4Game,
+        competition_type=SwissCompetition,
+    )
+    ranking = controller.run_headless()
+    assert sum(len(teams) for teams in ranking.values()) == 10
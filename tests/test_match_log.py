@@ -0,0 +1,118 @@
+import pickle
+
+from src.competition_controller import CompetitionController
+from src.match_log import MatchLogWriter, MatchReplay, match_log_path, read_match_log
+from src.team import Team
+
+# The controller checks games against game_parent imported from src/ directly
+from game_parent import HeadToHeadGame  # isort:skip
+
+
+class CountingGame:
+    """Replays onto a list of (player, move) tuples."""
+
+    NAME = "Counting"
+
+    @classmethod
+    def replay_start(cls, first_player: int):
+        return []
+
+    @classmethod
+    def replay_move(cls, board, move, player: int):
+        return board + [(player, move)]
+
+
+def test_match_log_round_trip(tmp_path):
+    path = match_log_path(tmp_path, "Final of Cup: A vs B", 1, 0)
+    writer = MatchLogWriter(path, "Final of Cup: A vs B", "A", "B")
+    writer.write_move(1, 3, 0.5)
+    writer.write_move(-1, (2, 4), 0.25)
+    writer.write_move(1, None, 0.0)
+    writer.write_board_end(1, 0)
+    writer.write_move(-1, 7, 0.125)
+    writer.close()
+
+    log = read_match_log(path)
+    assert (log.match_name, log.team_a_name, log.team_b_name) == ("Final of Cup: A vs B", "A", "B")
+    assert len(log.boards) == 2
+    assert [m.move for m in log.boards[0].moves] == [3, (2, 4), None]
+    assert [m.duration for m in log.boards[0].moves] == [0.5, 0.25, 0.0]
+    assert (log.boards[0].team_a_score, log.boards[0].team_b_score) == (1, 0)
+    assert log.boards[1].first_player == -1
+    assert log.boards[1].team_a_score is None
+
+
+def test_match_log_survives_pickling(tmp_path):
+    path = tmp_path / "match.dlml"
+    writer = MatchLogWriter(path, "Match", "A", "B")
+    writer.write_move(1, 0, 0.1)
+    writer = pickle.loads(pickle.dumps(writer))
+    writer.write_move(-1, 1, 0.1)
+    writer.close()
+
+    assert [m.move for m in read_match_log(path).boards[0].moves] == [0, 1]
+
+
+def test_match_replay(tmp_path):
+    path = tmp_path / "match.dlml"
+    writer = MatchLogWriter(path, "Match", "A", "B")
+    for move in range(4):
+        writer.write_move(1 if move % 2 == 0 else -1, move, 0)
+    writer.close()
+
+    replay = MatchReplay(read_match_log(path), CountingGame)
+    assert replay.n_moves(0) == 4
+    assert replay.board_at(0, 0) == []
+    assert replay.board_at(0, 2) == [(1, 0), (-1, 1)]
+    assert replay.board_at(0, 4)[-1] == (-1, 3)
+
+
+def test_match_log_overwrites_an_old_log(tmp_path):
+    path = tmp_path / "match.dlml"
+    for moves in [[0, 1, 2], [5]]:
+        writer = MatchLogWriter(path, "Match", "A", "B")
+        for move in moves:
+            writer.write_move(1, move, 0)
+        writer.close()
+
+    assert [m.move for m in read_match_log(path).boards[0].moves] == [5]
+
+
+class CountingMatch(HeadToHeadGame):
+    """Each team plays its own number 3 times. Like most games, every match in a round has the
+    same name."""
+
+    NAME = "Counting"
+
+    def __init__(self, team_a, team_b, name, rng=None):
+        super().__init__(team_a, team_b, name, rng=rng)
+        self.board = []
+
+    def step(self) -> None:
+        move = self.next_to_play.choose_move()
+        self.log_move(move)
+        self.board = self.replay_move(self.board, move, self.player_turn)
+        self.player_turn *= -1
+        if len(self.board) == 6:
+            self.team_a_score = 1
+            self.log_board_end()
+            self.complete()
+
+    replay_start = CountingGame.replay_start
+    replay_move = CountingGame.replay_move
+
+
+def test_matches_in_a_round_get_their_own_logs(tmp_path):
+    teams = [Team(f"Team {n}", lambda n=n: n) for n in range(4)]
+    controller = CompetitionController(
+        "Counting", teams, CountingMatch, plate_enabled=False, seed=0, match_log_dir=tmp_path
+    )
+    controller.run_headless()
+
+    semi_finals = [game for game in controller.rounds_of_games[0] if game.match_log is not None]
+    assert len(semi_finals) == 2
+    assert semi_finals[0].name == semi_finals[1].name
+    for game in semi_finals:
+        log = read_match_log(game.match_log.path)
+        assert (log.team_a_name, log.team_b_name) == (game.team_a.name, game.team_b.name)
+        assert MatchReplay(log, CountingMatch).board_at(0, 6) == game.board
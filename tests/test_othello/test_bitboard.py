@@ -0,0 +1,87 @@
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from src.othello.bitboard import DIRECTIONS, BitBoard
+
+
+def starting_board(size: int) -> np.ndarray:
+    board = np.zeros((size, size))
+    low, high = size // 2 - 1, size // 2
+    board[low, low] = board[high, high] = 1
+    board[low, high] = board[high, low] = -1
+    return board
+
+
+def flipped_squares(board: np.ndarray, move: Tuple[int, int], player: int) -> List:
+    """Square by square reference for the discs a move flips."""
+    size = board.shape[0]
+    flips = []
+    for d_row, d_col in DIRECTIONS:
+        line = []
+        row, col = move[0] + d_row, move[1] + d_col
+        while 0 <= row < size and 0 <= col < size and board[row, col] == -player:
+            line.append((row, col))
+            row, col = row + d_row, col + d_col
+        if line and 0 <= row < size and 0 <= col < size and board[row, col] == player:
+            flips += line
+    return flips
+
+
+def reference_legal_moves(board: np.ndarray, player: int) -> List[Tuple[int, int]]:
+    return [
+        (row, col)
+        for row in range(board.shape[0])
+        for col in range(board.shape[1])
+        if board[row, col] == 0 and flipped_squares(board, (row, col), player)
+    ]
+
+
+@pytest.mark.parametrize("size", [4, 6, 8])
+def test_random_games_match_reference(size: int):
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        board = starting_board(size)
+        bitboard = BitBoard.from_array(board)
+        player = 1
+        while not bitboard.game_over:
+            legal = reference_legal_moves(board, player)
+            assert bitboard.legal_moves(player) == legal
+            if legal:
+                move = legal[rng.integers(len(legal))]
+                for square in flipped_squares(board, move, player) + [move]:
+                    board[square] = player
+                bitboard.make_move(player, move)
+            else:
+                bitboard.make_move(player, None)
+
+            assert np.array_equal(bitboard.board, board)
+            assert np.array_equal(bitboard.view(-1), -board)
+            assert bitboard.counts == {1: np.sum(board == 1), -1: np.sum(board == -1)}
+            player *= -1
+        assert not reference_legal_moves(board, 1) and not reference_legal_moves(board, -1)
+
+
+def test_no_wrap_between_rows():
+    # A line along row 0 must not carry on to the start of row 1
+    board = np.zeros((6, 6))
+    board[0, 4] = -1
+    board[0, 5] = -1
+    board[1, 0] = 1
+    bitboard = BitBoard.from_array(board)
+    assert (0, 3) not in bitboard.legal_moves(1)
+
+
+def test_illegal_move():
+    bitboard = BitBoard.from_array(starting_board(6))
+    with pytest.raises(AssertionError):
+        bitboard.make_move(1, (0, 0))
+
+
+def test_copy_is_independent():
+    bitboard = BitBoard.from_array(starting_board(6))
+    copied = bitboard.copy()
+    bitboard.make_move(1, bitboard.legal_moves(1)[0])
+    assert copied.counts == {1: 2, -1: 2}
+    assert np.array_equal(copied.board, starting_board(6))
@@ -0,0 +1,26 @@
+import random
+
+import numpy as np
+
+from src.pathfinder.game import PathfinderGame
+from src.team import Team
+
+
+def walk_backwards(board: np.ndarray, position) -> tuple:
+    # Off the board from the start, so the game picks a move instead
+    return 0, -1
+
+
+def test_game_is_seeded():
+    def play(seed: int):
+        game = PathfinderGame(
+            "Pathfinder", Team("Team", walk_backwards), np.random.default_rng(seed)
+        )
+        while not game.completed:
+            game.step()
+        return game.score, game.board.tolist()
+
+    random.seed(0)
+    first = play(2)
+    random.seed(1)
+    assert play(2) == first
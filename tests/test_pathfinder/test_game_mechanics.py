@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from src.pathfinder.competitor_code.game_mechanics import (
+    board_bank,
+    count_adjacent_1s,
+    generate_new_board,
+    random_board,
+)
+
+
+def check_path(board: np.ndarray) -> None:
+    """One path of 1's from the first column to the last that never touches itself."""
+    assert board[:, 0].sum() == board[:, -1].sum() == 1
+    assert board[0].sum() == 0
+    path = np.argwhere(board == 1)
+    n_neighbours = [count_adjacent_1s(board, square) for square in path]
+    # Both ends have one neighbour on the path and every other square has two
+    assert sorted(n_neighbours) == [1, 1] + [2] * (len(path) - 2)
+
+
+@pytest.mark.parametrize("shape", [(10, 10), (5, 5), (6, 12), (12, 6)])
+def test_generate_new_board(shape):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        board = generate_new_board(*shape, rng=rng)
+        assert board.shape == shape
+        check_path(board)
+
+
+def test_generate_new_board_is_seeded():
+    first = generate_new_board(rng=np.random.default_rng(3))
+    assert np.array_equal(first, generate_new_board(rng=np.random.default_rng(3)))
+
+
+def test_count_adjacent_1s():
+    board = np.zeros((3, 3))
+    board[0, 1] = board[1, 0] = board[2, 2] = 1
+    assert count_adjacent_1s(board, [0, 0]) == 2
+    assert count_adjacent_1s(board, [1, 1]) == 2
+    assert count_adjacent_1s(board, [2, 2]) == 0
+
+
+def test_random_board():
+    for board in board_bank():
+        check_path(board)
+    board = random_board(np.random.default_rng(0))
+    board[board == 1] = 2
+    assert np.array_equal(board_bank().max(axis=(1, 2)), np.ones(len(board_bank())))
@@ -0,0 +1,60 @@
+import pytest
+
+from src.knockout_competition import bracket_order
+from src.ratings import EloRatings, GaussianRatings, load_ratings
+
+
+def test_elo_update():
+    elo = EloRatings()
+    assert elo.expected_result("a", "b") == pytest.approx(0.5)
+    elo.update("a", "b", 1)
+    assert elo.rating("a") == pytest.approx(1516)
+    assert elo.rating("b") == pytest.approx(1484)
+    # Ratings are zero sum
+    elo.update("b", "c", 0.5)
+    assert sum(elo.ratings.values()) == pytest.approx(3 * 1500)
+
+
+def test_gaussian_update():
+    gaussian = GaussianRatings()
+    gaussian.update("a", "b", 1)
+    (mu_a, sigma_a), (mu_b, sigma_b) = gaussian.skill("a"), gaussian.skill("b")
+    assert mu_a > 25 > mu_b
+    assert sigma_a < 25 / 3 and sigma_b < 25 / 3
+    assert gaussian.ranked(["b", "a"]) == ["a", "b"]
+
+    # A draw against a weaker team counts against you
+    gaussian.update("a", "b", 0.5)
+    assert gaussian.skill("a")[0] < mu_a
+    assert gaussian.skill("b")[0] > mu_b
+
+
+@pytest.mark.parametrize("system", [EloRatings, GaussianRatings])
+def test_save_load(tmp_path, system):
+    path = tmp_path / "ratings.json"
+    ratings = system(path)
+    ratings.update("a", "b", 0)
+    ratings.save()
+
+    loaded = load_ratings(path)
+    assert type(loaded).__name__ == system.__name__
+    assert loaded.rating("a") == pytest.approx(ratings.rating("a"))
+    assert loaded.rating("b") == pytest.approx(ratings.rating("b"))
+
+
+def test_load_ratings_missing_file(tmp_path):
+    ratings = load_ratings(tmp_path / "ratings.json", GaussianRatings)
+    assert isinstance(ratings, GaussianRatings)
+    assert ratings.path == tmp_path / "ratings.json"
+
+
+@pytest.mark.parametrize("round_size", [1, 2, 4, 8, 16, 64])
+def test_bracket_order(round_size):
+    order = bracket_order(round_size)
+    assert sorted(order) == list(range(round_size))
+    # First round matchups always add up to the worst seed
+    for seed_a, seed_b in zip(order[::2], order[1::2]):
+        assert seed_a + seed_b == round_size - 1
+    # The top two seeds are in different halves
+    if round_size > 1:
+        assert 1 in order[round_size // 2 :]
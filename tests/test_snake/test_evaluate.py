@@ -0,0 +1,46 @@
+import random
+import sys
+
+from src.snake.competitor_code import Action
+from src.snake.evaluate import evaluate, load_solutions, play_headless, rank_solutions
+
+
+def turn_randomly(*_) -> Action:
+    return random.choice([Action.MOVE_FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT])
+
+
+def move_forward(*_) -> Action:
+    return Action.MOVE_FORWARD
+
+
+def test_play_headless_is_seeded():
+    assert play_headless(turn_randomly, 3) == play_headless(turn_randomly, 3)
+
+
+def test_evaluate():
+    evaluation = evaluate(turn_randomly, n_games=20, seed=1)
+    assert evaluation.scores.shape == evaluation.steps.shape == (20,)
+    assert (evaluation.scores >= 0).all() and (evaluation.steps > 0).all()
+    assert (evaluate(turn_randomly, n_games=20, seed=1).scores == evaluation.scores).all()
+
+
+def test_evaluate_in_processes_matches_serial():
+    serial = evaluate(turn_randomly, n_games=8, seed=2)
+    parallel = evaluate(turn_randomly, n_games=8, seed=2, n_processes=2)
+    assert (serial.scores == parallel.scores).all()
+    assert (serial.steps == parallel.steps).all()
+
+
+def test_rank_solutions():
+    ranking = rank_solutions({"forward": move_forward, "random": turn_randomly}, n_games=10)
+    assert {evaluation.name for evaluation in ranking} == {"forward", "random"}
+    assert ranking[0].summary()["mean_score"] >= ranking[1].summary()["mean_score"]
+
+
+def test_load_solutions_includes_examples():
+    previous_game_mechanics = sys.modules.get("game_mechanics")
+    solutions = load_solutions()
+    assert {"Robot", "a_star_solution", "alex_sude_solution", "henry_solution"} <= set(solutions)
+    assert sys.modules.get("game_mechanics") is previous_game_mechanics
+    evaluation = evaluate(solutions["henry_solution"], n_games=2)
+    assert evaluation.scores.shape == (2,)
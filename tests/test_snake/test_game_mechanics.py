@@ -0,0 +1,39 @@
+import random
+
+from src.snake.competitor_code import ARENA_HEIGHT, ARENA_WIDTH, Action, Orientation, Snake
+
+
+def test_snake_positions_is_a_copy():
+    snake = Snake(seed=0)
+    positions = snake.snake_positions
+    positions.append((0, 0))
+    assert snake.snake_length == 2
+    assert snake.snake_positions == [snake.snake_head] + snake.snake_body
+
+
+def test_has_hit_self():
+    snake = Snake(seed=0)
+    # Head at (5, 5) about to turn back into its own body
+    snake.snake_positions = [(5, 5), (5, 4), (4, 4), (4, 5), (4, 6)]
+    snake.snake_direction = Orientation.NORTH
+    snake.food_position = (0, 0)
+    assert not snake.has_hit_self()
+    snake.update(lambda *_: Action.TURN_LEFT)
+    assert snake.snake_head == (4, 5)
+    assert snake.has_hit_self()
+    assert not snake.snake_alive
+
+
+def test_free_squares_tracked():
+    rng = random.Random(0)
+    for seed in range(10):
+        snake = Snake(seed=seed)
+        while snake.snake_alive:
+            snake.update(lambda *_: rng.choice(list(Action)))
+            positions = snake.snake_positions
+            if not snake.snake_alive:
+                break
+            assert snake.food_position not in positions
+            free = set(snake._free_squares)
+            assert len(free) == ARENA_WIDTH * ARENA_HEIGHT - len(set(positions))
+            assert not free & set(positions)
@@ -0,0 +1,22 @@
+from copy import copy
+
+import numpy as np
+
+from src.stick_pile.game import StickPileGame
+
+
+class HarderStickPileGame(StickPileGame):
+    TAKES = (1, 3, 4)
+
+
+def test_robot_uses_the_game_takes():
+    game = HarderStickPileGame(
+        copy(HarderStickPileGame.ROBOT_PLAYER),
+        HarderStickPileGame.perfect_player(),
+        "Robot v Perfect Robot",
+        rng=np.random.default_rng(0),
+    )
+    while not game.completed:
+        game.step()
+        # 1 is always allowed, so nobody should ever make an invalid move
+        assert not game.invalid_move
@@ -0,0 +1,82 @@
+from functools import lru_cache, partial
+
+import numpy as np
+import pytest
+
+from src.stick_pile.solver import (
+    StickPileTable,
+    choose_move_perfectly,
+    choose_move_randomly,
+    get_table,
+    play_match,
+    play_matches,
+)
+
+
+def take_one(number_of_sticks_remaining: int) -> int:
+    return 1
+
+
+@pytest.mark.parametrize("takes", [(1, 2, 3), (1, 3, 4), (2, 5), (3,)])
+def test_table_matches_search(takes):
+    @lru_cache(maxsize=None)
+    def is_win(n_sticks: int) -> bool:
+        return any(not is_win(n_sticks - take) for take in takes if take <= n_sticks)
+
+    table = StickPileTable(takes, max_sticks=30)
+    assert [table.is_win(n_sticks) for n_sticks in range(80)] == [is_win(n) for n in range(80)]
+    for n_sticks in range(80):
+        if is_win(n_sticks):
+            assert not is_win(n_sticks - table.best_take(n_sticks))
+
+
+def test_losing_piles_are_multiples_of_4():
+    table = get_table()
+    assert [n_sticks for n_sticks in range(30) if not table.is_win(n_sticks)] == list(
+        range(0, 30, 4)
+    )
+
+
+def test_is_valid():
+    table = get_table()
+    assert table.is_valid(5, 3)
+    assert not table.is_valid(2, 3)
+    assert not table.is_valid(5, 4)
+    assert not table.is_valid(5, 0)
+    assert not table.is_valid(5, None)
+    assert not table.is_valid(5, 2.0)
+
+
+def test_play_match():
+    # 8 is a losing pile for whoever moves first
+    assert play_match(choose_move_perfectly, choose_move_perfectly, 8) == -1
+    assert play_match(choose_move_perfectly, choose_move_perfectly, 9) == 1
+    assert play_match(lambda number_of_sticks_remaining: 4, take_one, 9) == -1
+    # Nobody can take 2 sticks from 1, so the player to move loses
+    assert play_match(take_one, take_one, 3, takes=(2,)) == -1
+
+
+def test_play_matches():
+    results = play_matches(choose_move_perfectly, take_one, 200, rng=np.random.default_rng(0))
+    # Taking 1 every time is the right move at most once a game, which isn't enough
+    assert results == {"wins": 200, "losses": 0}
+
+
+def test_choose_move_perfectly_with_other_takes():
+    takes = (1, 3, 4)
+    perfect = partial(choose_move_perfectly, takes=takes)
+    # 7 is a losing pile with these takes, so the player to move loses against perfect play
+    assert not get_table(takes).is_win(7)
+    assert play_match(take_one, perfect, 7, takes=takes) == -1
+    assert get_table(takes).is_valid(9, perfect(number_of_sticks_remaining=9))
+
+
+def test_choose_move_randomly_with_other_takes():
+    takes = (2, 5)
+    rng = np.random.default_rng(0)
+    for n_sticks in range(30):
+        take = choose_move_randomly(n_sticks, takes=takes, rng=rng)
+        if n_sticks < 2:
+            assert take is None
+        else:
+            assert get_table(takes).is_valid(n_sticks, take)
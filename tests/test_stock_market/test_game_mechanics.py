@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from src.stock_market.competitor_code.game_mechanics import (
+    StockMarket,
+    TradingGame,
+    forecast_windows,
+    load_stock_price,
+    network_forecasts,
+    predict_forecasts,
+    trading_money,
+)
+
+
+def test_forecast_windows():
+    prices = np.arange(20.0)
+    windows, next_prices = forecast_windows(prices, 3)
+    assert windows.tolist() == [[12, 13, 14, 15, 16], [13, 14, 15, 16, 17], [14, 15, 16, 17, 18]]
+    assert next_prices.tolist() == [17, 18, 19]
+
+    batch_windows, batch_next_prices = forecast_windows(np.stack([prices, 2 * prices]), 3)
+    assert batch_windows.shape == (2, 3, 5)
+    assert np.array_equal(batch_windows[1], 2 * windows)
+    assert np.array_equal(batch_next_prices[1], 2 * next_prices)
+
+
+def test_trading_money_matches_trading_game():
+    prices = load_stock_price("test")
+    windows, next_prices = forecast_windows(prices, 100)
+    forecasts = windows[:, -1] + np.random.default_rng(0).normal(scale=3, size=100)
+    # A forecast of no change takes no position
+    forecasts[0] = windows[0, -1]
+
+    trading_game = TradingGame(prices[-101], verbose=False)
+    for forecast, window, next_price in zip(forecasts, windows, next_prices):
+        trading_game.open_position(forecast, window[-1])
+        trading_game.close_position(window[-1], next_price)
+
+    assert np.isclose(trading_money(forecasts, windows, next_prices), trading_game.current_money)
+
+
+def test_stock_market_runs_out_of_forecasts():
+    market = StockMarket("Team", 1, number_of_forecasts=3)
+    for _ in range(3):
+        market.update(lambda window: float(window[0, -1]))
+    with pytest.raises(AssertionError, match="forecasts have been made"):
+        market.update(lambda window: float(window[0, -1]))
+
+
+def test_predict_forecasts_rejects_what_the_live_game_rejects():
+    windows, _ = forecast_windows(load_stock_price("test"), 10)
+    forecasts = predict_forecasts(lambda window: 1, windows)
+    # An int isn't a float, so each forecast is a random day's price instead
+    assert all(forecast in window for forecast, window in zip(forecasts, windows))
+
+
+def test_network_forecasts_match_predict_forecasts():
+    torch.manual_seed(0)
+    network = nn.Linear(5, 1)
+    windows, _ = forecast_windows(np.stack([load_stock_price("test")] * 2), 10)
+
+    def predict_price(window: torch.Tensor) -> float:
+        with torch.no_grad():
+            return network(window).item()
+
+    assert np.allclose(
+        network_forecasts(network, windows), predict_forecasts(predict_price, windows), rtol=1e-5
+    )
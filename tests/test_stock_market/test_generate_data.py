@@ -0,0 +1,31 @@
+import numpy as np
+
+from src.stock_market.competitor_code.generate_data import (
+    AR_PHI,
+    generate_stock_prices,
+    save_scenario_bank,
+)
+
+
+def test_generate_stock_prices():
+    prices = generate_stock_prices(8, length=100, rng=np.random.default_rng(0))
+    assert prices.shape == (8, len(AR_PHI) + 100)
+    assert np.allclose(prices.min(axis=1), 10)
+    assert not np.allclose(prices[0], prices[1])
+
+
+def test_generate_stock_prices_is_ar():
+    prices = generate_stock_prices(4, sigma=0, length=50, rng=np.random.default_rng(0))
+    n_params = len(AR_PHI)
+    for series in prices:
+        windows = np.lib.stride_tricks.sliding_window_view(series[:-1], n_params)
+        # Shifting the minimum to 10 adds the same constant to every step of the recursion
+        residuals = series[n_params:] - windows @ np.array(AR_PHI[::-1])
+        assert np.allclose(residuals, residuals[0])
+
+
+def test_save_scenario_bank(tmp_path):
+    path = tmp_path / "scenarios.npy"
+    save_scenario_bank(path, n_scenarios=3, length=20, seed=1)
+    expected = generate_stock_prices(3, length=20, rng=np.random.default_rng(1))
+    assert np.array_equal(np.load(path), expected)
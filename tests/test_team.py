@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from src.team import Team
+
+# team.py imports timeout from src/ directly, so its exception is this class
+from timeout import TimeoutException  # isort:skip
+
+
+def add_one(number: int) -> int:
+    return number + 1
+
+
+def hang(number: int) -> int:
+    time.sleep(10)
+    return number
+
+
+def raise_error(number: int) -> int:
+    raise ValueError("Bad move")
+
+
+def test_worker_process_choose_move():
+    team = Team("Worker", add_one, use_worker_process=True)
+    try:
+        assert team.choose_move(number=1) == 2
+        assert team.choose_move(number=2) == 3
+    finally:
+        team.close()
+
+
+def test_worker_process_sub_second_timeout():
+    team = Team("Slow", hang, use_worker_process=True)
+    team.timeout = 0.2
+    try:
+        start = time.time()
+        with pytest.raises(TimeoutException):
+            team.choose_move(number=1)
+        assert time.time() - start < 2
+    finally:
+        team.close()
+
+
+def test_worker_process_restarts_after_timeout():
+    team = Team("Slow", hang, use_worker_process=True)
+    team.timeout = 0.2
+    try:
+        with pytest.raises(TimeoutException):
+            team.choose_move(number=1)
+        assert team._worker is not None and team._worker.is_alive
+    finally:
+        team.close()
+
+
+def test_worker_process_raises_competitor_error():
+    team = Team("Buggy", raise_error, use_worker_process=True)
+    try:
+        with pytest.raises(ValueError):
+            team.choose_move(number=1)
+        # Worker survives the competitor's exception
+        with pytest.raises(ValueError):
+            team.choose_move(number=1)
+    finally:
+        team.close()
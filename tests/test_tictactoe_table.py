@@ -0,0 +1,96 @@
+from enum import Enum
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from src import tictactoe_table
+from src.tictactoe_table import (
+    LINES,
+    best_moves,
+    best_wild_moves,
+    board_code,
+    is_full,
+    legal_moves,
+    place,
+    value,
+    winner,
+)
+
+
+@pytest.fixture(autouse=True)
+def table_in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(tictactoe_table, "TABLE_PATH", tmp_path / "table.npy")
+    monkeypatch.setattr(tictactoe_table, "_TABLE", None)
+
+
+def line_winner(board: Tuple[int, ...]) -> int:
+    for a, b, c in LINES:
+        if board[a] != 0 and board[a] == board[b] == board[c]:
+            return board[a]
+    return 0
+
+
+@lru_cache(maxsize=None)
+def regular_value(board: Tuple[int, ...], counter: int) -> int:
+    if line_winner(board) or all(board):
+        return -1 if line_winner(board) else 0
+    return max(
+        -regular_value(board[:n] + (counter,) + board[n + 1 :], -counter)
+        for n in range(9)
+        if board[n] == 0
+    )
+
+
+@lru_cache(maxsize=None)
+def wild_value(board: Tuple[int, ...]) -> int:
+    if line_winner(board) or all(board):
+        return -1 if line_winner(board) else 0
+    return max(
+        -wild_value(board[:n] + (counter,) + board[n + 1 :])
+        for n in range(9)
+        if board[n] == 0
+        for counter in [1, -1]
+    )
+
+
+def test_table_matches_search():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        board = tuple(int(square) for square in rng.choice([0, 0, 1, -1], 9))
+        code = board_code(board)
+        assert (winner(code) != 0) == (line_winner(board) != 0)
+        assert is_full(code) == all(board)
+        assert legal_moves(code) == [n for n in range(9) if board[n] == 0]
+        assert value(code, 1) == regular_value(board, 1)
+        assert value(code, -1) == regular_value(board, -1)
+        assert value(code) == wild_value(board)
+
+
+def test_empty_board_values():
+    # Regular tic-tac-toe is a draw, the first player wins wild tic-tac-toe
+    assert value(0, 1) == value(0, -1) == 0
+    assert value(0) == 1
+    assert set(best_moves(0, 1)) == set(range(9))
+    assert best_wild_moves(0) == [(4, 1), (4, -1)]
+
+
+def test_board_code_formats():
+    class Cell(Enum):
+        EMPTY = " "
+        X = "X"
+        O = "O"
+
+    ints = [1, 0, -1, 0, 0, 0, 0, 0, 1]
+    strings = ["X", " ", "O", " ", " ", " ", " ", " ", "X"]
+    cells = [Cell(square) for square in strings]
+    assert board_code(ints) == board_code(strings) == board_code(cells)
+    assert board_code(ints) == place(place(place(0, 0, 1), 2, -1), 8, 1)
+
+
+def test_table_saved_and_memory_mapped():
+    table = tictactoe_table.get_table()
+    assert tictactoe_table.TABLE_PATH.exists()
+    assert not table.flags.writeable
+    assert np.array_equal(table, tictactoe_table.build_table())
@@ -0,0 +1,40 @@
+from src.wordle.competitor_code.tile_colors import remaining_words
+from src.wordle.evaluate import evaluate, play_headless
+
+
+def first_remaining_word(previous_guesses):
+    return remaining_words(previous_guesses)[0]
+
+
+def always_invalid(previous_guesses):
+    return "zzzzz"
+
+
+def test_play_headless():
+    assert play_headless(first_remaining_word, "cigar") == (1, True)
+    n_guesses, solved = play_headless(first_remaining_word, "tears")
+    assert solved and 1 < n_guesses <= 6
+    # Invalid guesses are replaced with random words
+    assert play_headless(always_invalid, "tears", seed=3) == play_headless(
+        always_invalid, "tears", seed=3
+    )
+
+
+def test_evaluate():
+    answers = ["which", "their", "cigar", "tears", "fanny"]
+    evaluation = evaluate(first_remaining_word, answers)
+    assert evaluation.n_guesses.shape == (5,)
+    assert evaluation.failure_rate == 0
+    assert 1 <= evaluation.average_guesses <= 6
+    worst_word, worst_n_guesses = evaluation.worst_words(1)[0]
+    assert worst_n_guesses == evaluation.n_guesses.max()
+
+    parallel = evaluate(first_remaining_word, answers, n_processes=2)
+    assert (parallel.n_guesses == evaluation.n_guesses).all()
+
+
+def test_failures_are_worst():
+    evaluation = evaluate(always_invalid, ["which", "their", "cigar"])
+    assert evaluation.failure_rate > 0
+    word, n_guesses = evaluation.worst_words(1)[0]
+    assert not evaluation.solved[evaluation.answers.index(word)]
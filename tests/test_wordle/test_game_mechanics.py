@@ -0,0 +1,34 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.wordle.competitor_code import game_mechanics
+from src.wordle.competitor_code.game_mechanics import possible_words, weighted_random_word
+
+
+@pytest.fixture
+def frequencies(tmp_path, monkeypatch):
+    freq = {word: rank + 1 for rank, word in enumerate(possible_words)}
+    path = tmp_path / "word_use_frequency.pkl"
+    with open(path, "wb") as f:
+        pickle.dump(freq, f)
+    monkeypatch.setattr(game_mechanics, "FREQUENCY_PATH", str(path))
+    monkeypatch.setattr(game_mechanics, "_frequencies", None)
+    monkeypatch.setattr(game_mechanics, "_cdfs", {})
+    return freq
+
+
+def test_weighted_random_word_matches_choice(frequencies):
+    weights = np.array([1 / frequencies[word] for word in possible_words])
+    weights = weights / np.sum(weights)
+    for seed in range(50):
+        expected = np.random.default_rng(seed).choice(possible_words, p=weights)
+        assert weighted_random_word(np.random.default_rng(seed)) == expected
+
+
+def test_weights_loaded_once(frequencies, monkeypatch):
+    weighted_random_word(np.random.default_rng(0))
+    monkeypatch.setattr(game_mechanics, "FREQUENCY_PATH", "missing.pkl")
+    assert weighted_random_word(np.random.default_rng(1)) in possible_words
+    assert game_mechanics.word_cdf()[-1] == pytest.approx(1)
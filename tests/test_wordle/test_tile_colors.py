@@ -0,0 +1,56 @@
+from collections import Counter
+
+import numpy as np
+
+from src.wordle.competitor_code.tile_colors import (
+    ALL_GREEN,
+    WORD_INDEX,
+    WORDS,
+    build_table,
+    colors,
+    filter_candidates,
+    pattern,
+    remaining_words,
+    tile_colors,
+)
+
+
+def count_tile_colors(answer: str, guess: str):
+    result = [2 if a == g else 0 for a, g in zip(answer, guess)]
+    spare = Counter(a for a, g in zip(answer, guess) if a != g)
+    for position, letter in enumerate(guess):
+        if result[position] == 0 and spare[letter] > 0:
+            result[position] = 1
+            spare[letter] -= 1
+    return result
+
+
+def test_pattern_round_trip():
+    assert pattern([2, 2, 2, 2, 2]) == ALL_GREEN
+    for code in range(ALL_GREEN + 1):
+        assert pattern(colors(code)) == code
+
+
+def test_tile_colors():
+    assert tile_colors("scram", "parse") == [0, 1, 2, 1, 0]
+    # Only as many yellows as there are spare e's in the answer
+    assert tile_colors("eerie", "geese") == [0, 2, 1, 0, 2]
+    assert tile_colors("llama", "label") == [2, 1, 0, 0, 1]
+
+
+def test_table_matches_counting_letters():
+    table = build_table()
+    rng = np.random.default_rng(0)
+    for guess, answer in rng.integers(len(WORDS), size=(2000, 2)):
+        assert colors(table[guess, answer]) == count_tile_colors(WORDS[answer], WORDS[guess])
+
+
+def test_filter_candidates():
+    answer = "which"
+    candidates = np.arange(len(WORDS))
+    remaining = filter_candidates(candidates, "crane", tile_colors(answer, "crane"))
+    assert WORD_INDEX[answer] in remaining
+    assert all(
+        tile_colors(WORDS[index], "crane") == tile_colors(answer, "crane") for index in remaining
+    )
+    assert remaining_words({"crane": tile_colors(answer, "crane"), answer: [2] * 5}) == [answer]